@@ -0,0 +1,131 @@
+"""Synthetic projects for the benchmark suite.
+
+Each size scales the inputs the hot paths iterate over: files at the
+project root, CLAUDE.md length, open/done tasks in the active context and
+the number of contract criteria.
+"""
+
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from atlas_session.common.config import GOVERNANCE_SECTIONS
+from atlas_session.contract.model import Contract, Criterion, CriterionType
+
+TEMPLATES = Path(__file__).parent.parent / "templates"
+
+
+@dataclass(frozen=True)
+class Size:
+    root_files: int
+    claude_md_sections: int
+    tasks: int
+    criteria: int
+
+
+SIZES = {
+    "small": Size(root_files=10, claude_md_sections=5, tasks=10, criteria=5),
+    "medium": Size(root_files=200, claude_md_sections=50, tasks=200, criteria=50),
+    "large": Size(root_files=2000, claude_md_sections=400, tasks=2000, criteria=200),
+}
+
+# Root file names cycled through; most are clutter candidates
+_ROOT_NAMES = (
+    "notes-{}.md",
+    "deploy-{}.sh",
+    "config-{}.json",
+    "debug-{}.log",
+    "util-{}.py",
+)
+
+
+def make_project(root: Path, size: Size) -> Path:
+    """Populate root with a git-tracked project of the given size."""
+    sd = root / "session-context"
+    sd.mkdir(parents=True)
+    for template in TEMPLATES.glob("CLAUDE-*.md"):
+        shutil.copy(template, sd / template.name)
+    (sd / "CLAUDE-soul-purpose.md").write_text(
+        "# Soul Purpose\n\nShip the benchmark suite\n"
+    )
+
+    tasks = [
+        f"- [{'x' if i % 3 == 0 else ' '}] Task {i}: refactor module {i}"
+        for i in range(size.tasks)
+    ]
+    (sd / "CLAUDE-activeContext.md").write_text(
+        "# Active Context\n\n## Current Tasks\n\n" + "\n".join(tasks) + "\n"
+    )
+
+    sections = [body.rstrip() for body in GOVERNANCE_SECTIONS.values()]
+    for i in range(size.claude_md_sections):
+        lines = "\n".join(f"- Guideline {i}.{j}" for j in range(10))
+        sections.append(f"## Section {i}\n\n{lines}")
+    (root / "CLAUDE.md").write_text("# CLAUDE.md\n\n" + "\n\n".join(sections) + "\n")
+
+    (root / "README.md").write_text("# Bench project\n")
+    (root / "pyproject.toml").write_text("[project]\nname = 'bench'\n")
+    (root / "src").mkdir()
+    for i in range(size.root_files):
+        name = _ROOT_NAMES[i % len(_ROOT_NAMES)].format(i)
+        (root / name).write_text(f"# {name}\nTODO: file {i}\n")
+
+    git = ["git", "-c", "user.name=Bench", "-c", "user.email=bench@example.com"]
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], cwd=root, check=True)
+    return root
+
+
+def make_contract(size: Size) -> Contract:
+    """A contract mixing in-process checks with a few shell commands."""
+    kinds = [
+        {
+            "type": CriterionType.FILE_EXISTS,
+            "path": "session-context/CLAUDE-activeContext.md",
+            "pass_when": "not_empty",
+        },
+        {
+            "type": CriterionType.CONTEXT_CHECK,
+            "field": "open_tasks",
+            "pass_when": "> 0",
+        },
+        {"type": CriterionType.GLOB_COUNT, "path": "*.md", "pass_when": "> 0"},
+        {
+            "type": CriterionType.FILE_CONTAINS,
+            "path": "*.py",
+            "pattern": "TODO",
+            "pass_when": ">= 0",
+        },
+        {"type": CriterionType.GIT_REF, "pass_when": "not_empty"},
+    ]
+    criteria = [
+        Criterion(name=f"c{i}", **kinds[i % len(kinds)]) for i in range(size.criteria)
+    ]
+    criteria += [
+        Criterion(
+            name=f"shell{i}",
+            type=CriterionType.SHELL,
+            command="true",
+            pass_when="exit_code == 0",
+        )
+        for i in range(2)
+    ]
+    return Contract(soul_purpose="Bench", escrow=10, criteria=criteria)
+
+
+@pytest.fixture(scope="module", params=list(SIZES))
+def sized_project(request, tmp_path_factory):
+    """(project_dir, Size) for each size, built once per module."""
+    size = SIZES[request.param]
+    root = make_project(tmp_path_factory.mktemp(request.param), size)
+    return str(root), size
+
+
+@pytest.fixture
+def sized_contract(sized_project):
+    """A fresh contract scaled to the current project size."""
+    return make_contract(sized_project[1])
@@ -0,0 +1,27 @@
+"""Contract verification: run_tests over contracts of increasing size."""
+
+import asyncio
+
+from atlas_session.contract.verifier import run_tests, run_tests_async
+
+
+def test_run_tests(benchmark, sized_project, sized_contract):
+    project_dir, _ = sized_project
+    result = benchmark(run_tests, project_dir, sized_contract)
+    assert result["all_passed"] is True
+
+
+def test_run_tests_async(benchmark, sized_project, sized_contract):
+    project_dir, _ = sized_project
+    result = benchmark(
+        lambda: asyncio.run(run_tests_async(project_dir, sized_contract))
+    )
+    assert result["all_passed"] is True
+
+
+def test_run_tests_fail_fast(benchmark, sized_project, sized_contract):
+    """A cheap failing check short-circuits the rest of the contract."""
+    project_dir, _ = sized_project
+    sized_contract.criteria[0].path = "missing.md"
+    result = benchmark(run_tests, project_dir, sized_contract, fail_fast=True)
+    assert result["short_circuited"] is True
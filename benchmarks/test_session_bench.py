@@ -0,0 +1,84 @@
+"""Session hot paths: start, context reads, clutter scan, CLAUDE.md refresh."""
+
+from pathlib import Path
+
+import pytest
+
+from atlas_session.common.state import doc_cache
+from atlas_session.session import operations
+from atlas_session.session.operations import (
+    check_clutter,
+    read_context,
+    refresh_claude_md,
+    start_composite,
+)
+
+
+def test_start_composite(benchmark, sized_project):
+    project_dir, _ = sized_project
+    result = benchmark(start_composite, project_dir)
+    assert result["preflight"]["mode"] == "reconcile"
+
+
+def test_read_context_warm(benchmark, sized_project):
+    """Repeated reads of unchanged files (parsed documents cached)."""
+    project_dir, size = sized_project
+    result = benchmark(read_context, project_dir)
+    assert len(result["open_tasks"]) + len(result["recent_progress"]) == size.tasks
+
+
+def _clear_caches():
+    doc_cache.clear()
+    operations._task_indexes.clear()
+
+
+def test_read_context_cold(benchmark, sized_project):
+    """First read after startup: every document parsed from disk."""
+    project_dir, _ = sized_project
+    benchmark.pedantic(
+        read_context, args=(project_dir,), setup=_clear_caches, rounds=20
+    )
+
+
+@pytest.mark.parametrize("indexed", [True, False], ids=["indexed", "full-scan"])
+def test_read_context_after_append(benchmark, sized_project, indexed):
+    """A read after each appended task; the index parses only the new line."""
+    project_dir, _ = sized_project
+    ac = Path(project_dir) / "session-context" / "CLAUDE-activeContext.md"
+    original = ac.read_bytes()
+    read_context(project_dir)
+
+    def append():
+        if not indexed:
+            operations._task_indexes.clear()
+        with open(ac, "a") as f:
+            f.write("- [ ] Appended task\n")
+
+    try:
+        result = benchmark.pedantic(
+            read_context, args=(project_dir,), setup=append, rounds=50
+        )
+        assert result["open_tasks"][-1] == "[ ] Appended task"
+    finally:
+        ac.write_bytes(original)
+
+
+def test_check_clutter(benchmark, sized_project):
+    project_dir, size = sized_project
+    result = benchmark(check_clutter, project_dir)
+    assert result["clutter_count"] > 0 or size.root_files == 0
+
+
+def test_refresh_claude_md(benchmark, sized_project):
+    """Each round regenerates the full-size CLAUDE.md."""
+    project_dir, _ = sized_project
+    claude_md = Path(project_dir) / "CLAUDE.md"
+    original = claude_md.read_text()
+
+    def restore():
+        claude_md.write_text(original)
+
+    result = benchmark.pedantic(
+        refresh_claude_md, args=(project_dir,), setup=restore, rounds=20
+    )
+    assert result["status"] == "ok"
@@ -1,7 +1,6 @@
 """Configuration from environment variables and defaults."""
 
 import os
-import tempfile
 from pathlib import Path
 
 # Template resolution: plugin bundled templates > home dir fallback
@@ -13,19 +12,48 @@ TEMPLATE_DIR = _plugin_templates if _plugin_templates.is_dir() else _home_templa
 
 SESSION_DIR_NAME = "session-context"
 CLAUDE_MD_NAME = "CLAUDE.md"
-# SECURITY: Use secure tempfile with random name to prevent symlink attacks
-_governance_cache = tempfile.NamedTemporaryFile(
-    mode="w",
-    prefix="claude-governance-",
-    suffix=".json",
-    delete=False,
-)
-_governance_cache.close()
-GOVERNANCE_CACHE_PATH = Path(_governance_cache.name)
+# Parsed session-context/CLAUDE.md documents kept in memory (LRU entries)
+DOC_CACHE_SIZE = int(os.environ.get("ATLAS_DOC_CACHE_SIZE", "256"))
+# Atomic writes: also fsync each file before its rename (directories are
+# always fsynced once per commit)
+WRITE_DURABLE = os.environ.get("ATLAS_DURABLE_WRITES", "").lower() in ("1", "true", "yes")
+# Governance cache: kept in memory per project; entries older than the TTL
+# (abandoned /init flows) are dropped. With spill on, each project's cache is
+# also written to session-context/ so another server process can restore it.
+GOVERNANCE_CACHE_TTL = float(os.environ.get("ATLAS_GOVERNANCE_CACHE_TTL", "86400"))
+GOVERNANCE_SPILL = os.environ.get("ATLAS_GOVERNANCE_SPILL", "1").lower() in ("1", "true", "yes")
 LIFECYCLE_STATE_FILENAME = ".lifecycle-active.json"
 
 ATLASCOIN_URL = os.environ.get("ATLASCOIN_URL", "http://localhost:3000")
 
+# AtlasCoin connection pool (shared httpx client, see contract/atlascoin.py)
+ATLASCOIN_MAX_CONNECTIONS = int(os.environ.get("ATLASCOIN_MAX_CONNECTIONS", "10"))
+ATLASCOIN_MAX_KEEPALIVE = int(os.environ.get("ATLASCOIN_MAX_KEEPALIVE", "5"))
+ATLASCOIN_KEEPALIVE_EXPIRY = float(os.environ.get("ATLASCOIN_KEEPALIVE_EXPIRY", "30"))
+ATLASCOIN_HTTP2 = os.environ.get("ATLASCOIN_HTTP2", "").lower() in ("1", "true", "yes")
+
+# Contract verification: how many criteria run_tests may execute at once.
+# 1 keeps declaration order, which existing contracts may rely on (a build
+# criterion followed by a check of its output); raise it to opt in.
+CONTRACT_MAX_WORKERS = int(os.environ.get("ATLAS_CONTRACT_WORKERS", "1"))
+
+# Per-project locks: seconds a mutating operation waits for another holder
+LOCK_TIMEOUT = float(os.environ.get("ATLAS_LOCK_TIMEOUT", "30"))
+# ...capped for synchronous waits on the event loop thread, which stall every
+# other tool (including the async holder being waited for) until they end
+LOCK_LOOP_TIMEOUT = float(os.environ.get("ATLAS_LOCK_LOOP_TIMEOUT", "2"))
+
+# Live state: in-memory read model refreshed by polling (long-lived servers)
+LIVE_STATE_ENABLED = os.environ.get("ATLAS_LIVE_STATE", "").lower() in ("1", "true", "yes")
+LIVE_STATE_INTERVAL = float(os.environ.get("ATLAS_LIVE_STATE_INTERVAL", "1.0"))
+LIVE_STATE_MAX_PROJECTS = int(os.environ.get("ATLAS_LIVE_STATE_MAX_PROJECTS", "64"))
+
+# session_read_context: default page size for open_tasks / recent_progress
+CONTEXT_TASK_LIMIT = int(os.environ.get("ATLAS_CONTEXT_TASK_LIMIT", "100"))
+
+# Multi-project batch tools: how many projects are processed at once
+BATCH_MAX_WORKERS = int(os.environ.get("ATLAS_BATCH_WORKERS", "8"))
+
 REQUIRED_TEMPLATES = [
     "CLAUDE-activeContext.md",
     "CLAUDE-decisions.md",
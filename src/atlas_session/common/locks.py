@@ -0,0 +1,210 @@
+"""Per-project advisory locks for mutating operations.
+
+Two layers guard each project: an in-process lock shared by every thread
+and asyncio task of this server, and an ``fcntl.flock`` on a lock file
+so separate server processes exclude each other too. Locks are
+re-entrant for the same owner (thread, or asyncio task on the loop
+thread), so locked operations can call other locked operations.
+
+Lock files live under the user's ~/.atlas-session/locks and are
+unlinked by their holder on release, so they do not accumulate.
+
+Synchronous tools run on the event loop thread, so a blocking
+project_lock wait there stalls the whole server, including an async
+holder it is waiting for. Such waits are capped at LOCK_LOOP_TIMEOUT;
+async code should use project_lock_async instead.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+from .config import LOCK_LOOP_TIMEOUT, LOCK_TIMEOUT
+
+# In the user's home: any predictable name in a shared temp dir can be
+# created first by another user, who could then hold every project's lock.
+LOCK_DIR = Path.home() / ".atlas-session" / "locks"
+
+_F = TypeVar("_F", bound=Callable)
+
+
+class LockTimeout(TimeoutError):
+    """A project lock could not be acquired within the timeout."""
+
+
+def _owner() -> tuple:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return (threading.get_ident(), id(task) if task is not None else None)
+
+
+class _ProjectLock:
+    """Owner-reentrant lock for one project, backed by a lock file."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.path = LOCK_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.lock"
+        self._mutex = threading.Lock()
+        self._owner: tuple | None = None
+        self._depth = 0
+        self._fd: int | None = None
+
+    def try_acquire(self, owner: tuple) -> bool:
+        with self._mutex:
+            if self._owner == owner:
+                self._depth += 1
+                return True
+            if self._owner is not None or not self._lock_file():
+                return False
+            self._owner, self._depth = owner, 1
+            return True
+
+    def release(self, owner: tuple) -> None:
+        with self._mutex:
+            if self._owner != owner:
+                raise RuntimeError(f"project lock for {self.key} released by non-owner")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._unlock_file()
+
+    def _lock_file(self) -> bool:
+        if fcntl is None:
+            return True
+        LOCK_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # The previous holder unlinks the file on release; a lock taken on
+            # the unlinked inode excludes nobody, so retry on the current one.
+            held = os.fstat(fd)
+            current = os.stat(self.path, follow_symlinks=False)
+            if (held.st_dev, held.st_ino) != (current.st_dev, current.st_ino):
+                os.close(fd)
+                return False
+        except (BlockingIOError, FileNotFoundError):
+            os.close(fd)
+            return False
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def _unlock_file(self) -> None:
+        if self._fd is not None:
+            # Unlink while still locked so no one can lock this inode after us.
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+_locks: "weakref.WeakValueDictionary[str, _ProjectLock]" = weakref.WeakValueDictionary()
+_locks_guard = threading.Lock()
+_async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _lock_for(project_dir: str) -> _ProjectLock:
+    key = str(Path(project_dir).resolve())
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = _ProjectLock(key)
+        return lock
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _backoff(attempt: int) -> float:
+    return min(0.001 * 2**attempt, 0.05)
+
+
+@contextmanager
+def project_lock(project_dir: str, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold the project's lock for the duration of the block.
+
+    Raises LockTimeout if another thread, task or process keeps it longer
+    than ``timeout`` seconds. The wait sleeps the calling thread; on the
+    event loop thread it is capped at LOCK_LOOP_TIMEOUT.
+    """
+    if _on_event_loop():
+        timeout = min(timeout, LOCK_LOOP_TIMEOUT)
+    lock, owner = _lock_for(project_dir), _owner()
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while not lock.try_acquire(owner):
+        if time.monotonic() >= deadline:
+            raise LockTimeout(f"Timed out waiting for project lock on {lock.key}")
+        time.sleep(_backoff(attempt))
+        attempt += 1
+    try:
+        yield
+    finally:
+        lock.release(owner)
+
+
+@asynccontextmanager
+async def project_lock_async(project_dir: str, timeout: float = LOCK_TIMEOUT) -> AsyncIterator[None]:
+    """Async project_lock: waits without blocking the event loop.
+
+    Waiting tasks queue on a per-project asyncio.Lock so only one of them
+    polls the shared lock at a time.
+    """
+    lock, owner = _lock_for(project_dir), _owner()
+    queue = _async_locks.setdefault(asyncio.get_running_loop(), {}).setdefault(lock.key, asyncio.Lock())
+    deadline = time.monotonic() + timeout
+    try:
+        await asyncio.wait_for(queue.acquire(), max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        raise LockTimeout(f"Timed out waiting for project lock on {lock.key}") from None
+    try:
+        attempt = 0
+        while not lock.try_acquire(owner):
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"Timed out waiting for project lock on {lock.key}")
+            await asyncio.sleep(_backoff(attempt))
+            attempt += 1
+    finally:
+        queue.release()
+    try:
+        yield
+    finally:
+        lock.release(owner)
+
+
+def locked(fn: _F) -> _F:
+    """Run fn(project_dir, ...) while holding project_dir's lock."""
+
+    @wraps(fn)
+    def wrapper(project_dir: str, *args, **kwargs):
+        with project_lock(project_dir):
+            return fn(project_dir, *args, **kwargs)
+
+    return wrapper
@@ -1,9 +1,19 @@
 """File-based state helpers for session-context/ directory."""
 
 import json
+import os
+import shutil
+import stat
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from .config import CLAUDE_MD_NAME, SESSION_DIR_NAME
+from .config import CLAUDE_MD_NAME, DOC_CACHE_SIZE, SESSION_DIR_NAME, WRITE_DURABLE
 
 
 def session_dir(project_dir: str) -> Path:
@@ -19,28 +29,107 @@ def parse_md_sections(content: str) -> dict[str, str]:
 
     Handles code blocks correctly — ignores ## inside ``` fences.
     """
-    sections: dict[str, str] = {}
-    current_heading: str | None = None
-    current_lines: list[str] = []
+    return MdIndex(content).sections
+
+
+@dataclass(frozen=True)
+class Section:
+    """A heading and the [start, end) character span of its section."""
+
+    heading: str  # Stripped heading line, e.g. "## Ralph Loop"
+    level: int
+    start: int
+    end: int
+
+
+def iter_sections(content: str) -> Iterator[Section]:
+    """Single pass over content yielding each section as it closes.
+
+    A heading of level ``n`` closes every open section of level >= n,
+    except that ``#`` titles never close ``##``+ sections (so a document
+    banner stays out of the governance structure, matching
+    parse_md_sections) and ``##``+ headings never close ``#`` titles.
+    Headings inside ``` fences are ignored. Sections are yielded in close
+    order; spans exclude the newline preceding the next heading.
+    """
+    open_sections: list[tuple[str, int, int]] = []
     in_code_block = False
+    pos = 0
+    length = len(content)
+
+    while pos <= length:
+        nl = content.find("\n", pos)
+        line_end = length if nl == -1 else nl
+        line = content[pos:line_end]
 
-    for line in content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("```"):
+        if line.lstrip().startswith("```"):
             in_code_block = not in_code_block
+        elif not in_code_block and line.startswith("#"):
+            level = len(line) - len(line.lstrip("#"))
+            if level <= 6 and line[level : level + 1] == " ":
+                # Filter rather than pop: a # title opened inside a ## section
+                # must not shield it from the next ##
+                still_open = []
+                for heading, open_level, start in open_sections:
+                    if not _closes(level, open_level):
+                        still_open.append((heading, open_level, start))
+                for heading, open_level, start in reversed(open_sections):
+                    if _closes(level, open_level):
+                        yield Section(heading, open_level, start, max(start, pos - 1))
+                open_sections = still_open
+                open_sections.append((line.strip(), level, pos))
+
+        if nl == -1:
+            break
+        pos = nl + 1
 
-        if not in_code_block and line.startswith("## ") and not line.startswith("### "):
-            if current_heading:
-                sections[current_heading] = "\n".join(current_lines)
-            current_heading = line.strip()
-            current_lines = [line]
-        else:
-            current_lines.append(line)
+    while open_sections:
+        heading, level, start = open_sections.pop()
+        yield Section(heading, level, start, length)
 
-    if current_heading:
-        sections[current_heading] = "\n".join(current_lines)
 
-    return sections
+def _closes(new_level: int, open_level: int) -> bool:
+    return new_level <= open_level and (new_level >= 2 or open_level == 1)
+
+
+class MdIndex:
+    """Heading index over a markdown document; bodies are sliced lazily.
+
+    Parsing records offsets only. ``sections`` (the parse_md_sections dict)
+    is built on first access, and ``find`` memoizes lookups by lowercase
+    key so repeated governance checks against a cached document are O(1).
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.index = sorted(iter_sections(text), key=lambda sec: sec.start)
+        self._lower = [(sec.heading.lower(), sec) for sec in self.index if sec.level == 2]
+        self._found: dict[str, Section | None] = {}
+        self._sections: dict[str, str] | None = None
+
+    def body(self, section: Section) -> str:
+        return self.text[section.start : section.end]
+
+    @property
+    def sections(self) -> dict[str, str]:
+        """{heading: body} for ## sections, as parse_md_sections returns."""
+        if self._sections is None:
+            self._sections = {sec.heading: self.body(sec) for sec in self.index if sec.level == 2}
+        return dict(self._sections)
+
+    def find(self, key: str) -> tuple[str | None, str | None]:
+        """find_section() over this document's ## sections."""
+        lowered = key.lower()
+        if lowered not in self._found:
+            match = next((sec for heading, sec in self._lower if lowered in heading), None)
+            if match is not None:
+                # Duplicate headings: the later body wins, as in the sections dict
+                match = next(sec for _, sec in reversed(self._lower) if sec.heading == match.heading)
+            self._found[lowered] = match
+        match = self._found[lowered]
+        if match is None:
+            return None, None
+        return match.heading, self.body(match)
 
 
 def find_section(sections: dict[str, str], key: str) -> tuple[str | None, str | None]:
@@ -64,4 +153,305 @@ def read_json(path: Path) -> dict:
 
 def write_json(path: Path, data: dict) -> None:
     """Write dict as pretty JSON."""
-    path.write_text(json.dumps(data, indent=2))
+    atomic_write(path, json.dumps(data, indent=2))
+
+
+# ---------------------------------------------------------------------------
+# Atomic, batched writes
+# ---------------------------------------------------------------------------
+
+
+class WriteBatch:
+    """File writes staged as temp files and renamed into place together.
+
+    Each staged file is fully written to a temp file next to its target;
+    commit() renames them all and then fsyncs every affected directory
+    once, so a crash leaves either the old or the new version of each file
+    and never a truncated one. With ``durable`` the temp files are also
+    fsynced before the renames. Staged content becomes visible on commit,
+    not before; abort() discards it. Writes to a symlink replace the file
+    it points to, leaving the link in place.
+    """
+
+    def __init__(self, durable: bool = WRITE_DURABLE):
+        self.durable = durable
+        self._staged: dict[Path, str] = {}  # target -> temp path
+
+    def write(self, path: Path, data: str | bytes) -> None:
+        """Stage data (text is UTF-8 encoded) for path."""
+        if isinstance(data, str):
+            data = data.encode()
+        path = _link_target(path)
+        tmp = self._temp_for(path)
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+                if self.durable:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            if path.exists():
+                shutil.copymode(path, tmp)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._stage(path, tmp)
+
+    def copy(self, src: Path, dst: Path) -> None:
+        """Stage a copy of src (content and metadata, like shutil.copy2)."""
+        dst = _link_target(dst)
+        tmp = self._temp_for(dst)
+        try:
+            shutil.copy2(src, tmp)
+            if self.durable:
+                with open(tmp, "rb") as fh:
+                    os.fsync(fh.fileno())
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._stage(dst, tmp)
+
+    def commit(self) -> None:
+        directories = {path.parent for path in self._staged}
+        try:
+            while self._staged:
+                path, tmp = next(iter(self._staged.items()))
+                os.replace(tmp, path)
+                del self._staged[path]
+        except BaseException:
+            self.abort()
+            raise
+        for directory in directories:
+            _fsync_dir(directory)
+
+    def abort(self) -> None:
+        staged, self._staged = self._staged, {}
+        for tmp in staged.values():
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _temp_for(self, path: Path) -> str:
+        # Created with O_EXCL and the usual 0o666 & ~umask permissions
+        tmp = str(path.parent / f".{path.name}.{os.urandom(4).hex()}.tmp")
+        os.close(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        return tmp
+
+    def _stage(self, path: Path, tmp: str) -> None:
+        previous = self._staged.pop(path, None)
+        if previous is not None:
+            os.unlink(previous)
+        self._staged[path] = tmp
+
+
+def _link_target(path: Path) -> Path:
+    """The file a write to path should replace: the symlink's target, if any."""
+    return path.resolve() if path.is_symlink() else path
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames in directory (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+_batch_local = threading.local()
+
+
+@contextmanager
+def write_batch(durable: bool = WRITE_DURABLE) -> Iterator[WriteBatch]:
+    """Group this thread's atomic_write/atomic_copy calls into one commit.
+
+    Nested batches join the outermost one. The batch commits when the
+    block exits normally and is discarded if it raises. Also usable as a
+    decorator.
+    """
+    outer = getattr(_batch_local, "batch", None)
+    if outer is not None:
+        yield outer
+        return
+    batch = WriteBatch(durable)
+    _batch_local.batch = batch
+    try:
+        yield batch
+    except BaseException:
+        batch.abort()
+        raise
+    else:
+        batch.commit()
+    finally:
+        _batch_local.batch = None
+
+
+def atomic_write(path: Path, data: str | bytes) -> None:
+    """Replace path atomically, joining the current write_batch if any."""
+    with write_batch() as batch:
+        batch.write(Path(path), data)
+
+
+def atomic_copy(src: Path, dst: Path) -> None:
+    """shutil.copy2 via temp file and rename, joining the current write_batch."""
+    with write_batch() as batch:
+        batch.copy(Path(src), Path(dst))
+
+
+# ---------------------------------------------------------------------------
+# Parsed-document cache
+# ---------------------------------------------------------------------------
+
+# Files modified this recently are never cached: filesystem timestamps are
+# coarse, so a second write within the same tick could keep the same stamp.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_settled(mtime_ns: int) -> bool:
+    """True once an mtime is old enough to key a cache entry on."""
+    return time.time_ns() - mtime_ns > _RACY_WINDOW_NS
+
+
+class DocumentCache:
+    """Thread-safe LRU of parsed files keyed by path, parser and stat stamp.
+
+    An entry is reused only while the file's (mtime_ns, size, inode) is
+    unchanged, so edits made by anything — including other processes — are
+    picked up on the next lookup. Cached values are shared between callers
+    and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[tuple, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, parser: Callable[[str], Any], errors: str = "strict") -> Any | None:
+        """Return parser(path text), reusing the cached value if fresh.
+
+        Returns None if path is missing or not a regular file.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        key = (str(path), parser, errors)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = parser(Path(path).read_text(errors=errors))
+        if is_settled(st.st_mtime_ns):
+            with self._lock:
+                self._entries[key] = (stamp, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every cached parse of path."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == str(path)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+doc_cache = DocumentCache(maxsize=DOC_CACHE_SIZE)
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def load_text(path: Path, errors: str = "strict") -> str | None:
+    """Read a file through the document cache. None if missing."""
+    return doc_cache.get(path, _identity, errors)
+
+
+def load_markdown(path: Path, errors: str = "strict") -> MdIndex | None:
+    """Read and index a markdown file through the document cache."""
+    return doc_cache.get(path, MdIndex, errors)
+
+
+# ---------------------------------------------------------------------------
+# Root directory snapshot
+# ---------------------------------------------------------------------------
+
+
+def _entry_check(check: Callable[[], bool]) -> bool:
+    """DirEntry type check that reports False on OSError, like Path.is_file."""
+    try:
+        return check()
+    except OSError:
+        return False
+
+
+class RootSnapshot:
+    """A directory listed once with ``os.scandir``.
+
+    Type checks use the ``DirEntry`` cache, so plain files and directories
+    cost no extra stat (symlinks are resolved once, on first check). Pass
+    one snapshot through the operations that inspect the project root
+    instead of letting each call ``Path.iterdir()``.
+
+    Raises OSError if the directory cannot be listed.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        with os.scandir(self.path) as it:
+            self._entries = {e.name: e for e in sorted(it, key=lambda e: e.name)}
+        self._children: dict[str, RootSnapshot | None] = {}
+
+    @property
+    def files(self) -> list[Path]:
+        """Regular files (symlinks followed), sorted by name."""
+        return [self.path / name for name, e in self._entries.items() if _entry_check(e.is_file)]
+
+    @property
+    def dirs(self) -> list[Path]:
+        """Directories (symlinks followed), sorted by name."""
+        return [self.path / name for name, e in self._entries.items() if _entry_check(e.is_dir)]
+
+    def is_file(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and _entry_check(entry.is_file)
+
+    def is_dir(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and _entry_check(entry.is_dir)
+
+    def exists(self, name: str) -> bool:
+        """True if name is listed and its target resolves (like Path.exists)."""
+        entry = self._entries.get(name)
+        return entry is not None and _entry_check(lambda: bool(entry.stat()))
+
+    def child(self, name: str) -> "RootSnapshot | None":
+        """Snapshot of a subdirectory, listed on first use. None if unreadable."""
+        if name not in self._children:
+            snapshot = None
+            if self.is_dir(name):
+                try:
+                    snapshot = RootSnapshot(self.path / name)
+                except OSError:
+                    pass
+            self._children[name] = snapshot
+        return self._children[name]
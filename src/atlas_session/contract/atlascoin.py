@@ -1,10 +1,65 @@
-"""AtlasCoin HTTP client for bounty operations."""
+"""AtlasCoin HTTP client for bounty operations.
+
+All calls share one pooled ``httpx.AsyncClient`` (keep-alive, optional
+HTTP/2) created lazily by ``get_client`` and closed by ``aclose`` when
+the server shuts down.
+"""
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 
-from ..common.config import ATLASCOIN_URL
+from ..common.config import (
+    ATLASCOIN_HTTP2,
+    ATLASCOIN_KEEPALIVE_EXPIRY,
+    ATLASCOIN_MAX_CONNECTIONS,
+    ATLASCOIN_MAX_KEEPALIVE,
+    ATLASCOIN_URL,
+)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AtlasCoin client, creating it on first use.
+
+    The client is bound to the running event loop; a new one is created
+    if the previous client was closed or belongs to another loop.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=ATLASCOIN_MAX_CONNECTIONS,
+                max_keepalive_connections=ATLASCOIN_MAX_KEEPALIVE,
+                keepalive_expiry=ATLASCOIN_KEEPALIVE_EXPIRY,
+            ),
+            http2=ATLASCOIN_HTTP2 and _http2_available(),
+            timeout=10,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client. Safe to call when no client exists."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
 
 def _ok_or_error(r: httpx.Response, ok_codes: tuple = (200,)) -> dict:
@@ -23,17 +78,16 @@ def _ok_or_error(r: httpx.Response, ok_codes: tuple = (200,)) -> dict:
 async def health() -> dict:
     """Check AtlasCoin service availability."""
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.get(f"{ATLASCOIN_URL}/health")
-            if r.status_code == 200:
-                ct = r.headers.get("content-type", "")
-                data = r.json() if ct.startswith("application/json") else {}
-                return {"healthy": True, "url": ATLASCOIN_URL, "data": data}
-            return {
-                "healthy": False,
-                "url": ATLASCOIN_URL,
-                "status_code": r.status_code,
-            }
+        r = await get_client().get(f"{ATLASCOIN_URL}/health", timeout=5)
+        if r.status_code == 200:
+            ct = r.headers.get("content-type", "")
+            data = r.json() if ct.startswith("application/json") else {}
+            return {"healthy": True, "url": ATLASCOIN_URL, "data": data}
+        return {
+            "healthy": False,
+            "url": ATLASCOIN_URL,
+            "status_code": r.status_code,
+        }
     except Exception as e:
         return {"healthy": False, "url": ATLASCOIN_URL, "error": str(e)}
 
@@ -41,16 +95,15 @@ async def health() -> dict:
 async def create_bounty(soul_purpose: str, escrow: int) -> dict:
     """Create a bounty on AtlasCoin."""
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.post(
-                f"{ATLASCOIN_URL}/api/bounties",
-                json={
-                    "poster": "session-lifecycle",
-                    "template": soul_purpose,
-                    "escrowAmount": escrow,
-                },
-            )
-            return _ok_or_error(r, ok_codes=(200, 201))
+        r = await get_client().post(
+            f"{ATLASCOIN_URL}/api/bounties",
+            json={
+                "poster": "session-lifecycle",
+                "template": soul_purpose,
+                "escrowAmount": escrow,
+            },
+        )
+        return _ok_or_error(r, ok_codes=(200, 201))
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -58,9 +111,8 @@ async def create_bounty(soul_purpose: str, escrow: int) -> dict:
 async def get_bounty(bounty_id: str) -> dict:
     """Get bounty status."""
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            r = await client.get(f"{ATLASCOIN_URL}/api/bounties/{bounty_id}")
-            return _ok_or_error(r)
+        r = await get_client().get(f"{ATLASCOIN_URL}/api/bounties/{bounty_id}", timeout=5)
+        return _ok_or_error(r)
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -68,16 +120,15 @@ async def get_bounty(bounty_id: str) -> dict:
 async def submit_solution(bounty_id: str, stake: int, evidence: dict) -> dict:
     """Submit a solution for verification."""
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.post(
-                f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/submit",
-                json={
-                    "claimant": "session-agent",
-                    "stakeAmount": stake,
-                    "evidence": evidence,
-                },
-            )
-            return _ok_or_error(r, ok_codes=(200, 201))
+        r = await get_client().post(
+            f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/submit",
+            json={
+                "claimant": "session-agent",
+                "stakeAmount": stake,
+                "evidence": evidence,
+            },
+        )
+        return _ok_or_error(r, ok_codes=(200, 201))
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -85,12 +136,11 @@ async def submit_solution(bounty_id: str, stake: int, evidence: dict) -> dict:
 async def verify_bounty(bounty_id: str, evidence: dict) -> dict:
     """Submit verification evidence."""
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.post(
-                f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/verify",
-                json={"evidence": evidence},
-            )
-            return _ok_or_error(r, ok_codes=(200, 201))
+        r = await get_client().post(
+            f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/verify",
+            json={"evidence": evidence},
+        )
+        return _ok_or_error(r, ok_codes=(200, 201))
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -98,8 +148,7 @@ async def verify_bounty(bounty_id: str, evidence: dict) -> dict:
 async def settle_bounty(bounty_id: str) -> dict:
     """Settle a verified bounty — distribute tokens."""
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            r = await client.post(f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/settle")
-            return _ok_or_error(r, ok_codes=(200, 201))
+        r = await get_client().post(f"{ATLASCOIN_URL}/api/bounties/{bounty_id}/settle")
+        return _ok_or_error(r, ok_codes=(200, 201))
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -0,0 +1,379 @@
+"""pass_when expressions — parsed once, evaluated against each criterion result.
+
+A criterion's ``pass_when`` is compiled into a closure the first time it is
+seen (compiled forms are cached by expression text), so evaluating a large
+criteria set costs no re-parsing.
+
+Legacy forms keep their original meaning:
+
+- ``exit_code == 0`` / ``exit_code != 0``
+- ``== 0``, ``!= 0``, ``> 0``, ``>= 0``, ``< 0``, ``<= 0`` — compare the
+  value (lists by length), or the exit code when there is no value
+- ``not_empty`` — value (or output, when there is no value) is non-empty
+- ``contains:<text>`` — literal text in the output (or a string value)
+
+Anything else is parsed with this grammar::
+
+    expr       := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := term [("==" | "!=" | ">" | ">=" | "<" | "<=" | "contains" | "matches") term]
+    term       := NUMBER | 'string' | "string" | true | false
+                | exit_code | value | output | not_empty
+                | len(term) | number('regex' [, term]) | count('regex' [, term])
+                | "(" expr ")"
+
+``number`` extracts the first match of a regex (its first group, if it has
+one) from the output as a number; ``count`` counts matches. ``matches`` is
+a regex search. A bare term is true when non-empty / non-zero. Strings are
+raw apart from an escaped quote, so regexes need no double escaping::
+
+    exit_code == 0 and number('(\\d+) passed') >= 10 and not output contains 'FAILED'
+
+Comparisons involving a missing value are false, as is any expression that
+fails to compile or to evaluate.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+
+class PassWhenError(ValueError):
+    """A pass_when expression that does not compile."""
+
+
+class Facts(NamedTuple):
+    """What a criterion produced, as seen by its pass_when expression."""
+
+    exit_code: int | None = None
+    value: Any = None
+    output: str = ""
+
+
+Check = Callable[[Facts], bool]
+_Node = Callable[[Facts], Any]
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<num>-?\d+(?:\.\d+)?)
+      | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|>=|<=|>|<)
+      | (?P<punct>[(),])
+      | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+    )""",
+    re.VERBOSE,
+)
+
+_SHORTHAND = re.compile(r"(==|!=|>=|<=|>|<)(.*)", re.DOTALL)
+
+_OPS: dict[str, Callable[[float, float], bool]] = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+def evaluate(pass_when: str, exit_code: int | None = None, value: Any = None, output: str = "") -> bool:
+    """Evaluate pass_when against one result; False if it does not compile."""
+    return _cached(pass_when)(Facts(exit_code, value, output))
+
+
+def compile_pass_when(pass_when: str) -> Check:
+    """Compiled check for pass_when. Raises PassWhenError if it is invalid."""
+    check = _cached(pass_when)
+    if isinstance(check, _Invalid):
+        raise PassWhenError(check.error)
+    return check
+
+
+@lru_cache(maxsize=1024)
+def _cached(pass_when: str) -> Check:
+    try:
+        node = _compile(pass_when.strip())
+    except PassWhenError as e:
+        return _Invalid(str(e))
+
+    def check(facts: Facts) -> bool:
+        try:
+            return bool(node(facts))
+        except Exception:
+            return False
+
+    return check
+
+
+class _Invalid:
+    """Check for an expression that failed to compile: always False."""
+
+    def __init__(self, error: str):
+        self.error = error
+
+    def __call__(self, facts: Facts) -> bool:
+        return False
+
+
+def _compile(pw: str) -> _Node:
+    if pw.startswith("contains:"):
+        return _legacy_contains(pw[len("contains:") :])
+    shorthand = _SHORTHAND.match(pw)
+    if shorthand:
+        return _legacy_compare(shorthand.group(1), shorthand.group(2))
+    return _Parser(pw).parse()
+
+
+def _legacy_contains(text: str) -> _Node:
+    def node(f: Facts) -> bool:
+        if f.output:
+            return text in f.output
+        return isinstance(f.value, str) and text in f.value
+
+    return node
+
+
+def _legacy_compare(op: str, operand: str) -> _Node:
+    """Shorthand like "== 0": value (lists by length), else exit code, else 0."""
+    try:
+        target = float(operand.strip())
+    except ValueError:
+        raise PassWhenError(f"Shorthand {op} needs a single number, got {operand.strip()!r}") from None
+    compare = _OPS[op]
+
+    def node(f: Facts) -> bool:
+        subject = f.value if f.value is not None else f.exit_code
+        if isinstance(subject, list):
+            subject = len(subject)
+        try:
+            return compare(float(subject) if subject is not None else 0, target)
+        except (ValueError, TypeError):
+            return False
+
+    return node
+
+
+def _not_empty(f: Facts) -> bool:
+    if f.value is not None:
+        if isinstance(f.value, (list, dict)):
+            return len(f.value) > 0
+        return bool(f.value)
+    return bool(f.output)
+
+
+_NAMES: dict[str, _Node] = {
+    "exit_code": lambda f: f.exit_code,
+    "value": lambda f: f.value,
+    "output": lambda f: f.output,
+    "not_empty": _not_empty,
+    "true": lambda f: True,
+    "false": lambda f: False,
+}
+
+
+class _Parser:
+    """Recursive-descent parser that builds closures over Facts."""
+
+    def __init__(self, text: str):
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(text: str) -> list[tuple[str, str]]:
+        tokens, pos = [], 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if not match or match.end() == pos:
+                raise PassWhenError(f"Unexpected character at {pos}: {text[pos:]!r}")
+            kind = match.lastgroup or ""
+            tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        return tokens
+
+    def parse(self) -> _Node:
+        if not self.tokens:
+            raise PassWhenError("Empty expression")
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise PassWhenError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return node
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else None
+
+    def _take(self, expected: str | None = None) -> tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise PassWhenError(f"Expected {expected!r}, got end of expression" if expected else "Unexpected end")
+        token = self.tokens[self.pos]
+        if expected is not None and token[1] != expected:
+            raise PassWhenError(f"Expected {expected!r}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def _or(self) -> _Node:
+        nodes = [self._and()]
+        while self._peek() == "or":
+            self._take()
+            nodes.append(self._and())
+        if len(nodes) == 1:
+            return nodes[0]
+        return lambda f: any(_truthy(n(f)) for n in nodes)
+
+    def _and(self) -> _Node:
+        nodes = [self._not()]
+        while self._peek() == "and":
+            self._take()
+            nodes.append(self._not())
+        if len(nodes) == 1:
+            return nodes[0]
+        return lambda f: all(_truthy(n(f)) for n in nodes)
+
+    def _not(self) -> _Node:
+        if self._peek() == "not":
+            self._take()
+            inner = self._not()
+            return lambda f: not _truthy(inner(f))
+        return self._comparison()
+
+    def _comparison(self) -> _Node:
+        left = self._term()
+        op = self._peek()
+        if op in _OPS:
+            self._take()
+            return _compare(op, left, self._term())
+        if op == "contains":
+            self._take()
+            return _contains(left, self._term())
+        if op == "matches":
+            self._take()
+            kind, pattern = self._take()
+            if kind != "str":
+                raise PassWhenError("matches needs a quoted regex")
+            return _matches(left, _regex(_unquote(pattern)))
+        return left
+
+    def _term(self) -> _Node:
+        kind, text = self._take()
+        if kind == "num":
+            number = float(text)
+            return lambda f: number
+        if kind == "str":
+            string = _unquote(text)
+            return lambda f: string
+        if text == "(":
+            node = self._or()
+            self._take(")")
+            return node
+        if kind == "name" and text in ("len", "number", "count"):
+            return self._call(text)
+        if kind == "name" and text in _NAMES:
+            return _NAMES[text]
+        raise PassWhenError(f"Unexpected {text!r}")
+
+    def _call(self, fn: str) -> _Node:
+        self._take("(")
+        if fn == "len":
+            arg = self._term()
+            self._take(")")
+            return lambda f: _length(arg(f))
+        kind, pattern = self._take()
+        if kind != "str":
+            raise PassWhenError(f"{fn}() needs a quoted regex")
+        regex = _regex(_unquote(pattern))
+        subject = _NAMES["output"]
+        if self._peek() == ",":
+            self._take()
+            subject = self._term()
+        self._take(")")
+        if fn == "count":
+            return lambda f: len(regex.findall(_text(subject(f))))
+        return lambda f: _extract_number(regex, _text(subject(f)))
+
+
+def _unquote(token: str) -> str:
+    quote = token[0]
+    return token[1:-1].replace("\\" + quote, quote)
+
+
+def _regex(pattern: str) -> re.Pattern:
+    try:
+        return re.compile(pattern, re.MULTILINE)
+    except re.error as e:
+        raise PassWhenError(f"Invalid regex {pattern!r}: {e}") from None
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, (list, tuple, dict)):
+        return float(len(value))
+    return float(value)
+
+
+def _length(value: Any) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, dict, str)):
+        return len(value)
+    return len(str(value))
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, (list, tuple, dict, str)):
+        return len(value) > 0
+    return bool(value)
+
+
+def _extract_number(regex: re.Pattern, text: str) -> float | None:
+    match = regex.search(text)
+    if match is None:
+        return None
+    raw = match.group(1) if regex.groups else match.group(0)
+    try:
+        return float(raw.replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _compare(op: str, left: _Node, right: _Node) -> _Node:
+    compare = _OPS[op]
+
+    def node(f: Facts) -> bool:
+        a, b = left(f), right(f)
+        if a is None or b is None:
+            return False
+        if op in ("==", "!=") and isinstance(a, str) and isinstance(b, str):
+            return compare(a, b)
+        try:
+            return compare(_number(a), _number(b))
+        except (TypeError, ValueError):
+            return False
+
+    return node
+
+
+def _contains(left: _Node, right: _Node) -> _Node:
+    def node(f: Facts) -> bool:
+        haystack, needle = left(f), right(f)
+        if isinstance(haystack, str):
+            return needle is not None and _text(needle) in haystack
+        if isinstance(haystack, (list, tuple)):
+            return needle in haystack
+        return False
+
+    return node
+
+
+def _matches(left: _Node, regex: re.Pattern) -> _Node:
+    def node(f: Facts) -> bool:
+        value = left(f)
+        return value is not None and regex.search(_text(value)) is not None
+
+    return node
@@ -11,12 +11,21 @@ from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 
+from ..common.state import atomic_write
+
 
 class CriterionType(str, Enum):
     SHELL = "shell"  # Run command, check exit code
     CONTEXT_CHECK = "context_check"  # Check read-context JSON field
     FILE_EXISTS = "file_exists"  # Check file/dir exists
     GIT_CHECK = "git_check"  # Check git state
+    # Native checks, evaluated in-process without spawning a command
+    GLOB_COUNT = "glob_count"  # Count files matching a glob
+    FILE_CONTAINS = "file_contains"  # Count lines containing text
+    FILE_REGEX = "file_regex"  # Count lines matching a regex
+    LINE_COUNT = "line_count"  # Count lines in matching files
+    GIT_REF = "git_ref"  # Resolve a ref by reading .git directly
+    JSON_PATH = "json_path"  # Read a dotted path from a JSON file
 
 
 @dataclass
@@ -25,9 +34,13 @@ class Criterion:
     type: CriterionType
     pass_when: str  # "exit_code == 0", "== 0", "not_empty"
     command: str | None = None  # Shell command (shell/git_check)
-    field: str | None = None  # Context field (context_check)
-    path: str | None = None  # File path (file_exists)
+    field: str | None = None  # Context field (context_check) or dotted key path (json_path)
+    path: str | None = None  # File path (file_exists) or glob (native file checks)
+    pattern: str | None = None  # Text, regex or ref name (file_contains, file_regex, git_ref)
     weight: float = 1.0
+    exclusive: bool = False  # Never run concurrently with other criteria
+    depends_on: list[str] | None = None  # Names that must pass before this runs
+    inputs: list[str] | None = None  # Paths/globs/dirs whose changes invalidate cached results
 
     def to_dict(self) -> dict:
         d = asdict(self)
@@ -67,7 +80,7 @@ class Contract:
     def save(self, project_dir: str) -> Path:
         """Save contract to session-context/contract.json."""
         path = Path(project_dir) / "session-context" / "contract.json"
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        atomic_write(path, json.dumps(self.to_dict(), indent=2))
         return path
 
     @classmethod
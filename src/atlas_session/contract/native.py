@@ -0,0 +1,200 @@
+"""Native criterion types — file, git and JSON checks evaluated in-process.
+
+These cover what contracts most often shelled out to ``find``, ``grep``,
+``wc`` or ``git`` for, without a fork/exec per criterion. Each check
+produces a value that ``pass_when`` is evaluated against (e.g. ``== 0``
+for "no TODOs", ``< 500`` for a line budget, ``not_empty`` for "has
+commits").
+
+File paths and globs are relative to the project directory, and matches
+that resolve outside it (via ``..`` or symlinks) are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from . import expr
+from .model import Criterion, CriterionType
+
+# Matching lines quoted in file_contains/file_regex output
+_MAX_QUOTED = 5
+_OUTPUT_LIMIT = 500
+
+
+def run(project_dir: str, criterion: Criterion) -> dict:
+    """Evaluate a native criterion and return its result dict."""
+    root = Path(project_dir).resolve()
+    value, output = _CHECKS[criterion.type](root, criterion)
+    if value is None:
+        passed = False
+    else:
+        passed = expr.evaluate(criterion.pass_when, value=value, output=output)
+    return {"name": criterion.name, "passed": passed, "output": output[:_OUTPUT_LIMIT], "weight": criterion.weight}
+
+
+def _files(root: Path, pattern: str) -> Iterator[Path]:
+    """Files under root matching a relative path or glob, in sorted order."""
+    if not pattern:
+        return
+    if Path(pattern).is_absolute():
+        raise ValueError(f"Path must be relative to the project: {pattern}")
+    candidates = sorted(root.glob(pattern)) if any(c in pattern for c in "*?[") else [root / pattern]
+    for path in candidates:
+        try:
+            resolved = path.resolve()
+        except OSError:
+            continue
+        if resolved.is_file() and resolved.is_relative_to(root):
+            yield path
+
+
+def _glob_count(root: Path, c: Criterion) -> tuple[int, str]:
+    count = sum(1 for _ in _files(root, c.path or ""))
+    return count, f"{count} file(s) match {c.path}"
+
+
+def _line_count(root: Path, c: Criterion) -> tuple[int, str]:
+    total = files = 0
+    for path in _files(root, c.path or ""):
+        files += 1
+        with open(path, "rb") as f:
+            last = b""
+            while chunk := f.read(65536):
+                total += chunk.count(b"\n")
+                last = chunk
+        if last and not last.endswith(b"\n"):
+            total += 1
+    return total, f"{total} line(s) in {files} file(s) matching {c.path}"
+
+
+def _file_contains(root: Path, c: Criterion) -> tuple[int | None, str]:
+    needle = c.pattern or ""
+    if not needle:
+        return None, "file_contains needs a pattern"
+    return _grep(root, c.path or "", lambda line: needle in line, needle)
+
+
+def _file_regex(root: Path, c: Criterion) -> tuple[int | None, str]:
+    try:
+        regex = re.compile(c.pattern or "")
+    except re.error as e:
+        return None, f"Invalid regex {c.pattern!r}: {e}"
+    return _grep(root, c.path or "", lambda line: regex.search(line) is not None, c.pattern or "")
+
+
+def _grep(root: Path, pattern: str, match: Callable[[str], bool], label: str) -> tuple[int, str]:
+    """Count matching lines across files; quote the first few."""
+    count = 0
+    quoted: list[str] = []
+    for path in _files(root, pattern):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for lineno, line in enumerate(f, start=1):
+                if match(line):
+                    count += 1
+                    if len(quoted) < _MAX_QUOTED:
+                        quoted.append(f"{path.relative_to(root)}:{lineno}: {line.strip()[:100]}")
+    return count, "\n".join([f"{count} line(s) match {label!r} in {pattern}", *quoted])
+
+
+def _json_path(root: Path, c: Criterion) -> tuple[object, str]:
+    paths = list(_files(root, c.path or ""))
+    if len(paths) != 1:
+        return None, f"JSON file not found: {c.path}"
+    with open(paths[0], encoding="utf-8") as f:
+        value = json.load(f)
+    for key in (c.field or "").split(".") if c.field else []:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif isinstance(value, list) and key.lstrip("-").isdigit() and -len(value) <= int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None, f"Key path '{c.field}' not found in {c.path}"
+    return value, f"{c.field or '.'} = {json.dumps(value)}"
+
+
+def _git_ref(root: Path, c: Criterion) -> tuple[str, str]:
+    ref = c.pattern or "HEAD"
+    sha = resolve_ref(root, ref)
+    return sha or "", f"{ref} -> {sha}" if sha else f"{ref} does not resolve"
+
+
+def resolve_ref(root: Path, ref: str = "HEAD") -> str | None:
+    """Object id for ref, read from .git without running git.
+
+    Follows symbolic refs and ``gitdir:`` files (worktrees, submodules),
+    and checks loose refs before packed-refs. Returns None if the ref
+    does not exist, e.g. HEAD in a repository with no commits.
+    """
+    git_dir = _git_dir(root)
+    if git_dir is None:
+        return None
+    common = git_dir
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        common = (git_dir / commondir.read_text().strip()).resolve()
+
+    for _ in range(10):  # bound symbolic ref chains
+        if re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", ref):
+            return ref
+        value = _read_ref(git_dir, common, ref)
+        if value is None:
+            return None
+        if not value.startswith("ref: "):
+            return value
+        ref = value[len("ref: ") :]
+    return None
+
+
+def _git_dir(root: Path) -> Path | None:
+    dot_git = root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        content = dot_git.read_text().strip()
+        if content.startswith("gitdir: "):
+            return (root / content[len("gitdir: ") :]).resolve()
+    return None
+
+
+def _read_ref(git_dir: Path, common: Path, ref: str) -> str | None:
+    """Raw value of a ref: a commit id or "ref: <target>"."""
+    candidates = [ref] if ref.startswith("refs/") or ref == "HEAD" else [ref, f"refs/heads/{ref}", f"refs/tags/{ref}"]
+    for name in candidates:
+        # HEAD and other per-worktree refs live in git_dir, the rest in common
+        for base in (git_dir, common) if "/" not in name else (common,):
+            path = base / name
+            if path.is_file():
+                return path.read_text().strip()
+        packed = _packed_refs(common).get(name)
+        if packed:
+            return packed
+    return None
+
+
+def _packed_refs(common: Path) -> dict[str, str]:
+    refs: dict[str, str] = {}
+    try:
+        lines = (common / "packed-refs").read_text().splitlines()
+    except OSError:
+        return refs
+    for line in lines:
+        if line and not line.startswith(("#", "^")):
+            sha, _, name = line.partition(" ")
+            refs[name] = sha
+    return refs
+
+
+_CHECKS: dict[CriterionType, Callable[[Path, Criterion], tuple]] = {
+    CriterionType.GLOB_COUNT: _glob_count,
+    CriterionType.FILE_CONTAINS: _file_contains,
+    CriterionType.FILE_REGEX: _file_regex,
+    CriterionType.LINE_COUNT: _line_count,
+    CriterionType.GIT_REF: _git_ref,
+    CriterionType.JSON_PATH: _json_path,
+}
+
+NATIVE_TYPES = frozenset(_CHECKS)
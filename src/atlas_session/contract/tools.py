@@ -2,17 +2,20 @@
 
 Deterministic bounty management — contracts define executable test
 criteria at creation time, verification just runs them.
+
+The verifier and AtlasCoin client are imported inside the tools that use
+them, so server startup does not pay for them.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
-from . import atlascoin
-from .model import Contract, Criterion
-from .verifier import run_tests
+from ..common.locks import project_lock_async
+from ..common.state import atomic_write
+from .model import Contract, Criterion, CriterionType
 
 
 def register(mcp: FastMCP) -> None:
@@ -22,6 +25,8 @@ def register(mcp: FastMCP) -> None:
     async def contract_health() -> dict:
         """Check AtlasCoin service availability. Call before any bounty
         operations. Returns {healthy, url}."""
+        from . import atlascoin
+
         return await atlascoin.health()
 
     @mcp.tool
@@ -35,14 +40,27 @@ def register(mcp: FastMCP) -> None:
 
         Each criterion dict needs: name, type (shell|context_check|
         file_exists|git_check), pass_when, and optionally command/field/path.
+        Native types run in-process without spawning a command, with
+        pass_when applied to the value they produce: glob_count, line_count
+        (path glob), file_contains/file_regex (path glob + pattern; matching
+        line count), git_ref (pattern = ref, default HEAD; commit id) and
+        json_path (path + dotted field).
+        Set exclusive=true to keep a criterion from running alongside others,
+        or depends_on=[names] to run it only after those criteria pass.
 
         Creates both an AtlasCoin bounty (if available) and a local
         contract.json in session-context/.
         """
+        from . import atlascoin
+        from .expr import compile_pass_when
+
         parsed = []
         for c in criteria:
             try:
-                parsed.append(Criterion.from_dict(c))
+                criterion = Criterion.from_dict(c)
+                if criterion.type != CriterionType.FILE_EXISTS:
+                    compile_pass_when(criterion.pass_when)
+                parsed.append(criterion)
             except Exception as e:
                 return {"status": "error", "message": f"Invalid criterion '{c.get('name', '?')}': {e}"}
 
@@ -56,17 +74,17 @@ def register(mcp: FastMCP) -> None:
         api_result = await atlascoin.create_bounty(soul_purpose, escrow)
         if api_result.get("status") == "ok":
             bounty_data = api_result.get("data", {})
-            bounty_id = str(bounty_data.get("id", bounty_data.get("bountyId", "")))
-            contract.bounty_id = bounty_id
+            contract.bounty_id = str(bounty_data.get("id", bounty_data.get("bountyId", "")))
             contract.status = "active"
-
-            # Write BOUNTY_ID.txt for backward compatibility
-            bid_path = Path(project_dir) / "session-context" / "BOUNTY_ID.txt"
-            bid_path.write_text(bounty_id)
         else:
             contract.status = "active_local"
 
-        contract.save(project_dir)
+        async with project_lock_async(project_dir):
+            if contract.bounty_id:
+                # Write BOUNTY_ID.txt for backward compatibility
+                bid_path = Path(project_dir) / "session-context" / "BOUNTY_ID.txt"
+                atomic_write(bid_path, contract.bounty_id)
+            contract.save(project_dir)
 
         return {
             "status": "ok",
@@ -79,6 +97,8 @@ def register(mcp: FastMCP) -> None:
     @mcp.tool
     async def contract_get_status(project_dir: str) -> dict:
         """Get current contract and bounty status."""
+        from . import atlascoin
+
         contract = Contract.load(project_dir)
         if not contract:
             return {"status": "none", "message": "No contract found"}
@@ -92,28 +112,62 @@ def register(mcp: FastMCP) -> None:
         return result
 
     @mcp.tool
-    def contract_run_tests(project_dir: str) -> dict:
+    async def contract_run_tests(
+        project_dir: str,
+        ctx: Context,
+        use_cache: bool = False,
+        fail_fast: bool = False,
+        full_score: bool = False,
+        max_workers: int | None = None,
+    ) -> dict:
         """Execute all contract criteria deterministically.
 
         Runs each criterion (shell commands, context checks, file checks,
         git checks) and returns pass/fail results. No AI judgment involved.
+        Criteria run one at a time in declaration order unless max_workers
+        (default ATLAS_CONTRACT_WORKERS, 1) allows independent ones to run
+        concurrently.
+        With use_cache, shell/git criteria whose inputs are unchanged since
+        the last run return their previous result (marked cached=true);
+        without declared inputs, gitignored files are not part of that
+        check, so leave it off when results must be current.
+        Progress notifications report each criterion as it starts and
+        finishes. With fail_fast, cheap criteria run first and the rest are
+        skipped after the first failure; full_score keeps that order but
+        runs everything for an exact score.
         """
+        from .verifier import run_tests_async
+
         contract = Contract.load(project_dir)
         if not contract:
             return {"status": "error", "message": "No contract found"}
 
-        return run_tests(project_dir, contract)
+        return await run_tests_async(
+            project_dir,
+            contract,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            on_event=_progress(ctx),
+            fail_fast=fail_fast,
+            full_score=full_score,
+        )
 
     @mcp.tool
-    async def contract_submit(project_dir: str, evidence: dict | None = None) -> dict:
+    async def contract_submit(
+        project_dir: str, ctx: Context, evidence: dict | None = None, use_cache: bool = False
+    ) -> dict:
         """Submit solution to AtlasCoin for the active contract.
-        Optionally pass evidence dict; defaults to test run results."""
+        Optionally pass evidence dict; defaults to a fresh test run
+        (use_cache reuses unchanged criterion results)."""
+        from . import atlascoin
+        from .verifier import run_tests_async
+
         contract = Contract.load(project_dir)
         if not contract or not contract.bounty_id:
             return {"status": "error", "message": "No active bounty"}
 
         if evidence is None:
-            test_results = run_tests(project_dir, contract)
+            test_results = await run_tests_async(project_dir, contract, use_cache=use_cache, on_event=_progress(ctx))
             evidence = {
                 "soul_purpose": contract.soul_purpose,
                 "test_results": test_results,
@@ -123,21 +177,41 @@ def register(mcp: FastMCP) -> None:
         result = await atlascoin.submit_solution(contract.bounty_id, stake, evidence)
 
         if result.get("status") == "ok":
-            contract.status = "submitted"
-            contract.save(project_dir)
+            await _save_status(project_dir, contract, "submitted")
 
         return result
 
     @mcp.tool
-    async def contract_verify(project_dir: str) -> dict:
+    async def contract_verify(
+        project_dir: str,
+        ctx: Context,
+        use_cache: bool = False,
+        fail_fast: bool = False,
+        full_score: bool = False,
+        max_workers: int | None = None,
+    ) -> dict:
         """Run deterministic verification: execute all criteria tests,
-        then submit pass/fail to AtlasCoin."""
+        then submit pass/fail to AtlasCoin. With use_cache, criteria
+        unchanged since the last run reuse cached results.
+        fail_fast, full_score and max_workers work as in contract_run_tests; a
+        short-circuited score counts skipped criteria as failed."""
+        from . import atlascoin
+        from .verifier import run_tests_async
+
         contract = Contract.load(project_dir)
         if not contract:
             return {"status": "error", "message": "No contract found"}
 
         # Run tests locally
-        test_results = run_tests(project_dir, contract)
+        test_results = await run_tests_async(
+            project_dir,
+            contract,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            on_event=_progress(ctx),
+            fail_fast=fail_fast,
+            full_score=full_score,
+        )
 
         verification = {
             "passed": test_results["all_passed"],
@@ -151,17 +225,15 @@ def register(mcp: FastMCP) -> None:
             api_result = await atlascoin.verify_bounty(contract.bounty_id, verification)
             verification["atlascoin"] = api_result
 
-        if test_results["all_passed"]:
-            contract.status = "verified"
-        else:
-            contract.status = "failed_verification"
-        contract.save(project_dir)
+        await _save_status(project_dir, contract, "verified" if test_results["all_passed"] else "failed_verification")
 
         return verification
 
     @mcp.tool
     async def contract_settle(project_dir: str) -> dict:
         """Settle a verified bounty — distribute tokens."""
+        from . import atlascoin
+
         contract = Contract.load(project_dir)
         if not contract or not contract.bounty_id:
             return {"status": "error", "message": "No active bounty to settle"}
@@ -169,8 +241,7 @@ def register(mcp: FastMCP) -> None:
         result = await atlascoin.settle_bounty(contract.bounty_id)
 
         if result.get("status") == "ok":
-            contract.status = "settled"
-            contract.save(project_dir)
+            await _save_status(project_dir, contract, "settled")
 
         return result
 
@@ -188,9 +259,9 @@ def register(mcp: FastMCP) -> None:
         suggestions.append(
             {
                 "name": "has_commits",
-                "type": "git_check",
-                "command": "git log --oneline -1",
-                "pass_when": "exit_code == 0",
+                "type": "git_ref",
+                "pattern": "HEAD",
+                "pass_when": "not_empty",
                 "weight": 1.0,
             }
         )
@@ -265,6 +336,37 @@ def register(mcp: FastMCP) -> None:
         }
 
 
+def _progress(ctx: Context):
+    """on_event callback that reports criterion events as MCP progress."""
+
+    async def on_event(event: dict) -> None:
+        if event["event"] == "start":
+            message = f"{event['name']}: running"
+        elif event["skipped"]:
+            message = f"{event['name']}: skipped"
+        else:
+            message = f"{event['name']}: {'passed' if event['passed'] else 'failed'}"
+            if event["cached"]:
+                message += " (cached)"
+        await ctx.report_progress(event["done"], event["total"], message)
+
+    return on_event
+
+
+async def _save_status(project_dir: str, contract: Contract, status: str) -> None:
+    """Persist a contract status change under the project lock.
+
+    contract.json is re-read inside the lock so a write made by another
+    caller while this one awaited AtlasCoin or the test run is kept; only
+    the status is replaced.
+    """
+    async with project_lock_async(project_dir):
+        current = Contract.load(project_dir) or contract
+        current.status = status
+        current.save(project_dir)
+    contract.status = status
+
+
 def _guess_test_command(signals: dict | None) -> str:
     if not signals:
         return "echo 'No test command configured'"
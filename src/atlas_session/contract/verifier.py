@@ -8,13 +8,47 @@ validated to prevent path traversal.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
+import inspect
+import io
+import json
+import os
 import re
+import selectors
 import shlex
+import signal
 import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
-from ..session.operations import read_context
-from .model import Contract, CriterionType
+from ..common.config import CONTRACT_MAX_WORKERS, SESSION_DIR_NAME
+from ..common.state import read_json, session_dir, write_json
+from ..session.operations import GitProbe, _git_probe, read_context
+from . import expr, native
+from .model import Contract, Criterion, CriterionType
+
+CRITERIA_CACHE_FILENAME = ".criteria-cache.json"
+
+# Per-criterion wall-clock limit for shell and git commands (seconds)
+_SHELL_TIMEOUT = 120
+
+# Shell output kept per criterion: head and tail windows joined by a marker
+_OUTPUT_LIMIT = 500
+_OUTPUT_MARKER = "\n...\n"
+_READ_CHUNK = 65536
+
+# Commands run in their own session so a timeout kills everything they
+# started; without killpg (Windows) only the command itself is killed
+_PROCESS_GROUPS = hasattr(os, "killpg")
+# How often a blocked read checks for a timeout, and how long to wait for a
+# killed command to be reaped (seconds)
+_POLL_INTERVAL = 0.1
+_KILL_GRACE = 1.0
 
 # SECURITY: Allowlist of permitted commands (basename only)
 _ALLOWED_COMMANDS = {
@@ -112,15 +146,133 @@ def _validate_project_dir(project_dir: str) -> tuple[bool, str | None]:
         return False, f"Invalid project directory: {e}"
 
 
-def run_tests(project_dir: str, contract: Contract) -> dict:
-    """Execute all criteria deterministically. Returns structured results."""
-    results: list[dict] = []
+def run_tests(
+    project_dir: str,
+    contract: Contract,
+    max_workers: int | None = None,
+    use_cache: bool = False,
+    on_event: Callable[[dict], Any] | None = None,
+    fail_fast: bool = False,
+    full_score: bool = False,
+) -> dict:
+    """Execute all criteria deterministically. Returns structured results.
+
+    Independent criteria run concurrently on a thread pool of up to
+    ``max_workers`` threads (default ``CONTRACT_MAX_WORKERS``). Criteria
+    flagged ``exclusive`` run alone, and ``depends_on`` criteria wait for
+    their dependencies and are skipped if any of them did not pass.
+    Results are always reported in declaration order.
+
+    With ``use_cache``, shell/git criteria whose definition and inputs are
+    unchanged since a previous run reuse that result (see _ResultCache).
+
+    ``on_event`` receives a start event when a criterion begins running and
+    a finish event for every criterion (see _Progress); start events come
+    from worker threads.
+
+    With ``fail_fast``, criteria run cheapest first (see _waves) and once
+    any criterion fails — so ``all_passed`` is decided — the rest are
+    skipped and the score counts them as failed. ``full_score`` keeps the
+    cheapest-first order but runs everything, for an exact score.
+    """
+    criteria = contract.criteria
+    results: list[dict | None] = [None] * len(criteria)
+    progress = _Progress(criteria, on_event)
+    decided = _Decided(fail_fast and not full_score)
+    facts = _EvalContext(project_dir)
+    batches, blocked = _schedule(criteria)
+    for i, reason in blocked.items():
+        results[i] = _skipped(criteria[i], reason)
+        decided.record(results[i])
+        progress.finish(i, results[i])
+
+    def _started(i: int) -> dict:
+        if decided:
+            return _skipped(criteria[i], _DECIDED)
+        progress.start(i)
+        result = _run_one(project_dir, criteria[i], contract, facts)
+        decided.record(result)
+        return result
+
+    cache = _ResultCache(project_dir, criteria, enabled=use_cache)
+    workers = max(1, max_workers or CONTRACT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wave in _waves(criteria, batches, fail_fast):
+            runnable = []
+            for i in wave:
+                reason = _DECIDED if decided else _unmet_dependency(criteria[i], criteria, results)
+                if reason:
+                    results[i] = _skipped(criteria[i], reason)
+                    progress.finish(i, results[i])
+                elif (hit := cache.get(criteria[i])) is not None:
+                    results[i] = hit
+                    decided.record(hit)
+                    progress.finish(i, hit)
+                else:
+                    runnable.append(i)
+            futures = {pool.submit(_started, i): i for i in runnable}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if not results[i].get("skipped"):
+                    cache.put(criteria[i], results[i])
+                progress.finish(i, results[i])
+
+    cache.save()
+    return _summarize(criteria, results, fail_fast)
+
+
+class _Progress:
+    """Criterion start/finish events for an optional on_event callback.
+
+    Events are dicts: {"event": "start"|"finish", "name", "index", "done",
+    "total"}, and finish events add "passed", "cached" and "skipped".
+    emit methods return whatever the callback returns, so async callers can
+    await coroutine callbacks.
+    """
+
+    def __init__(self, criteria: list[Criterion], on_event: Callable[[dict], Any] | None):
+        self.criteria = criteria
+        self.on_event = on_event
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def start(self, index: int) -> Any:
+        return self._emit({"event": "start", "name": self.criteria[index].name, "index": index})
+
+    def finish(self, index: int, result: dict) -> Any:
+        with self._lock:
+            self.done += 1
+        return self._emit(
+            {
+                "event": "finish",
+                "name": self.criteria[index].name,
+                "index": index,
+                "passed": result["passed"],
+                "cached": result.get("cached", False),
+                "skipped": result.get("skipped", False),
+            }
+        )
+
+    def _emit(self, event: dict) -> Any:
+        if self.on_event is None:
+            return None
+        with self._lock:
+            event["done"], event["total"] = self.done, len(self.criteria)
+        return self.on_event(event)
+
+
+async def _emitted(value: Any) -> None:
+    """Await an on_event callback's return value if it is awaitable."""
+    if inspect.isawaitable(value):
+        await value
+
+
+def _summarize(criteria: list[Criterion], results: list[dict], fail_fast: bool = False) -> dict:
+    """Compute weighted score and summary for a completed run."""
     total_weight = 0.0
     passed_weight = 0.0
-
-    for criterion in contract.criteria:
-        result = _run_one(project_dir, criterion, contract)
-        results.append(result)
+    for criterion, result in zip(criteria, results):
         total_weight += criterion.weight
         if result["passed"]:
             passed_weight += criterion.weight
@@ -128,16 +280,274 @@ def run_tests(project_dir: str, contract: Contract) -> dict:
     all_passed = all(r["passed"] for r in results)
     score = (passed_weight / total_weight * 100) if total_weight > 0 else 0
 
-    return {
+    summary = {
         "results": results,
         "all_passed": all_passed,
         "score": round(score, 1),
         "summary": f"{sum(1 for r in results if r['passed'])}/{len(results)} criteria passed ({score:.0f}%)",
     }
+    if fail_fast:
+        summary["short_circuited"] = any(r["output"] == _DECIDED for r in results)
+    return summary
+
+
+# Relative cost of each criterion type, cheapest first, for fail_fast runs
+_COST = {
+    CriterionType.FILE_EXISTS: 0,
+    CriterionType.GIT_REF: 0,
+    CriterionType.CONTEXT_CHECK: 1,
+    CriterionType.JSON_PATH: 1,
+    CriterionType.GLOB_COUNT: 1,
+    CriterionType.FILE_CONTAINS: 1,
+    CriterionType.FILE_REGEX: 1,
+    CriterionType.LINE_COUNT: 1,
+    CriterionType.GIT_CHECK: 2,
+    CriterionType.SHELL: 3,
+}
+
+_DECIDED = "Skipped: outcome already decided (fail_fast)"
+
+
+def _waves(criteria: list[Criterion], batches: list[list[int]], fail_fast: bool) -> list[list[int]]:
+    """Split scheduled batches into the groups run_tests runs one at a time.
+
+    Normally each batch is one wave. With fail_fast, each batch is split by
+    _COST tier, cheapest first and heaviest weight first within a tier, so
+    a cheap failure is found before any expensive command starts.
+    Dependency order is kept: a batch's waves all run before the next batch.
+    """
+    if not fail_fast:
+        return batches
+    waves: list[list[int]] = []
+    for batch in batches:
+        tiers: dict[int, list[int]] = {}
+        for i in sorted(batch, key=lambda i: (_COST[criteria[i].type], -criteria[i].weight)):
+            tiers.setdefault(_COST[criteria[i].type], []).append(i)
+        waves.extend(tiers.values())
+    return waves
+
+
+class _Decided:
+    """Set once a failure decides all_passed, when short-circuiting is on."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._event = threading.Event()
+
+    def record(self, result: dict) -> None:
+        if self.enabled and not result["passed"]:
+            self._event.set()
+
+    def __bool__(self) -> bool:
+        return self._event.is_set()
+
+
+def _schedule(criteria: list[Criterion]) -> tuple[list[list[int]], dict[int, str]]:
+    """Group criteria indices into batches that are safe to run together.
 
+    A criterion becomes ready once every name in its ``depends_on`` has
+    been scheduled in an earlier batch. Ready non-exclusive criteria share
+    a batch; each exclusive criterion gets a batch of its own.
 
-def _run_one(project_dir: str, criterion, contract: Contract) -> dict:
-    """Run a single criterion and return result dict."""
+    Returns:
+        (batches, blocked) — blocked maps index to the reason it can never
+        run (unknown dependency or dependency cycle).
+    """
+    names = {c.name for c in criteria}
+    blocked: dict[int, str] = {}
+    for i, c in enumerate(criteria):
+        unknown = [d for d in c.depends_on or [] if d not in names]
+        if unknown:
+            blocked[i] = f"Skipped: unknown dependency {', '.join(repr(d) for d in unknown)}"
+
+    scheduled = {criteria[i].name for i in blocked}
+    pending = [i for i in range(len(criteria)) if i not in blocked]
+    batches: list[list[int]] = []
+
+    while pending:
+        ready = [i for i in pending if all(d in scheduled for d in criteria[i].depends_on or [])]
+        if not ready:
+            for i in pending:
+                blocked[i] = "Skipped: dependency cycle"
+            break
+
+        shared = [i for i in ready if not criteria[i].exclusive]
+        if shared:
+            batches.append(shared)
+        batches.extend([i] for i in ready if criteria[i].exclusive)
+
+        scheduled.update(criteria[i].name for i in ready)
+        pending = [i for i in pending if i not in ready]
+
+    return batches, blocked
+
+
+def _unmet_dependency(criterion: Criterion, criteria: list[Criterion], results: list[dict | None]) -> str | None:
+    """Return a skip reason if any dependency of criterion did not pass."""
+    for dep in criterion.depends_on or []:
+        for other, result in zip(criteria, results):
+            if other.name == dep and not (result and result["passed"]):
+                return f"Skipped: dependency '{dep}' did not pass"
+    return None
+
+
+def _skipped(criterion: Criterion, reason: str) -> dict:
+    return {"name": criterion.name, "passed": False, "output": reason, "weight": criterion.weight, "skipped": True}
+
+
+# ---------------------------------------------------------------------------
+# Result cache — skip re-running criteria when nothing they depend on changed
+# ---------------------------------------------------------------------------
+
+
+class _ResultCache:
+    """Shell/git criterion results persisted in session-context/.criteria-cache.json.
+
+    Each entry is keyed by a hash of the criterion definition and stores the
+    fingerprint of its inputs at the time it ran:
+
+    - criteria that declare ``inputs`` (paths or globs) are fingerprinted by
+      the mtime and size of every matching file;
+    - otherwise, in a git repo, by HEAD plus ``git status`` of the working
+      tree (with the mtime/size of each changed file), excluding only this
+      cache file. Gitignored files are invisible to ``git status``, so
+      criteria that check build output should declare ``inputs``;
+    - outside git, criteria without inputs are never cached.
+
+    Timed-out runs are not cached. Entries for criteria no longer in the
+    contract are dropped on save.
+    """
+
+    def __init__(self, project_dir: str, criteria: list[Criterion], enabled: bool = True):
+        self.project_dir = project_dir
+        self.enabled = enabled and any(_cacheable(c) for c in criteria)
+        self.path = session_dir(project_dir) / CRITERIA_CACHE_FILENAME
+        self.entries: dict = {}
+        self.keep: set[str] = set()
+        self.dirty = False
+        self._fingerprints: dict[str, str | None] = {}
+        self._workspace: str | None = None
+        self._workspace_done = False
+        if self.enabled:
+            self.entries = read_json(self.path)
+            self.keep = {_criterion_key(c) for c in criteria}
+
+    def get(self, criterion: Criterion) -> dict | None:
+        """Return the cached result if the criterion's inputs are unchanged."""
+        if not self.enabled or not _cacheable(criterion):
+            return None
+        fingerprint = self._fingerprint(criterion)
+        entry = self.entries.get(_criterion_key(criterion))
+        if fingerprint is None or not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        return {**entry["result"], "cached": True}
+
+    def put(self, criterion: Criterion, result: dict) -> None:
+        if not self.enabled or not _cacheable(criterion) or result["output"].startswith("Command timed out"):
+            return
+        fingerprint = self._fingerprint(criterion)
+        if fingerprint is None:
+            return
+        self.entries[_criterion_key(criterion)] = {"fingerprint": fingerprint, "result": result}
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.enabled or not self.path.parent.is_dir():
+            return
+        pruned = {k: v for k, v in self.entries.items() if k in self.keep}
+        if self.dirty or len(pruned) != len(self.entries):
+            write_json(self.path, pruned)
+
+    def _fingerprint(self, criterion: Criterion) -> str | None:
+        """Fingerprint taken before the criterion first ran, memoized per run."""
+        key = _criterion_key(criterion)
+        if key not in self._fingerprints:
+            if criterion.inputs:
+                self._fingerprints[key] = _inputs_fingerprint(self.project_dir, criterion.inputs)
+            else:
+                if not self._workspace_done:
+                    self._workspace = _workspace_fingerprint(self.project_dir)
+                    self._workspace_done = True
+                self._fingerprints[key] = self._workspace
+        return self._fingerprints[key]
+
+
+def _cacheable(criterion: Criterion) -> bool:
+    return criterion.type in (CriterionType.SHELL, CriterionType.GIT_CHECK)
+
+
+def _criterion_key(criterion: Criterion) -> str:
+    return hashlib.sha256(json.dumps(criterion.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+def _inputs_fingerprint(project_dir: str, patterns: list[str]) -> str:
+    """Hash (path, mtime_ns, size) of every file matching the input patterns.
+
+    A matched directory stands for everything beneath it, so edits to any
+    file inside a listed directory change the fingerprint.
+    """
+    root = Path(project_dir)
+    digest = hashlib.sha256()
+    for pattern in patterns:
+        matches = sorted(root.glob(pattern)) if any(ch in pattern for ch in "*?[") else [root / pattern]
+        digest.update(f"{pattern}\0".encode())
+        for path in (entry for match in matches for entry in _with_contents(match)):
+            try:
+                st = path.stat()
+                digest.update(f"{path.relative_to(root)}:{st.st_mtime_ns}:{st.st_size}\0".encode())
+            except (OSError, ValueError):
+                digest.update(f"{path}:missing\0".encode())
+    return digest.hexdigest()
+
+
+def _with_contents(path: Path) -> list[Path]:
+    """path, followed by everything beneath it if it is a directory."""
+    if path.is_dir() and not path.is_symlink():
+        return [path, *sorted(path.rglob("*"))]
+    return [path]
+
+
+def _workspace_fingerprint(project_dir: str) -> str | None:
+    """Hash git HEAD and working-tree changes, or None outside a git repo."""
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=project_dir, timeout=10)
+        status = subprocess.run(
+            [
+                "git",
+                "status",
+                "--porcelain",
+                "--untracked-files=all",
+                "--",
+                ".",
+                f":(exclude){SESSION_DIR_NAME}/{CRITERIA_CACHE_FILENAME}",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=project_dir,
+            timeout=10,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+    if head.returncode != 0 or status.returncode != 0:
+        return None
+
+    digest = hashlib.sha256(head.stdout.strip().encode())
+    root = Path(project_dir)
+    for line in status.stdout.splitlines():
+        digest.update(f"\0{line}".encode())
+        try:
+            st = (root / line[3:].split(" -> ")[-1].strip('"')).stat()
+            digest.update(f":{st.st_mtime_ns}:{st.st_size}".encode())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _run_one(project_dir: str, criterion: Criterion, contract: Contract, facts: _EvalContext | None = None) -> dict:
+    """Run a single criterion and return result dict.
+
+    ``facts`` is the run's shared _EvalContext; a fresh one is used if omitted.
+    """
     name = criterion.name
     ctype = criterion.type
     pass_when = criterion.pass_when
@@ -146,11 +556,13 @@ def _run_one(project_dir: str, criterion, contract: Contract) -> dict:
         if ctype == CriterionType.SHELL:
             return _run_shell(project_dir, name, criterion.command or "", pass_when, criterion.weight)
         elif ctype == CriterionType.CONTEXT_CHECK:
-            return _run_context_check(project_dir, name, criterion.field or "", pass_when, criterion.weight)
+            return _run_context_check(project_dir, name, criterion.field or "", pass_when, criterion.weight, facts)
         elif ctype == CriterionType.FILE_EXISTS:
             return _run_file_exists(project_dir, name, criterion.path or "", pass_when, criterion.weight)
         elif ctype == CriterionType.GIT_CHECK:
             return _run_shell(project_dir, name, criterion.command or "", pass_when, criterion.weight)
+        elif ctype in native.NATIVE_TYPES:
+            return native.run(project_dir, criterion)
         else:
             return {"name": name, "passed": False, "output": f"Unknown type: {ctype}", "weight": criterion.weight}
     except Exception as e:
@@ -163,6 +575,137 @@ def _run_shell(project_dir: str, name: str, command: str, pass_when: str, weight
     SECURITY: Command is validated against allowlist and project_dir is
     resolved to prevent path traversal attacks.
     """
+    rejected = _reject_shell(project_dir, name, command, weight)
+    if rejected:
+        return rejected
+
+    try:
+        proc = subprocess.Popen(
+            shlex.split(command),
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=_PROCESS_GROUPS,
+        )
+    except Exception as e:
+        return {"name": name, "passed": False, "output": str(e), "weight": weight}
+
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        _kill(proc)
+
+    capture = _OutputCapture()
+    timer = threading.Timer(_SHELL_TIMEOUT, _expire)
+    timer.start()
+    try:
+        _read_until(proc, capture, timed_out)
+        if not timed_out.is_set():
+            proc.wait()
+    finally:
+        timer.cancel()
+        if proc.returncode is None:
+            _kill(proc)
+            try:
+                proc.wait(_KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                pass
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        return {"name": name, "passed": False, "output": f"Command timed out after {_SHELL_TIMEOUT}s", "weight": weight}
+    output = capture.text()
+    passed = _evaluate_pass_when(pass_when, exit_code=proc.returncode, output=output)
+    return {"name": name, "passed": passed, "output": output, "weight": weight}
+
+
+def _kill(proc: subprocess.Popen | asyncio.subprocess.Process) -> None:
+    """Kill a command and, where supported, every process it started."""
+    try:
+        if _PROCESS_GROUPS:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass  # already gone
+
+
+def _read_until(proc: subprocess.Popen, capture: _OutputCapture, stop: threading.Event) -> None:
+    """Feed proc's output to capture until EOF or until stop is set.
+
+    Children that inherited the pipe can keep it open after the command is
+    killed, so the read gives up on stop instead of waiting for EOF.
+    """
+    if not _PROCESS_GROUPS:  # no select() on Windows pipes; kill() ends the read
+        while chunk := proc.stdout.read1(_READ_CHUNK):
+            capture.feed(chunk)
+        return
+    fd = proc.stdout.fileno()
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while not stop.is_set():
+            if selector.select(_POLL_INTERVAL):
+                chunk = os.read(fd, _READ_CHUNK)
+                if not chunk:
+                    return
+                capture.feed(chunk)
+
+
+class _OutputCapture:
+    """Bounded capture of a command's combined stdout/stderr.
+
+    Keeps the first and last characters of the stream rather than all of
+    it, so memory stays flat however much a command prints. text() returns
+    the whitespace-stripped output when it fits in ``limit`` characters,
+    otherwise a head window, _OUTPUT_MARKER and a tail window totalling
+    ``limit``.
+    """
+
+    def __init__(self, limit: int = _OUTPUT_LIMIT):
+        self.limit = limit
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        self._head = ""
+        self._tail = ""  # ends at the last non-whitespace character seen
+        self._pending = ""  # whitespace after it, kept in case more output follows
+        self._total = 0
+        self._end = 0  # stream length up to the last non-whitespace character
+        self._started = False
+
+    def feed(self, data: bytes) -> None:
+        self._add(self._decoder.decode(data))
+
+    def text(self) -> str:
+        self._add(self._decoder.decode(b"", final=True))
+        if self._end <= self.limit:
+            return self._head[: self._end]
+        head = self._head[: self.limit // 2]
+        tail = self._tail[-(self.limit - len(head) - len(_OUTPUT_MARKER)) :]
+        return head + _OUTPUT_MARKER + tail
+
+    def _add(self, text: str) -> None:
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+        start = self._total
+        self._total += len(text)
+        if len(self._head) < self.limit:
+            self._head += text[: self.limit - len(self._head)]
+        content = text.rstrip()
+        if content:
+            self._tail = (self._tail + self._pending + content[-self.limit :])[-self.limit :]
+            self._pending = text[len(content) :][-self.limit :]
+            self._end = start + len(content)
+        else:
+            self._pending = (self._pending + text)[-self.limit :]
+
+
+def _reject_shell(project_dir: str, name: str, command: str, weight: float) -> dict | None:
+    """Return a failed result if command or project_dir fails validation."""
     if not command:
         return {"name": name, "passed": False, "output": "No command specified", "weight": weight}
 
@@ -176,31 +719,205 @@ def _run_shell(project_dir: str, name: str, command: str, pass_when: str, weight
     if not dir_valid:
         return {"name": name, "passed": False, "output": f"Directory rejected: {dir_error}", "weight": weight}
 
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Async runner — used by the async MCP tools so verification never blocks
+# the FastMCP event loop.
+# ---------------------------------------------------------------------------
+
+
+async def run_tests_async(
+    project_dir: str,
+    contract: Contract,
+    max_workers: int | None = None,
+    use_cache: bool = False,
+    on_event: Callable[[dict], Any] | None = None,
+    fail_fast: bool = False,
+    full_score: bool = False,
+) -> dict:
+    """Async counterpart of run_tests with identical scheduling and results.
+
+    Shell and git criteria run via asyncio subprocesses; in-process checks
+    are offloaded to a worker thread. At most ``max_workers`` criteria run
+    at once. Cancelling the caller kills any criterion still running.
+    ``on_event`` is called on the event loop and may be a coroutine
+    function.
+    """
+    criteria = contract.criteria
+    results: list[dict | None] = [None] * len(criteria)
+    progress = _Progress(criteria, on_event)
+    decided = _Decided(fail_fast and not full_score)
+    facts = _EvalContext(project_dir)
+    batches, blocked = _schedule(criteria)
+    for i, reason in blocked.items():
+        results[i] = _skipped(criteria[i], reason)
+        decided.record(results[i])
+        await _emitted(progress.finish(i, results[i]))
+
+    cache = await asyncio.to_thread(_ResultCache, project_dir, criteria, use_cache)
+    semaphore = asyncio.Semaphore(max(1, max_workers or CONTRACT_MAX_WORKERS))
+
+    async def _bounded(i: int) -> None:
+        async with semaphore:
+            if decided:
+                results[i] = _skipped(criteria[i], _DECIDED)
+            else:
+                await _emitted(progress.start(i))
+                results[i] = await _run_one_async(project_dir, criteria[i], contract, facts)
+                cache.put(criteria[i], results[i])
+                decided.record(results[i])
+        await _emitted(progress.finish(i, results[i]))
+
+    for wave in _waves(criteria, batches, fail_fast):
+        runnable = []
+        for i in wave:
+            reason = _DECIDED if decided else _unmet_dependency(criteria[i], criteria, results)
+            if reason:
+                results[i] = _skipped(criteria[i], reason)
+                await _emitted(progress.finish(i, results[i]))
+            elif (hit := await asyncio.to_thread(cache.get, criteria[i])) is not None:
+                results[i] = hit
+                decided.record(hit)
+                await _emitted(progress.finish(i, hit))
+            else:
+                runnable.append(i)
+        await asyncio.gather(*(_bounded(i) for i in runnable))
+
+    await asyncio.to_thread(cache.save)
+    return _summarize(criteria, results, fail_fast)
+
+
+async def _run_one_async(
+    project_dir: str, criterion: Criterion, contract: Contract, facts: _EvalContext | None = None
+) -> dict:
+    """Run a single criterion without blocking the event loop."""
+    if criterion.type in (CriterionType.SHELL, CriterionType.GIT_CHECK):
+        try:
+            return await _run_shell_async(
+                project_dir, criterion.name, criterion.command or "", criterion.pass_when, criterion.weight
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {"name": criterion.name, "passed": False, "output": str(e), "weight": criterion.weight}
+    return await asyncio.to_thread(_run_one, project_dir, criterion, contract, facts)
+
+
+async def _run_shell_async(project_dir: str, name: str, command: str, pass_when: str, weight: float) -> dict:
+    """Async _run_shell: same validation, timeout and output handling.
+
+    Output is drained incrementally into a bounded capture while the
+    process runs, and the process and its children are killed on timeout or
+    cancellation.
+    """
+    rejected = _reject_shell(project_dir, name, command, weight)
+    if rejected:
+        return rejected
+
     try:
-        args = shlex.split(command)
-        proc = subprocess.run(
-            args,
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(command),
             cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=120,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=_PROCESS_GROUPS,
         )
-        output = (proc.stdout + proc.stderr).strip()[:500]
-        passed = _evaluate_pass_when(pass_when, exit_code=proc.returncode, output=output)
-    except subprocess.TimeoutExpired:
-        output = "Command timed out after 120s"
-        passed = False
     except Exception as e:
-        output = str(e)
-        passed = False
+        return {"name": name, "passed": False, "output": str(e), "weight": weight}
 
+    capture = _OutputCapture()
+    finished = False
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(_drain(proc.stdout, capture), proc.wait()),
+            timeout=_SHELL_TIMEOUT,
+        )
+        finished = True
+    except asyncio.TimeoutError:
+        return {"name": name, "passed": False, "output": f"Command timed out after {_SHELL_TIMEOUT}s", "weight": weight}
+    finally:
+        if not finished:
+            # Process.wait() also waits for the pipe to close, which children
+            # that escaped the kill can hold open: bound the wait
+            _kill(proc)
+            try:
+                await asyncio.wait_for(proc.wait(), _KILL_GRACE)
+            except asyncio.TimeoutError:
+                pass
+
+    output = capture.text()
+    passed = _evaluate_pass_when(pass_when, exit_code=proc.returncode, output=output)
     return {"name": name, "passed": passed, "output": output, "weight": weight}
 
 
-def _run_context_check(project_dir: str, name: str, field_name: str, pass_when: str, weight: float) -> dict:
-    """Check a field from read_context output."""
-    ctx = read_context(project_dir)
-    value = ctx.get(field_name)
+async def _drain(stream: asyncio.StreamReader | None, capture: _OutputCapture) -> None:
+    """Read a subprocess pipe to EOF in fixed-size chunks."""
+    if stream is None:
+        return
+    while chunk := await stream.read(_READ_CHUNK):
+        capture.feed(chunk)
+
+
+class _EvalContext:
+    """Project facts computed at most once per run and shared by criteria.
+
+    context_check criteria read fields from here instead of calling
+    read_context each time. Besides the read_context fields, derived
+    fields are available (see _DERIVED_FIELDS); git facts come from one
+    lazy ``git status`` probe. Safe to share across worker threads.
+    """
+
+    def __init__(self, project_dir: str):
+        self.project_dir = project_dir
+        self._lock = threading.Lock()
+        self._context: dict | None = None
+        self._git: GitProbe | None = None
+
+    def context(self) -> dict:
+        with self._lock:
+            if self._context is None:
+                self._context = read_context(self.project_dir)
+            return self._context
+
+    def git(self) -> GitProbe:
+        with self._lock:
+            if self._git is None:
+                self._git = _git_probe(self.project_dir)
+            return self._git
+
+    def get(self, field_name: str):
+        """A read_context or derived field, or None if unknown."""
+        context = self.context()
+        if field_name in context:
+            return context[field_name]
+        derive = _DERIVED_FIELDS.get(field_name)
+        return derive(self) if derive else None
+
+
+_DERIVED_FIELDS: dict[str, Callable[[_EvalContext], Any]] = {
+    "has_soul_purpose": lambda f: bool(f.context()["soul_purpose"]),
+    "is_git": lambda f: f.git().is_git,
+    "git_head": lambda f: f.git().head,
+    "git_branch": lambda f: f.git().branch or None,
+    "git_dirty": lambda f: bool(f.git().files_changed),
+    "git_changed_count": lambda f: len(f.git().files_changed),
+    "git_ahead": lambda f: f.git().ahead,
+    "git_behind": lambda f: f.git().behind,
+}
+
+
+def _run_context_check(
+    project_dir: str,
+    name: str,
+    field_name: str,
+    pass_when: str,
+    weight: float,
+    facts: _EvalContext | None = None,
+) -> dict:
+    """Check a read_context or derived field (see _EvalContext)."""
+    value = (facts or _EvalContext(project_dir)).get(field_name)
 
     if value is None:
         return {"name": name, "passed": False, "output": f"Field '{field_name}' not found", "weight": weight}
@@ -241,59 +958,9 @@ def _evaluate_pass_when(
     - "> 0"
     - "not_empty"
     - "contains:<text>"
+    - comparisons, and/or/not, regex matching and number extraction
+      (see contract/expr.py)
+
+    Expressions are compiled once and cached by text.
     """
-    pw = pass_when.strip()
-
-    if pw == "not_empty":
-        if value is not None:
-            if isinstance(value, (list, dict)):
-                return len(value) > 0
-            return bool(value)
-        return bool(output)
-
-    if pw.startswith("contains:"):
-        text = pw[len("contains:") :]
-        if output:
-            return text in output
-        if isinstance(value, str):
-            return text in value
-        return False
-
-    if "exit_code" in pw:
-        if exit_code is None:
-            return False
-        # "exit_code == 0"
-        try:
-            op_val = pw.split("exit_code")[1].strip()
-            if op_val.startswith("=="):
-                return exit_code == int(op_val[2:].strip())
-            elif op_val.startswith("!="):
-                return exit_code != int(op_val[2:].strip())
-        except (ValueError, IndexError):
-            return False
-
-    # Shorthand numeric comparison: "== 0", "> 0", etc.
-    if pw.startswith("==") or pw.startswith("!=") or pw.startswith(">") or pw.startswith("<"):
-        compare_val = value
-        if compare_val is None and exit_code is not None:
-            compare_val = exit_code
-        if isinstance(compare_val, list):
-            compare_val = len(compare_val)
-        try:
-            num = float(compare_val) if compare_val is not None else 0
-            if pw.startswith("=="):
-                return num == float(pw[2:].strip())
-            elif pw.startswith("!="):
-                return num != float(pw[2:].strip())
-            elif pw.startswith(">="):
-                return num >= float(pw[2:].strip())
-            elif pw.startswith("<="):
-                return num <= float(pw[2:].strip())
-            elif pw.startswith(">"):
-                return num > float(pw[1:].strip())
-            elif pw.startswith("<"):
-                return num < float(pw[1:].strip())
-        except (ValueError, TypeError):
-            return False
-
-    return False
+    return expr.evaluate(pass_when, exit_code=exit_code, value=value, output=output)
@@ -15,6 +15,7 @@ import json
 import logging
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
 
 LICENSE_DIR = Path.home() / ".atlas-session"
@@ -22,18 +23,25 @@ LICENSE_FILE = "license.json"
 CACHE_FILE = ".license_cache"
 CACHE_TTL = 86400  # 24 hours
 
-# HMAC secret for signing license tokens
-# In production, set ATLAS_HMAC_SECRET env var
-_hmac_input = os.environ.get("ATLAS_HMAC_SECRET", "").encode() or b"change-me-in-production"
-if not os.environ.get("ATLAS_HMAC_SECRET"):
-    logging.getLogger(__name__).warning(
-        "ATLAS_HMAC_SECRET not set — using insecure default. Set this in production."
-    )
-_HMAC_SECRET = hmac.new(
-    b"atlas-session-license-v1",
-    _hmac_input,
-    hashlib.sha256,
-).digest()
+
+@lru_cache(maxsize=1)
+def _hmac_secret() -> bytes:
+    """HMAC secret for signing license tokens, derived on first use.
+
+    In production, set ATLAS_HMAC_SECRET env var. Deferred so importing
+    this module (e.g. at server startup) costs nothing and only license
+    operations warn about the insecure default.
+    """
+    hmac_input = os.environ.get("ATLAS_HMAC_SECRET", "").encode() or b"change-me-in-production"
+    if not os.environ.get("ATLAS_HMAC_SECRET"):
+        logging.getLogger(__name__).warning(
+            "ATLAS_HMAC_SECRET not set — using insecure default. Set this in production."
+        )
+    return hmac.new(
+        b"atlas-session-license-v1",
+        hmac_input,
+        hashlib.sha256,
+    ).digest()
 
 
 def _sign_token(customer_id: str, expiry: float) -> str:
@@ -47,7 +55,7 @@ def _sign_token(customer_id: str, expiry: float) -> str:
         Hex-encoded HMAC signature
     """
     message = f"{customer_id}:{expiry}".encode()
-    return hmac.new(_HMAC_SECRET, message, hashlib.sha256).hexdigest()
+    return hmac.new(_hmac_secret(), message, hashlib.sha256).hexdigest()
 
 
 def _verify_token(customer_id: str, expiry: float, signature: str) -> bool:
@@ -9,14 +9,31 @@ Run:
 """
 
 import sys
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
 from . import __version__
 from .contract import tools as contract_tools
+from .session import live
 from .session import tools as session_tools
 from .stripe import tools as stripe_tools
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Release shared resources (AtlasCoin connection pool, live state
+    poller) on shutdown."""
+    try:
+        yield {}
+    finally:
+        live.registry.stop()
+        # Contract tools import the AtlasCoin client lazily; only close it if used
+        atlascoin = sys.modules.get("atlas_session.contract.atlascoin")
+        if atlascoin is not None:
+            await atlascoin.aclose()
+
+
 mcp = FastMCP(
     "Atlas Session Lifecycle",
     version=__version__,
@@ -25,6 +42,7 @@ mcp = FastMCP(
         "Manages session context, soul purpose tracking, governance, "
         "and deterministic contract-based bounty verification."
     ),
+    lifespan=_lifespan,
 )
 
 # Register all domains
@@ -0,0 +1,198 @@
+"""Optional in-memory read model for long-lived servers.
+
+With ATLAS_LIVE_STATE enabled, read-type session tools answer from a
+per-project model of soul purpose, open tasks, features and governance
+sections instead of re-deriving it from disk on every call. A daemon
+thread keeps each model current by polling the stat stamps of
+session-context/ and CLAUDE.md every ATLAS_LIVE_STATE_INTERVAL seconds;
+tools that write call invalidate() so their own changes are visible
+immediately, and edits from elsewhere show up within one interval.
+
+Watching is polling-only: a handful of stats per project per interval
+needs no platform-specific notification API or extra dependency.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from ..common.config import (
+    CLAUDE_MD_NAME,
+    GOVERNANCE_SECTIONS,
+    LIVE_STATE_ENABLED,
+    LIVE_STATE_INTERVAL,
+    LIVE_STATE_MAX_PROJECTS,
+    SESSION_DIR_NAME,
+)
+from ..common.state import is_settled, load_markdown
+from . import operations as ops
+
+
+def _stamps(root: Path) -> tuple | None:
+    """Stat stamps of CLAUDE.md and every session-context/ entry.
+
+    Returns None while any of them is inside the racy mtime window, so the
+    next poll reloads regardless.
+    """
+    sd = root / SESSION_DIR_NAME
+    try:
+        with os.scandir(sd) as it:
+            names = sorted(e.name for e in it)
+    except OSError:
+        names = []
+
+    stamps = []
+    for path in (root / CLAUDE_MD_NAME, sd, *(sd / name for name in names)):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamps.append((str(path), None))
+            continue
+        if not is_settled(st.st_mtime_ns):
+            return None
+        stamps.append((str(path), st.st_mtime_ns, st.st_size, st.st_ino))
+    return tuple(stamps)
+
+
+class LiveState:
+    """Read model for one project, reloaded when its files change."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._loaded_generation = -1
+        self._stamps: tuple | None = None
+        self._context: dict = {}
+        self._features: dict = {}
+        self._governance: dict[str, bool] = {}
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read or poll."""
+        with self._lock:
+            self._generation += 1
+
+    def poll(self) -> None:
+        """Reload if invalidated or any watched stamp changed."""
+        with self._lock:
+            fresh = self._loaded_generation == self._generation and self._stamps is not None
+        if not fresh or _stamps(self.root) != self._stamps:
+            self._reload()
+
+    def read_context(self) -> dict:
+        return copy.deepcopy(self._current()["context"])
+
+    def features_read(self) -> dict:
+        return copy.deepcopy(self._current()["features"])
+
+    def governance(self) -> dict[str, bool]:
+        """Which GOVERNANCE_SECTIONS are present in CLAUDE.md."""
+        return dict(self._current()["governance"])
+
+    def _current(self) -> dict:
+        with self._lock:
+            stale = self._loaded_generation != self._generation
+        if stale:
+            self._reload()
+        with self._lock:
+            return {"context": self._context, "features": self._features, "governance": self._governance}
+
+    def _reload(self) -> None:
+        with self._lock:
+            generation = self._generation
+        # Stamps first: a write landing mid-reload changes them, so the next
+        # poll reloads again instead of keeping a half-updated model.
+        stamps = _stamps(self.root)
+        project_dir = str(self.root)
+        context = ops.read_context(project_dir)
+        features = ops.features_read(project_dir)
+        doc = load_markdown(self.root / CLAUDE_MD_NAME, "replace")
+        governance = {key: doc is not None and doc.find(key)[1] is not None for key in GOVERNANCE_SECTIONS}
+        with self._lock:
+            if generation < self._loaded_generation:
+                return  # a newer reload already finished
+            self._stamps = stamps
+            self._context, self._features, self._governance = context, features, governance
+            self._loaded_generation = generation
+
+
+class LiveStateRegistry:
+    """LRU of watched projects plus the polling thread that refreshes them."""
+
+    def __init__(
+        self,
+        enabled: bool = LIVE_STATE_ENABLED,
+        interval: float = LIVE_STATE_INTERVAL,
+        max_projects: int = LIVE_STATE_MAX_PROJECTS,
+    ):
+        self.enabled = enabled
+        self.interval = interval
+        self.max_projects = max_projects
+        self._states: OrderedDict[Path, LiveState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def lookup(self, project_dir: str) -> LiveState | None:
+        """Live state for project_dir, watching it on first use.
+
+        Returns None when live state is disabled or project_dir is not a
+        directory; callers then read from disk as usual.
+        """
+        if not self.enabled:
+            return None
+        root = Path(project_dir).resolve()
+        if not root.is_dir():
+            return None
+        with self._lock:
+            state = self._states.get(root)
+            if state is None:
+                state = self._states[root] = LiveState(root)
+                while len(self._states) > self.max_projects:
+                    self._states.popitem(last=False)
+            self._states.move_to_end(root)
+            self._start()
+        return state
+
+    def invalidate(self, project_dir: str) -> None:
+        """Mark a watched project stale after a tool wrote to it."""
+        if not self.enabled:
+            return
+        with self._lock:
+            state = self._states.get(Path(project_dir).resolve())
+        if state is not None:
+            state.invalidate()
+
+    def stop(self) -> None:
+        """Stop polling and forget every watched project."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        with self._lock:
+            self._states.clear()
+            self._thread = None
+        self._stop.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _start(self) -> None:
+        # Called with self._lock held
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="atlas-live-state", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                states = list(self._states.values())
+            for state in states:
+                try:
+                    state.poll()
+                except Exception:
+                    state.invalidate()  # retry on the next read or poll
+
+
+registry = LiveStateRegistry()
@@ -8,31 +8,73 @@ SECURITY: All project_dir parameters are resolved and validated to
 prevent path traversal attacks.
 """
 
+import hashlib
 import json
-import shutil
+import os
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 
 from ..common.config import (
-    GOVERNANCE_CACHE_PATH,
+    BATCH_MAX_WORKERS,
+    GOVERNANCE_CACHE_TTL,
     GOVERNANCE_SECTIONS,
+    GOVERNANCE_SPILL,
     LIFECYCLE_STATE_FILENAME,
     REQUIRED_TEMPLATES,
     SESSION_FILES,
     TEMPLATE_DIR,
 )
+from ..common.locks import locked
 from ..common.state import (
+    RootSnapshot,
+    atomic_copy,
+    atomic_write,
     claude_md,
-    find_section,
-    parse_md_sections,
+    doc_cache,
+    is_settled,
+    load_markdown,
+    load_text,
+    read_json,
     session_dir,
+    write_batch,
+    write_json,
 )
 
 # Capability inventory cache constants
 CAPABILITY_CACHE_FILENAME = ".capability-cache.json"
+GOVERNANCE_CACHE_FILENAME = ".governance-cache.json"
+# Hash and stat stamp of the last CLAUDE.md known to hold every governance section
+GOVERNANCE_STATE_FILENAME = ".governance-state.json"
+
+# activeContext task indexes kept in memory, most recently used last
+_TASK_INDEX_SIZE = 32
 CAPABILITY_INVENTORY_FILENAME = "CLAUDE-capability-inventory.md"
 
+# Project signals cache: detected signals plus the stat stamps they came from
+PROJECT_SIGNALS_FILENAME = ".project-signals.json"
+_SIGNAL_MARKERS = (
+    ".",
+    "README.md",
+    "readme.md",
+    "package.json",
+    "pyproject.toml",
+    "Cargo.toml",
+    "go.mod",
+    "src",
+    ".github",
+    ".github/workflows",
+    ".gitlab-ci.yml",
+    "Jenkinsfile",
+    ".circleci",
+)
+
 
 def _resolve_project_dir(project_dir: str) -> Path:
     """Resolve and validate project_dir to prevent path traversal.
@@ -53,13 +95,110 @@ def _resolve_project_dir(project_dir: str) -> Path:
     return path
 
 
+# ---------------------------------------------------------------------------
+# git probe
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class GitProbe:
+    """Repository state gathered by a single ``git status`` call."""
+
+    is_git: bool = False
+    head: str | None = None  # None before the first commit
+    branch: str = ""
+    upstream: str = ""
+    ahead: int = 0
+    behind: int = 0
+    files_changed: list[dict] = field(default_factory=list)
+
+
+def _git_probe(project_dir: str) -> GitProbe:
+    """Branch, HEAD, ahead/behind and changed files from one subprocess.
+
+    Parses ``git status --porcelain=v2 --branch``; changed files use the
+    same {status, file} shape as porcelain v1 (renames as "old -> new").
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            capture_output=True,
+            text=True,
+            cwd=project_dir,
+            timeout=10,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return GitProbe()
+    if proc.returncode != 0:
+        return GitProbe()
+
+    probe = GitProbe(is_git=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid ") :]
+            probe.head = None if oid == "(initial)" else oid
+        elif line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            probe.branch = "HEAD" if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            probe.upstream = line[len("# branch.upstream ") :]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line[len("# branch.ab ") :].split()
+            probe.ahead, probe.behind = int(ahead), abs(int(behind))
+        elif line.startswith("1 "):
+            parts = line.split(" ", 8)
+            probe.files_changed.append({"status": _xy(parts[1]), "file": parts[8]})
+        elif line.startswith("2 "):
+            parts = line.split(" ", 9)
+            path, orig = parts[9].split("\t", 1)
+            probe.files_changed.append({"status": _xy(parts[1]), "file": f"{orig} -> {path}"})
+        elif line.startswith("u "):
+            parts = line.split(" ", 10)
+            probe.files_changed.append({"status": _xy(parts[1]), "file": parts[10]})
+        elif line.startswith("? "):
+            probe.files_changed.append({"status": "??", "file": line[2:]})
+    return probe
+
+
+def _xy(code: str) -> str:
+    """Porcelain v2 XY ("." = unmodified) to the v1 short status."""
+    return code.replace(".", " ").strip()
+
+
+def _rev_parse(project_dir: str, *args: str) -> str | None:
+    """Output of ``git rev-parse args``, or None outside a repo or on error.
+
+    Constant cost regardless of worktree size; use it when only HEAD or
+    repo membership is needed rather than a full _git_probe.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", *args],
+            capture_output=True,
+            text=True,
+            cwd=project_dir,
+            timeout=10,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
 # ---------------------------------------------------------------------------
 # preflight
 # ---------------------------------------------------------------------------
 
 
-def preflight(project_dir: str) -> dict:
-    """Detect environment, return structured data."""
+def preflight(
+    project_dir: str,
+    probe: GitProbe | None = None,
+    snapshot: RootSnapshot | None = None,
+) -> dict:
+    """Detect environment, return structured data.
+
+    Pass an existing git ``probe`` or root ``snapshot`` to reuse them;
+    without a probe, repo membership is a cheap ``rev-parse``.
+    """
     sd = session_dir(project_dir)
     cmd = claude_md(project_dir)
     root = Path(project_dir)
@@ -75,23 +214,16 @@ def preflight(project_dir: str) -> dict:
     }
 
     # Git check
-    try:
-        subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            check=True,
-            cwd=project_dir,
-        )
-        result["is_git"] = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+    result["is_git"] = probe.is_git if probe is not None else _rev_parse(project_dir, "--git-dir") is not None
 
     # Root file count
-    root_files = [f for f in root.iterdir() if f.is_file() and not f.name.startswith("CLAUDE")]
+    if snapshot is None:
+        snapshot = RootSnapshot(root)
+    root_files = _root_files(snapshot)
     result["root_file_count"] = len(root_files)
 
     # Project signals
-    signals = _detect_project_signals(root, root_files)
+    signals = _detect_project_signals(snapshot, root_files)
     result["project_signals"] = signals
 
     # Template validation
@@ -111,8 +243,66 @@ def preflight(project_dir: str) -> dict:
     return result
 
 
-def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
-    """Detect context for brainstorm weight classification."""
+def _root_files(snapshot: RootSnapshot) -> list[Path]:
+    """Regular files in the project root, excluding CLAUDE* files."""
+    return [f for f in snapshot.files if not f.name.startswith("CLAUDE")]
+
+
+def _detect_project_signals(snapshot: RootSnapshot, root_files: list[Path]) -> dict:
+    """Detect context for brainstorm weight classification.
+
+    Signals are persisted in session-context/ with the stat stamps of every
+    marker they depend on (the root and src/ directories cover files being
+    added or removed), so a repeat call costs a few stats unless a marker
+    changed.
+    """
+    root = snapshot.path
+    cache_path = session_dir(str(root)) / PROJECT_SIGNALS_FILENAME
+    stamps = _signal_stamps(root)
+    cached = read_json(cache_path)
+    if cached.get("stamps") == stamps and isinstance(cached.get("signals"), dict):
+        signals = dict(cached["signals"])
+        signals["detected_stack"] = list(signals.get("detected_stack", []))
+    else:
+        signals = _scan_project_signals(snapshot)
+        settled = all(stamp is None or is_settled(stamp[0]) for stamp in stamps.values())
+        if settled and cache_path.parent.is_dir():
+            try:
+                write_json(cache_path, {"stamps": stamps, "signals": signals})
+            except OSError:
+                pass
+
+    # Empty project detection — depends on the caller's root file filter
+    has_manifests = any(
+        [
+            signals["has_readme"],
+            signals["has_package_json"],
+            signals["has_pyproject"],
+            signals["has_cargo_toml"],
+            signals["has_go_mod"],
+        ]
+    )
+    signals["is_empty_project"] = not signals["has_code_files"] and not has_manifests and len(root_files) <= 2
+
+    return signals
+
+
+def _signal_stamps(root: Path) -> dict[str, list[int] | None]:
+    """(mtime_ns, size) of each signal marker, None where missing."""
+    stamps: dict[str, list[int] | None] = {}
+    for name in _SIGNAL_MARKERS:
+        try:
+            st = os.stat(root / name)
+        except OSError:
+            stamps[name] = None
+        else:
+            stamps[name] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+
+def _scan_project_signals(snapshot: RootSnapshot) -> dict:
+    """Read README/package.json and probe marker files for project signals."""
+    root = snapshot.path
     signals: dict = {
         "has_readme": False,
         "readme_excerpt": "",
@@ -128,10 +318,9 @@ def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
     }
 
     # README detection
-    readme = root / "README.md"
-    if not readme.is_file():
-        readme = root / "readme.md"
-    if readme.is_file():
+    readme_name = "README.md" if snapshot.is_file("README.md") else "readme.md"
+    readme = root / readme_name
+    if snapshot.is_file(readme_name):
         signals["has_readme"] = True
         try:
             lines = readme.read_text(errors="replace").split("\n")
@@ -142,7 +331,7 @@ def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
 
     # package.json
     pkg = root / "package.json"
-    if pkg.is_file():
+    if snapshot.is_file("package.json"):
         signals["has_package_json"] = True
         try:
             data = json.loads(pkg.read_text(errors="replace"))
@@ -152,13 +341,13 @@ def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
             pass
 
     # Stack marker files
-    if (root / "pyproject.toml").is_file():
+    if snapshot.is_file("pyproject.toml"):
         signals["has_pyproject"] = True
         signals["detected_stack"].append("python")
-    if (root / "Cargo.toml").is_file():
+    if snapshot.is_file("Cargo.toml"):
         signals["has_cargo_toml"] = True
         signals["detected_stack"].append("rust")
-    if (root / "go.mod").is_file():
+    if snapshot.is_file("go.mod"):
         signals["has_go_mod"] = True
         signals["detected_stack"].append("go")
     if signals["has_package_json"]:
@@ -166,49 +355,34 @@ def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
 
     # Code file detection
     code_exts = {".py", ".js", ".ts", ".rs", ".go", ".jsx", ".tsx"}
-    search_dirs = [root]
-    if (root / "src").is_dir():
-        search_dirs.append(root / "src")
+    search_dirs = [snapshot, snapshot.child("src")]
     for d in search_dirs:
-        try:
-            for f in d.iterdir():
-                if f.is_file() and f.suffix in code_exts:
-                    signals["has_code_files"] = True
-                    if f.suffix == ".py" and "python" not in signals["detected_stack"]:
-                        signals["detected_stack"].append("python")
-                    elif f.suffix in (".js", ".jsx", ".ts", ".tsx") and "node" not in signals["detected_stack"]:
-                        signals["detected_stack"].append("node")
-                    break
-        except PermissionError:
-            pass
+        if d is None:
+            continue
+        for f in d.files:
+            if f.suffix in code_exts:
+                signals["has_code_files"] = True
+                if f.suffix == ".py" and "python" not in signals["detected_stack"]:
+                    signals["detected_stack"].append("python")
+                elif f.suffix in (".js", ".jsx", ".ts", ".tsx") and "node" not in signals["detected_stack"]:
+                    signals["detected_stack"].append("node")
+                break
 
     # CI provider detection
     ci_indicators = [
-        (root / ".github" / "workflows", "github-actions"),
-        (root / ".gitlab-ci.yml", "gitlab-ci"),
-        (root / "Jenkinsfile", "jenkins"),
-        (root / ".circleci", "circleci"),
+        (snapshot.is_dir(".github") and (root / ".github" / "workflows").exists(), "github-actions"),
+        (snapshot.exists(".gitlab-ci.yml"), "gitlab-ci"),
+        (snapshot.exists("Jenkinsfile"), "jenkins"),
+        (snapshot.exists(".circleci"), "circleci"),
     ]
     signals["has_ci"] = False
     signals["ci_provider"] = ""
-    for ci_path, provider in ci_indicators:
-        if ci_path.exists():
+    for present, provider in ci_indicators:
+        if present:
             signals["has_ci"] = True
             signals["ci_provider"] = provider
             break
 
-    # Empty project detection
-    has_manifests = any(
-        [
-            signals["has_readme"],
-            signals["has_package_json"],
-            signals["has_pyproject"],
-            signals["has_cargo_toml"],
-            signals["has_go_mod"],
-        ]
-    )
-    signals["is_empty_project"] = not signals["has_code_files"] and not has_manifests and len(root_files) <= 2
-
     return signals
 
 
@@ -217,13 +391,17 @@ def _detect_project_signals(root: Path, root_files: list[Path]) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@locked
 def init(
     project_dir: str,
     soul_purpose: str,
     ralph_mode: str = "Manual",
     ralph_intensity: str = "",
 ) -> dict:
-    """Bootstrap session-context with templates and soul purpose."""
+    """Bootstrap session-context with templates and soul purpose.
+
+    All session files are written as one atomic batch.
+    """
     sd = session_dir(project_dir)
 
     if not TEMPLATE_DIR.is_dir():
@@ -235,47 +413,49 @@ def init(
 
     sd.mkdir(exist_ok=True)
 
-    # Copy templates (session files only)
-    for f in SESSION_FILES:
-        src = TEMPLATE_DIR / f
-        dst = sd / f
-        if src.is_file():
-            shutil.copy2(src, dst)
-
-    # Migrate old root-level files
-    root = Path(project_dir)
-    for f in SESSION_FILES:
-        root_file = root / f
-        session_file = sd / f
-        if root_file.is_file():
-            if not session_file.is_file():
-                root_file.rename(session_file)
-            else:
-                root_file.unlink()
-
-    # Write soul purpose
-    sp_file = sd / "CLAUDE-soul-purpose.md"
-    sp_file.write_text(f"# Soul Purpose\n\n{soul_purpose}\n")
+    with write_batch():
+        # Copy templates (session files only)
+        for f in SESSION_FILES:
+            src = TEMPLATE_DIR / f
+            dst = sd / f
+            if src.is_file():
+                atomic_copy(src, dst)
 
-    # Seed active context
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    ac_file = sd / "CLAUDE-activeContext.md"
-    ac_file.write_text(
-        f"# Active Context\n\n"
-        f"**Last Updated**: {today}\n"
-        f"**Current Goal**: {soul_purpose}\n\n"
-        f"## Current Session\n"
-        f"- **Started**: {today}\n"
-        f"- **Focus**: {soul_purpose}\n"
-        f"- **Status**: Initialized\n\n"
-        f"## Progress\n"
-        f"- [x] Session initialized via /start\n"
-        f"- [ ] Begin working on soul purpose\n\n"
-        f"## Notes\n"
-        f"- Soul purpose established: {today}\n"
-        f"- Ralph Loop preference: {ralph_mode}\n"
-        f"- Ralph Loop intensity: {ralph_intensity or 'N/A'}\n"
-    )
+        # Migrate old root-level files
+        root = Path(project_dir)
+        for f in SESSION_FILES:
+            root_file = root / f
+            session_file = sd / f
+            if root_file.is_file():
+                if not session_file.is_file():
+                    root_file.rename(session_file)
+                else:
+                    root_file.unlink()
+
+        # Write soul purpose
+        sp_file = sd / "CLAUDE-soul-purpose.md"
+        atomic_write(sp_file, f"# Soul Purpose\n\n{soul_purpose}\n")
+
+        # Seed active context
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        ac_file = sd / "CLAUDE-activeContext.md"
+        atomic_write(
+            ac_file,
+            f"# Active Context\n\n"
+            f"**Last Updated**: {today}\n"
+            f"**Current Goal**: {soul_purpose}\n\n"
+            f"## Current Session\n"
+            f"- **Started**: {today}\n"
+            f"- **Focus**: {soul_purpose}\n"
+            f"- **Status**: Initialized\n\n"
+            f"## Progress\n"
+            f"- [x] Session initialized via /start\n"
+            f"- [ ] Begin working on soul purpose\n\n"
+            f"## Notes\n"
+            f"- Soul purpose established: {today}\n"
+            f"- Ralph Loop preference: {ralph_mode}\n"
+            f"- Ralph Loop intensity: {ralph_intensity or 'N/A'}\n",
+        )
 
     created = [f for f in SESSION_FILES if (sd / f).is_file()]
     return {
@@ -290,6 +470,7 @@ def init(
 # ---------------------------------------------------------------------------
 
 
+@locked
 def validate(project_dir: str) -> dict:
     """Validate session-context files, repair from templates if needed."""
     sd = session_dir(project_dir)
@@ -305,7 +486,7 @@ def validate(project_dir: str) -> dict:
         else:
             src = TEMPLATE_DIR / f
             if src.is_file():
-                shutil.copy2(src, path)
+                atomic_copy(src, path)
                 results["repaired"].append(f)
             else:
                 results["failed"].append(f)
@@ -319,29 +500,100 @@ def validate(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+class _GovernanceCache:
+    """Cached governance sections per project: (sections, content hash, cached_at).
+
+    Entries live in server memory so restore_governance needs no disk read;
+    entries older than GOVERNANCE_CACHE_TTL (flows that never restored)
+    are dropped whenever another project caches.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[dict[str, str], str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[dict[str, str], str, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or _governance_cache_expired(entry[2]):
+            return None
+        return entry
+
+    def put(self, key: str, sections: dict[str, str], digest: str) -> float:
+        now = time.time()
+        with self._lock:
+            for stale in [k for k, e in self._entries.items() if _governance_cache_expired(e[2])]:
+                del self._entries[stale]
+            self._entries[key] = (sections, digest, now)
+        return now
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_governance_cache = _GovernanceCache()
+
+
+def governance_cache_path(project_dir: str) -> Path:
+    """Spill file for project_dir's cached governance sections."""
+    return session_dir(project_dir) / GOVERNANCE_CACHE_FILENAME
+
+
+def _governance_cache_expired(cached_at: float) -> bool:
+    return time.time() - cached_at > GOVERNANCE_CACHE_TTL
+
+
+def _governance_digest(sections: dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(sections, sort_keys=True).encode()).hexdigest()
+
+
+def _load_governance_spill(cache_path: Path) -> dict[str, str] | None:
+    """Sections from a spill file written by this or another server process."""
+    data = read_json(cache_path)
+    sections, cached_at = data.get("sections"), data.get("cached_at")
+    if not isinstance(sections, dict) or not isinstance(cached_at, (int, float)):
+        return None
+    if _governance_cache_expired(cached_at) or data.get("hash") != _governance_digest(sections):
+        return None
+    return sections
+
+
+@locked
 def cache_governance(project_dir: str) -> dict:
-    """Extract governance sections from CLAUDE.md, save to temp cache."""
+    """Extract governance sections from CLAUDE.md into the project's cache.
+
+    Sections are held in memory, keyed by project, and (with
+    ATLAS_GOVERNANCE_SPILL) also written to session-context/ so a restore
+    from a restarted or different server process still finds them.
+    """
     cmd = claude_md(project_dir)
     if not cmd.is_file():
         return {"status": "error", "message": "CLAUDE.md not found"}
 
-    content = cmd.read_text()
-    sections = parse_md_sections(content)
+    doc = load_markdown(cmd)
 
     cached: dict[str, str] = {}
     governance_keys = list(GOVERNANCE_SECTIONS.keys())
 
     for key in governance_keys:
-        _, body = find_section(sections, key)
+        _, body = doc.find(key)
         if body:
             cached[key] = body
 
-    GOVERNANCE_CACHE_PATH.write_text(json.dumps(cached, indent=2))
+    digest = _governance_digest(cached)
+    cached_at = _governance_cache.put(str(Path(project_dir).resolve()), cached, digest)
+
+    cache_path = governance_cache_path(project_dir)
+    spilled = GOVERNANCE_SPILL and cache_path.parent.is_dir()
+    if spilled:
+        atomic_write(cache_path, json.dumps({"hash": digest, "cached_at": cached_at, "sections": cached}))
     return {
         "status": "ok",
         "cached_sections": list(cached.keys()),
         "missing_sections": [k for k in governance_keys if k not in cached],
-        "cache_file": str(GOVERNANCE_CACHE_PATH),
+        "content_hash": digest,
+        "cache_file": str(cache_path) if spilled else None,
     }
 
 
@@ -350,6 +602,65 @@ def cache_governance(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _governance_unchanged(project_dir: str, cmd: Path) -> bool:
+    """True if CLAUDE.md is the text last recorded as governance-complete.
+
+    A matching stat stamp skips reading the file at all; otherwise a
+    matching size and content hash skips parsing it (and refreshes the
+    recorded stamp).
+    """
+    state_path = session_dir(project_dir) / GOVERNANCE_STATE_FILENAME
+    record = read_json(state_path)
+    if record.get("sections") != list(GOVERNANCE_SECTIONS):
+        return False
+    try:
+        st = os.stat(cmd)
+    except OSError:
+        return False
+    stamp = [st.st_mtime_ns, st.st_size, st.st_ino]
+    if record.get("stamp") == stamp:
+        return True
+    if record.get("size") != st.st_size:
+        return False
+    text = load_text(cmd)
+    if text is None or hashlib.sha256(text.encode()).hexdigest() != record.get("hash"):
+        return False
+    if is_settled(st.st_mtime_ns):
+        _write_governance_state(state_path, {**record, "stamp": stamp})
+    return True
+
+
+def _record_governance_complete(project_dir: str, cmd: Path, content: str) -> None:
+    """Remember that CLAUDE.md with this content has every governance section.
+
+    The stat stamp is only recorded once it is outside the racy window;
+    until then the next call compares the content hash instead.
+    """
+    state_path = session_dir(project_dir) / GOVERNANCE_STATE_FILENAME
+    if not state_path.parent.is_dir():
+        return
+    try:
+        st = os.stat(cmd)
+    except OSError:
+        return
+    record = {
+        "sections": list(GOVERNANCE_SECTIONS),
+        "hash": hashlib.sha256(content.encode()).hexdigest(),
+        "size": st.st_size,
+        "stamp": [st.st_mtime_ns, st.st_size, st.st_ino] if is_settled(st.st_mtime_ns) else None,
+    }
+    if read_json(state_path) != record:
+        _write_governance_state(state_path, record)
+
+
+def _write_governance_state(state_path: Path, record: dict) -> None:
+    try:
+        write_json(state_path, record)
+    except OSError:
+        pass  # the record is only an optimization
+
+
+@locked
 def restore_governance(project_dir: str) -> dict:
     """Restore governance sections to CLAUDE.md from cache."""
     cmd = claude_md(project_dir)
@@ -357,28 +668,37 @@ def restore_governance(project_dir: str) -> dict:
     if not cmd.is_file():
         template = TEMPLATE_DIR / "CLAUDE-mdReference.md"
         if template.is_file():
-            shutil.copy2(template, cmd)
+            atomic_copy(template, cmd)
         else:
             return {"status": "error", "message": "CLAUDE.md and template both missing"}
 
-    if not GOVERNANCE_CACHE_PATH.is_file():
+    project_key = str(Path(project_dir).resolve())
+    cache_path = governance_cache_path(project_dir)
+    entry = _governance_cache.get(project_key)
+    cached = entry[0] if entry is not None else _load_governance_spill(cache_path)
+    if cached is None:
+        _governance_cache.discard(project_key)
+        cache_path.unlink(missing_ok=True)
         return {"status": "error", "message": "No governance cache found. Run cache-governance first."}
 
-    cached = json.loads(GOVERNANCE_CACHE_PATH.read_text())
-    content = cmd.read_text()
-    sections = parse_md_sections(content)
-
     restored: list[str] = []
-    for key, cached_content in cached.items():
-        heading, _ = find_section(sections, key)
-        if heading is None:
-            content = content.rstrip() + f"\n\n---\n\n{cached_content}\n"
-            restored.append(key)
+    if not _governance_unchanged(project_dir, cmd):
+        doc = load_markdown(cmd)
+        content = doc.text
+
+        for key, cached_content in cached.items():
+            heading, _ = doc.find(key)
+            if heading is None:
+                content = content.rstrip() + f"\n\n---\n\n{cached_content}\n"
+                restored.append(key)
 
-    if restored:
-        cmd.write_text(content)
+        if restored:
+            atomic_write(cmd, content)
+        if all(k in cached or doc.find(k)[0] is not None for k in GOVERNANCE_SECTIONS):
+            _record_governance_complete(project_dir, cmd, content)
 
-    GOVERNANCE_CACHE_PATH.unlink(missing_ok=True)
+    _governance_cache.discard(project_key)
+    cache_path.unlink(missing_ok=True)
 
     return {
         "status": "ok",
@@ -392,6 +712,7 @@ def restore_governance(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@locked
 def ensure_governance(
     project_dir: str,
     ralph_mode: str = "Manual",
@@ -403,16 +724,19 @@ def ensure_governance(
     if not cmd.is_file():
         template = TEMPLATE_DIR / "CLAUDE-mdReference.md"
         if template.is_file():
-            shutil.copy2(template, cmd)
+            atomic_copy(template, cmd)
         else:
-            cmd.write_text("# CLAUDE.md\n\nThis file provides guidance to Claude Code.\n")
+            atomic_write(cmd, "# CLAUDE.md\n\nThis file provides guidance to Claude Code.\n")
+
+    if _governance_unchanged(project_dir, cmd):
+        return {"status": "ok", "added": [], "already_present": list(GOVERNANCE_SECTIONS)}
 
-    content = cmd.read_text()
-    sections = parse_md_sections(content)
+    doc = load_markdown(cmd)
+    content = doc.text
 
     added: list[str] = []
     for key, template_content in GOVERNANCE_SECTIONS.items():
-        heading, _ = find_section(sections, key)
+        heading, _ = doc.find(key)
         if heading is None:
             section_text = template_content.format(
                 ralph_mode=ralph_mode,
@@ -422,7 +746,8 @@ def ensure_governance(
             added.append(key)
 
     if added:
-        cmd.write_text(content)
+        atomic_write(cmd, content)
+    _record_governance_complete(project_dir, cmd, content)
 
     return {
         "status": "ok",
@@ -436,8 +761,13 @@ def ensure_governance(
 # ---------------------------------------------------------------------------
 
 
-def read_context(project_dir: str) -> dict:
-    """Read soul purpose + active context, return structured summary."""
+def read_context(project_dir: str, task_limit: int | None = None, task_offset: int = 0) -> dict:
+    """Read soul purpose + active context, return structured summary.
+
+    open_tasks and recent_progress are paged by task_limit/task_offset
+    (None: no limit); open_task_count and recent_progress_count are the
+    totals.
+    """
     sd = session_dir(project_dir)
     cmd = claude_md(project_dir)
 
@@ -447,6 +777,8 @@ def read_context(project_dir: str) -> dict:
         "active_context_summary": "",
         "open_tasks": [],
         "recent_progress": [],
+        "open_task_count": 0,
+        "recent_progress_count": 0,
         "status_hint": "unknown",
         "ralph_mode": "",
         "ralph_intensity": "",
@@ -454,46 +786,28 @@ def read_context(project_dir: str) -> dict:
 
     # Read soul purpose
     sp_file = sd / "CLAUDE-soul-purpose.md"
-    if sp_file.is_file():
-        sp_content = sp_file.read_text(errors="replace")
-        lines = sp_content.split("\n")
-        purpose_lines: list[str] = []
-        for line in lines:
-            if "[CLOSED]" in line:
-                result["has_archived_purposes"] = True
-                break
-            if (
-                line.strip()
-                and not line.startswith("#")
-                and line.strip() != "---"
-                and not line.strip().startswith("<!--")
-            ):
-                purpose_lines.append(line.strip())
-        result["soul_purpose"] = " ".join(purpose_lines).strip()
+    soul = doc_cache.get(sp_file, _parse_soul_purpose, "replace")
+    if soul is not None:
+        result["soul_purpose"], result["has_archived_purposes"] = soul
 
         if "(No active soul purpose)" in result["soul_purpose"] or not result["soul_purpose"]:
             result["soul_purpose"] = ""
             result["status_hint"] = "no_purpose"
 
-    # Read active context (first 60 lines)
-    ac_file = sd / "CLAUDE-activeContext.md"
-    if ac_file.is_file():
-        ac_content = ac_file.read_text(errors="replace")
-        ac_lines = ac_content.split("\n")[:60]
-        result["active_context_summary"] = "\n".join(ac_lines)
-
-        for line in ac_content.split("\n"):
-            stripped = line.strip()
-            if "[ ]" in stripped:
-                result["open_tasks"].append(stripped.lstrip("- "))
-            elif "[x]" in stripped.lower():
-                result["recent_progress"].append(stripped.lstrip("- "))
+    # Read active context (first 60 lines) and its checkbox tasks
+    index = _task_index(sd)
+    if index is not None:
+        start = max(task_offset, 0)
+        stop = None if task_limit is None else start + max(task_limit, 0)
+        result["active_context_summary"] = index.summary
+        result["open_tasks"] = list(index.open[start:stop])
+        result["recent_progress"] = list(index.done[start:stop])
+        result["open_task_count"] = len(index.open)
+        result["recent_progress_count"] = len(index.done)
 
     # Extract ralph config from CLAUDE.md
     if cmd.is_file():
-        md_content = cmd.read_text()
-        md_sections = parse_md_sections(md_content)
-        _, ralph_body = find_section(md_sections, "Ralph Loop")
+        _, ralph_body = load_markdown(cmd).find("Ralph Loop")
         if ralph_body:
             for line in ralph_body.split("\n"):
                 if line.strip().startswith("**Mode**:"):
@@ -504,6 +818,136 @@ def read_context(project_dir: str) -> dict:
     return result
 
 
+def page_tasks(context: dict, task_limit: int | None = None, task_offset: int = 0) -> dict:
+    """Copy of a read_context result with its task lists paged."""
+    if task_limit is None and not task_offset:
+        return context
+    start = max(task_offset, 0)
+    stop = None if task_limit is None else start + max(task_limit, 0)
+    return {
+        **context,
+        "open_tasks": context["open_tasks"][start:stop],
+        "recent_progress": context["recent_progress"][start:stop],
+    }
+
+
+def _parse_soul_purpose(content: str) -> tuple[str, bool]:
+    """Return (active purpose text, has [CLOSED] archives)."""
+    purpose_lines: list[str] = []
+    has_archived = False
+    for line in content.split("\n"):
+        if "[CLOSED]" in line:
+            has_archived = True
+            break
+        if line.strip() and not line.startswith("#") and line.strip() != "---" and not line.strip().startswith("<!--"):
+            purpose_lines.append(line.strip())
+    return " ".join(purpose_lines).strip(), has_archived
+
+
+@dataclass(frozen=True)
+class _TaskIndex:
+    """Summary and checkbox tasks of an activeContext file.
+
+    open/done cover the first ``size`` bytes (complete lines only), whose
+    sha256 is ``digest``. ``stamp`` is the file's stat stamp once settled
+    and fully covered, else None.
+    """
+
+    stamp: tuple | None
+    size: int
+    digest: str
+    summary: str
+    open: tuple[str, ...]
+    done: tuple[str, ...]
+
+
+_task_indexes: OrderedDict[str, _TaskIndex] = OrderedDict()
+_task_indexes_lock = threading.Lock()
+
+
+def _task_index(sd: Path) -> _TaskIndex | None:
+    """Task index of CLAUDE-activeContext.md, kept in server memory.
+
+    A matching stat stamp serves the cached index without reading the file.
+    Otherwise, when the file still starts with the indexed bytes, only the
+    lines appended since are parsed; any other change rebuilds the index.
+    """
+    ac_file = sd / "CLAUDE-activeContext.md"
+    try:
+        st = os.stat(ac_file)
+    except OSError:
+        return None
+    key = str(ac_file)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _task_indexes_lock:
+        index = _task_indexes.get(key)
+    if index is not None and index.stamp == stamp:
+        return index
+
+    try:
+        data = ac_file.read_bytes()
+    except OSError:
+        return None
+    size = index.size if index is not None and index.size <= len(data) else 0
+    hasher = hashlib.sha256(memoryview(data)[:size])
+    if index is None or hasher.hexdigest() != index.digest:
+        index, size, hasher = None, 0, hashlib.sha256()
+
+    # Complete lines are indexed; a trailing partial line may still grow
+    end = max(data.rfind(b"\n") + 1, size)
+    new_open, new_done = _scan_tasks(data, size, end)
+    hasher.update(memoryview(data)[size:end])
+    head = data[: _nth_newline(data, 60)].decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+    fresh = _TaskIndex(
+        stamp=stamp if is_settled(st.st_mtime_ns) and end == len(data) else None,
+        size=end,
+        digest=hasher.hexdigest(),
+        summary="\n".join(head.split("\n")[:60]),
+        open=(index.open if index is not None else ()) + new_open,
+        done=(index.done if index is not None else ()) + new_done,
+    )
+    with _task_indexes_lock:
+        _task_indexes[key] = fresh
+        _task_indexes.move_to_end(key)
+        while len(_task_indexes) > _TASK_INDEX_SIZE:
+            _task_indexes.popitem(last=False)
+    if end == len(data):
+        return fresh
+    tail_open, tail_done = _scan_tasks(data, end, len(data))
+    return replace(fresh, open=fresh.open + tail_open, done=fresh.done + tail_done)
+
+
+def _scan_tasks(data: bytes, start: int, end: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(open, done) checkbox task texts in data[start:end]."""
+    open_tasks: list[str] = []
+    done_tasks: list[str] = []
+    offset = start
+    while offset < end:
+        newline = data.find(b"\n", offset, end)
+        stop = end if newline == -1 else newline
+        chunk = data[offset:stop]
+        if b"[" in chunk:
+            for line in chunk.decode("utf-8", "replace").split("\r"):
+                stripped = line.strip()
+                if "[ ]" in stripped:
+                    open_tasks.append(stripped.lstrip("- "))
+                elif "[x]" in stripped.lower():
+                    done_tasks.append(stripped.lstrip("- "))
+        offset = stop + 1
+    return tuple(open_tasks), tuple(done_tasks)
+
+
+def _nth_newline(data: bytes, n: int) -> int:
+    """Offset just past the nth newline, or len(data) if there are fewer."""
+    pos = 0
+    for _ in range(n):
+        found = data.find(b"\n", pos)
+        if found == -1:
+            return len(data)
+        pos = found + 1
+    return pos
+
+
 # ---------------------------------------------------------------------------
 # harvest
 # ---------------------------------------------------------------------------
@@ -516,9 +960,8 @@ def harvest(project_dir: str) -> dict:
     if not ac_file.is_file():
         return {"status": "nothing", "message": "No active context file."}
 
-    ac_content = ac_file.read_text()
-    template_path = TEMPLATE_DIR / "CLAUDE-activeContext.md"
-    template = template_path.read_text() if template_path.is_file() else ""
+    ac_content = load_text(ac_file)
+    template = load_text(TEMPLATE_DIR / "CLAUDE-activeContext.md") or ""
 
     if ac_content.strip() == template.strip() or len(ac_content.strip()) < 100:
         return {"status": "nothing", "message": "Active context is in template state."}
@@ -539,19 +982,24 @@ def harvest(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@locked
+@write_batch()
 def archive(
     project_dir: str,
     old_purpose: str,
     new_purpose: str = "",
 ) -> dict:
-    """Archive soul purpose and optionally set new one. Reset active context."""
+    """Archive soul purpose and optionally set new one. Reset active context.
+
+    Both files are replaced in one atomic batch.
+    """
     sd = session_dir(project_dir)
     sp_file = sd / "CLAUDE-soul-purpose.md"
     if not sp_file.is_file():
         return {"status": "error", "message": "Soul purpose file not found."}
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    existing = sp_file.read_text()
+    existing = load_text(sp_file)
 
     archived_block = f"## [CLOSED] \u2014 {today}\n\n{old_purpose}\n"
 
@@ -569,15 +1017,15 @@ def archive(
                 new_content = new_content.rstrip() + f"\n\n{old_archives}\n"
                 break
 
-    sp_file.write_text(new_content)
+    atomic_write(sp_file, new_content)
 
     # Reset active context from template
     ac_template = TEMPLATE_DIR / "CLAUDE-activeContext.md"
     ac_file = sd / "CLAUDE-activeContext.md"
     if ac_template.is_file():
-        shutil.copy2(ac_template, ac_file)
+        atomic_copy(ac_template, ac_file)
     else:
-        ac_file.write_text(f"# Active Context\n\n**Last Updated**: {today}\n")
+        atomic_write(ac_file, f"# Active Context\n\n**Last Updated**: {today}\n")
 
     return {
         "status": "ok",
@@ -723,10 +1171,11 @@ def _categorize_file(filename: str) -> tuple[str | None, str]:
     return "docs/archive", "uncategorized"
 
 
-def check_clutter(project_dir: str) -> dict:
+def check_clutter(project_dir: str, snapshot: RootSnapshot | None = None) -> dict:
     """Scan root directory for files that violate structure rules."""
-    root = Path(project_dir)
-    root_files = sorted(f for f in root.iterdir() if f.is_file() and not f.name.startswith("CLAUDE"))
+    if snapshot is None:
+        snapshot = RootSnapshot(project_dir)
+    root_files = _root_files(snapshot)
 
     clutter: list[dict] = []
     whitelisted: list[str] = []
@@ -821,6 +1270,7 @@ def classify_brainstorm(directive: str, project_signals: dict) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@locked
 def hook_activate(project_dir: str, soul_purpose: str) -> dict:
     """Write lifecycle state to session-context/.lifecycle-active.json.
 
@@ -839,7 +1289,7 @@ def hook_activate(project_dir: str, soul_purpose: str) -> dict:
     }
 
     state_file = sd / LIFECYCLE_STATE_FILENAME
-    state_file.write_text(json.dumps(state, indent=2))
+    atomic_write(state_file, json.dumps(state, indent=2))
 
     return {"status": "ok", "file": str(state_file)}
 
@@ -849,6 +1299,7 @@ def hook_activate(project_dir: str, soul_purpose: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@locked
 def hook_deactivate(project_dir: str) -> dict:
     """Remove lifecycle state file. Idempotent."""
     sd = session_dir(project_dir)
@@ -880,7 +1331,24 @@ def features_read(project_dir: str) -> dict:
     if not features_file.is_file():
         return {"exists": False, "claims": [], "counts": {}, "total": 0}
 
-    content = features_file.read_text()
+    claims = [dict(c) for c in doc_cache.get(features_file, _parse_features) or []]
+
+    counts = {
+        "verified": sum(1 for c in claims if c["status"] == "verified"),
+        "pending": sum(1 for c in claims if c["status"] == "pending"),
+        "failed": sum(1 for c in claims if c["status"] == "failed"),
+    }
+
+    return {
+        "exists": True,
+        "claims": claims,
+        "counts": counts,
+        "total": len(claims),
+    }
+
+
+def _parse_features(content: str) -> list[dict]:
+    """Extract {text, status} claims from checkbox lines."""
     claims: list[dict] = []
 
     for line in content.split("\n"):
@@ -902,18 +1370,7 @@ def features_read(project_dir: str) -> dict:
 
         claims.append({"text": text, "status": status})
 
-    counts = {
-        "verified": sum(1 for c in claims if c["status"] == "verified"),
-        "pending": sum(1 for c in claims if c["status"] == "pending"),
-        "failed": sum(1 for c in claims if c["status"] == "failed"),
-    }
-
-    return {
-        "exists": True,
-        "claims": claims,
-        "counts": counts,
-        "total": len(claims),
-    }
+    return claims
 
 
 # ---------------------------------------------------------------------------
@@ -921,11 +1378,12 @@ def features_read(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def git_summary(project_dir: str) -> dict:
+def git_summary(project_dir: str, probe: GitProbe | None = None) -> dict:
     """Raw git data: recent commits, changed files, branch, ahead/behind.
 
     Returns deterministic data only — no staleness judgment. The AI
     compares this against read_context output to decide what to update.
+    Pass an existing ``probe`` to avoid re-running ``git status``.
     """
     result: dict = {
         "is_git": False,
@@ -936,68 +1394,36 @@ def git_summary(project_dir: str) -> dict:
         "behind": 0,
     }
 
-    def _run(args: list[str]) -> str | None:
+    if probe is None:
+        probe = _git_probe(project_dir)
+    if not probe.is_git:
+        return result
+
+    result["is_git"] = True
+    result["branch"] = probe.branch
+    result["files_changed"] = [dict(f) for f in probe.files_changed]
+    result["ahead"] = probe.ahead
+    result["behind"] = probe.behind
+
+    # Recent commits (last 10)
+    if probe.head:
         try:
             proc = subprocess.run(
-                args,
+                ["git", "log", "--oneline", "--no-decorate", "-10"],
                 capture_output=True,
                 text=True,
                 cwd=project_dir,
                 timeout=10,
             )
-            return proc.stdout.strip() if proc.returncode == 0 else None
+            log_output = proc.stdout.strip() if proc.returncode == 0 else ""
         except (subprocess.SubprocessError, FileNotFoundError):
-            return None
-
-    # Check if git repo
-    if _run(["git", "rev-parse", "--git-dir"]) is None:
-        return result
-    result["is_git"] = True
-
-    # Current branch
-    branch = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-    if branch:
-        result["branch"] = branch
-
-    # Recent commits (last 10)
-    log_output = _run(
-        [
-            "git",
-            "log",
-            "--oneline",
-            "--no-decorate",
-            "-10",
-        ]
-    )
-    if log_output:
+            log_output = ""
         result["commits"] = [
             {"hash": line.split(" ", 1)[0], "message": line.split(" ", 1)[1] if " " in line else ""}
             for line in log_output.split("\n")
             if line.strip()
         ]
 
-    # Changed files (staged + unstaged + untracked)
-    status_output = _run(["git", "status", "--porcelain"])
-    if status_output:
-        result["files_changed"] = [
-            {"status": line[:2].strip(), "file": line[3:]} for line in status_output.split("\n") if line.strip()
-        ]
-
-    # Ahead/behind tracking branch
-    tracking = _run(
-        [
-            "git",
-            "rev-list",
-            "--left-right",
-            "--count",
-            "HEAD...@{upstream}",
-        ]
-    )
-    if tracking and "\t" in tracking:
-        parts = tracking.split("\t")
-        result["ahead"] = int(parts[0])
-        result["behind"] = int(parts[1])
-
     return result
 
 
@@ -1012,19 +1438,7 @@ def _get_git_head(project_dir: str) -> str | None:
     Returns:
         Commit hash as string, or None if not a git repo or command fails.
     """
-    try:
-        proc = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=project_dir,
-            timeout=10,
-        )
-        if proc.returncode == 0:
-            return proc.stdout.strip()
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-    return None
+    return _rev_parse(project_dir, "HEAD")
 
 
 def _get_capability_cache_path(project_dir: str) -> Path:
@@ -1062,9 +1476,10 @@ def _save_capability_cache(project_dir: str, data: dict) -> None:
     """
     cache_path = _get_capability_cache_path(project_dir)
     cache_path.parent.mkdir(exist_ok=True)
-    cache_path.write_text(json.dumps(data, indent=2))
+    atomic_write(cache_path, json.dumps(data, indent=2))
 
 
+@locked
 def capability_inventory(project_dir: str, force_refresh: bool = False) -> dict:
     """Manage capability inventory cache with git-aware invalidation.
 
@@ -1127,7 +1542,8 @@ def capability_inventory(project_dir: str, force_refresh: bool = False) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def refresh_claude_md(project_dir: str) -> dict:
+@locked
+def refresh_claude_md(project_dir: str, snapshot: RootSnapshot | None = None) -> dict:
     """Approximate Claude Code's /init command behavior.
 
     Analyzes the codebase and generates/upates CLAUDE.md with:
@@ -1139,24 +1555,27 @@ def refresh_claude_md(project_dir: str) -> dict:
     This is an approximation — the real /init should be run periodically
     to calibrate. This tool bridges the gap for automated workflows.
 
+    Pass an existing root ``snapshot`` to reuse its directory listing.
+
     Returns:
         dict with status, generated_content, governance_preserved, etc.
     """
     root = _resolve_project_dir(project_dir)
     cmd_path = root / "CLAUDE.md"
+    if snapshot is None:
+        snapshot = RootSnapshot(root)
 
     # Step 1: Detect project signals
-    root_files = [f for f in root.iterdir() if f.is_file()]
-    signals = _detect_project_signals(root, root_files)
+    signals = _detect_project_signals(snapshot, snapshot.files)
 
     # Step 2: Extract existing governance sections if CLAUDE.md exists
     existing_governance = {}
-    if cmd_path.is_file():
-        content = cmd_path.read_text()
+    doc = load_markdown(cmd_path) if snapshot.is_file("CLAUDE.md") else None
+    if doc is not None:
         for section in GOVERNANCE_SECTIONS:
-            found = find_section(content, section)
-            if found:
-                existing_governance[section] = found
+            _, body = doc.find(section)
+            if body:
+                existing_governance[section] = body
 
     # Step 3: Build CLAUDE.md content
     lines = []
@@ -1185,8 +1604,8 @@ def refresh_claude_md(project_dir: str) -> dict:
     lines.append("")
 
     # Analyze directory structure
-    dirs = sorted([d for d in root.iterdir() if d.is_dir() and not d.name.startswith(".")])
-    files = sorted([f for f in root.iterdir() if f.is_file() and not f.name.startswith(".")])
+    dirs = [d for d in snapshot.dirs if not d.name.startswith(".")]
+    files = [f for f in snapshot.files if not f.name.startswith(".")]
 
     if dirs:
         lines.append("### Directories")
@@ -1222,7 +1641,7 @@ def refresh_claude_md(project_dir: str) -> dict:
 
     # Check for Makefile
     makefile = root / "Makefile"
-    if makefile.is_file():
+    if snapshot.is_file("Makefile"):
         lines.append("### Makefile targets")
         try:
             make_content = makefile.read_text(errors="replace")
@@ -1262,7 +1681,7 @@ def refresh_claude_md(project_dir: str) -> dict:
 
     # Step 5: Write to CLAUDE.md
     try:
-        cmd_path.write_text(generated_content)
+        atomic_write(cmd_path, generated_content)
         return {
             "status": "ok",
             "claude_md_updated": True,
@@ -1289,17 +1708,26 @@ def refresh_claude_md(project_dir: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def start_composite(project_dir: str, directive: str = "") -> dict:
+def start_composite(
+    project_dir: str,
+    directive: str = "",
+    task_limit: int | None = None,
+    task_offset: int = 0,
+) -> dict:
     """Composite session start: preflight + validate + read_context +
     git_summary + classify_brainstorm + conditional check_clutter.
 
     Combines the 5-6 MCP calls that always run together at session start
     into a single round-trip. Each sub-operation is independently guarded
-    so a failure in one does not block the others.
+    so a failure in one does not block the others. Independent stages run
+    on a small thread pool, so latency tracks the slowest stage (usually
+    git) rather than the sum, and the root listing is taken once.
 
     Args:
         project_dir: Project directory path.
         directive: Optional directive text for brainstorm classification.
+        task_limit: Page size for read_context's task lists (None: all).
+        task_offset: First task of the page.
 
     Returns:
         Dict with keys: preflight, validate, read_context, git_summary,
@@ -1314,52 +1742,60 @@ def start_composite(project_dir: str, directive: str = "") -> dict:
         "clutter": None,
     }
 
-    # 1. Preflight — needed to determine mode and root_file_count
-    try:
-        result["preflight"] = preflight(project_dir)
-    except Exception as e:
-        result["preflight"] = {"status": "error", "error": str(e)}
-
-    # 2. Validate
-    try:
-        result["validate"] = validate(project_dir)
-    except Exception as e:
-        result["validate"] = {"status": "error", "error": str(e)}
-
-    # 3. Read context
-    try:
-        result["read_context"] = read_context(project_dir)
-    except Exception as e:
-        result["read_context"] = {"status": "error", "error": str(e)}
-
-    # 4. Git summary
     try:
-        result["git_summary"] = git_summary(project_dir)
-    except Exception as e:
-        result["git_summary"] = {"status": "error", "error": str(e)}
+        snapshot = RootSnapshot(project_dir)
+    except OSError:
+        snapshot = None  # let each sub-operation report its own error
+
+    # Stage dependencies: git_summary and preflight share one git status
+    # probe; validate may repair session files, so it starts after
+    # preflight has recorded their original state, and read_context
+    # follows validate. classify_brainstorm and clutter need preflight
+    # output and run on this thread while the workers finish.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        probe_future = pool.submit(_git_probe, project_dir)
+        git_future = pool.submit(_guarded, lambda: git_summary(project_dir, probe=probe_future.result()))
+
+        # 1. Preflight — needed to determine mode and root_file_count
+        result["preflight"] = _guarded(lambda: preflight(project_dir, probe=probe_future.result(), snapshot=snapshot))
+
+        # 2-3. Validate, then read context; 4. git summary is already running
+        context_future = pool.submit(
+            lambda: (
+                _guarded(validate, project_dir),
+                _guarded(read_context, project_dir, task_limit, task_offset),
+            )
+        )
 
-    # 5. Classify brainstorm — needs project_signals from preflight
-    try:
+        # 5. Classify brainstorm — needs project_signals from preflight
         project_signals = {}
         if isinstance(result["preflight"], dict) and "project_signals" in result["preflight"]:
             project_signals = result["preflight"]["project_signals"]
-        result["classify_brainstorm"] = classify_brainstorm(directive, project_signals)
-    except Exception as e:
-        result["classify_brainstorm"] = {"status": "error", "error": str(e)}
+        result["classify_brainstorm"] = _guarded(classify_brainstorm, directive, project_signals)
 
-    # 6. Check clutter — only if root_file_count > 15
-    try:
+        # 6. Check clutter — only if root_file_count > 15
         root_file_count = 0
         if isinstance(result["preflight"], dict):
             root_file_count = result["preflight"].get("root_file_count", 0)
         if root_file_count > 15:
-            result["clutter"] = check_clutter(project_dir)
-    except Exception as e:
-        result["clutter"] = {"status": "error", "error": str(e)}
+            result["clutter"] = _guarded(check_clutter, project_dir, snapshot=snapshot)
+
+        result["validate"], result["read_context"] = context_future.result()
+        result["git_summary"] = git_future.result()
 
     return result
 
 
+def _guarded(fn: Callable[..., dict], *args, **kwargs) -> dict:
+    """Run one composite sub-operation, turning failures into an error dict."""
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+@locked
+@write_batch()
 def activate_composite(
     project_dir: str,
     soul_purpose: str,
@@ -1369,7 +1805,8 @@ def activate_composite(
 
     Combines the 3 MCP calls that always run together when activating a
     soul purpose into a single round-trip. Each sub-operation is
-    independently guarded for partial failure resilience.
+    independently guarded for partial failure resilience, and their file
+    writes are committed together as one atomic batch.
 
     Args:
         project_dir: Project directory path.
@@ -1406,6 +1843,7 @@ def activate_composite(
     return result
 
 
+@locked
 def close_composite(project_dir: str) -> dict:
     """Composite session close: harvest + features_read + hook_deactivate.
 
@@ -1444,3 +1882,77 @@ def close_composite(project_dir: str) -> dict:
         result["hook"] = {"status": "error", "error": str(e)}
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Multi-project batch operations
+# ---------------------------------------------------------------------------
+
+
+def start_many(
+    project_dirs: list[str],
+    directive: str = "",
+    max_workers: int | None = None,
+    on_result: Callable[[int, int, dict], None] | None = None,
+    task_limit: int | None = None,
+    task_offset: int = 0,
+) -> dict:
+    """Run start_composite for many projects on a bounded worker pool.
+
+    Args:
+        project_dirs: Project directory paths.
+        directive: Directive text passed to every start_composite call.
+        max_workers: Pool size (default: BATCH_MAX_WORKERS).
+        on_result: Called as on_result(done, total, entry) as each project
+            finishes, from the worker pool's caller thread.
+        task_limit: Page size for each project's task lists (None: all).
+        task_offset: First task of each page.
+
+    Returns:
+        Dict with count, errors and results — one {project_dir, result}
+        entry per input, in input order.
+    """
+    return _run_many(
+        lambda d: start_composite(d, directive, task_limit, task_offset),
+        project_dirs,
+        max_workers,
+        on_result,
+    )
+
+
+def read_context_many(
+    project_dirs: list[str],
+    max_workers: int | None = None,
+    on_result: Callable[[int, int, dict], None] | None = None,
+    task_limit: int | None = None,
+    task_offset: int = 0,
+) -> dict:
+    """Run read_context for many projects on a bounded worker pool.
+
+    Same arguments and result shape as start_many.
+    """
+    return _run_many(lambda d: read_context(d, task_limit, task_offset), project_dirs, max_workers, on_result)
+
+
+def _run_many(
+    fn: Callable[[str], dict],
+    project_dirs: list[str],
+    max_workers: int | None,
+    on_result: Callable[[int, int, dict], None] | None,
+) -> dict:
+    """Fan fn out over project_dirs; each project is guarded independently."""
+    total = len(project_dirs)
+    results: list[dict | None] = [None] * total
+    workers = max(1, min(max_workers or BATCH_MAX_WORKERS, total or 1))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_guarded, fn, d): i for i, d in enumerate(project_dirs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            entry = {"project_dir": project_dirs[i], "result": future.result()}
+            results[i] = entry
+            if on_result is not None:
+                on_result(done, total, entry)
+
+    errors = sum(1 for entry in results if entry["result"].get("status") == "error")
+    return {"status": "ok", "count": total, "errors": errors, "results": results}
@@ -4,8 +4,12 @@ Each tool wraps an operation from operations.py, exposing it as a
 FastMCP tool with typed parameters and structured JSON output.
 """
 
-from fastmcp import FastMCP
+import asyncio
 
+from fastmcp import Context, FastMCP
+
+from ..common.config import CONTEXT_TASK_LIMIT
+from . import live
 from . import operations as ops
 
 
@@ -29,20 +33,35 @@ def register(mcp: FastMCP) -> None:
         """Bootstrap session-context/ with templates, soul purpose, and
         active context. Creates the session-context directory and seeds
         all required files."""
-        return ops.init(project_dir, soul_purpose, ralph_mode, ralph_intensity)
+        result = ops.init(project_dir, soul_purpose, ralph_mode, ralph_intensity)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_validate(project_dir: str) -> dict:
         """Validate session-context files exist and have content.
         Repairs missing files from templates automatically."""
-        return ops.validate(project_dir)
+        result = ops.validate(project_dir)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
-    def session_read_context(project_dir: str) -> dict:
+    def session_read_context(
+        project_dir: str,
+        task_limit: int | None = CONTEXT_TASK_LIMIT,
+        task_offset: int = 0,
+    ) -> dict:
         """Read soul purpose, active context summary, open/completed tasks,
         Ralph config, and status hint. Primary tool for understanding
-        current session state."""
-        return ops.read_context(project_dir)
+        current session state.
+
+        open_tasks and recent_progress each return at most task_limit
+        entries starting at task_offset (null task_limit: all);
+        open_task_count and recent_progress_count give the totals."""
+        state = live.registry.lookup(project_dir)
+        if state is not None:
+            return ops.page_tasks(state.read_context(), task_limit, task_offset)
+        return ops.read_context(project_dir, task_limit, task_offset)
 
     @mcp.tool
     def session_harvest(project_dir: str) -> dict:
@@ -59,7 +78,9 @@ def register(mcp: FastMCP) -> None:
     ) -> dict:
         """Archive current soul purpose with [CLOSED] marker and optionally
         set a new one. Resets active context from template."""
-        return ops.archive(project_dir, old_purpose, new_purpose)
+        result = ops.archive(project_dir, old_purpose, new_purpose)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_check_clutter(project_dir: str) -> dict:
@@ -69,15 +90,17 @@ def register(mcp: FastMCP) -> None:
 
     @mcp.tool
     def session_cache_governance(project_dir: str) -> dict:
-        """Cache governance sections from CLAUDE.md to /tmp before
-        running /init (which may overwrite CLAUDE.md)."""
+        """Cache governance sections from CLAUDE.md (per project, in server
+        memory) before running /init (which may overwrite CLAUDE.md)."""
         return ops.cache_governance(project_dir)
 
     @mcp.tool
     def session_restore_governance(project_dir: str) -> dict:
         """Restore cached governance sections to CLAUDE.md after /init.
         Must call session_cache_governance first."""
-        return ops.restore_governance(project_dir)
+        result = ops.restore_governance(project_dir)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_ensure_governance(
@@ -88,7 +111,9 @@ def register(mcp: FastMCP) -> None:
         """Ensure all required governance sections exist in CLAUDE.md.
         Adds missing Structure Maintenance, Session Context, Template,
         and Ralph Loop sections."""
-        return ops.ensure_governance(project_dir, ralph_mode, ralph_intensity)
+        result = ops.ensure_governance(project_dir, ralph_mode, ralph_intensity)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_classify_brainstorm(
@@ -119,6 +144,9 @@ def register(mcp: FastMCP) -> None:
     def session_features_read(project_dir: str) -> dict:
         """Parse CLAUDE-features.md into structured claims by status
         (verified/pending/failed). Returns {exists, claims[], counts, total}."""
+        state = live.registry.lookup(project_dir)
+        if state is not None:
+            return state.features_read()
         return ops.features_read(project_dir)
 
     @mcp.tool
@@ -156,7 +184,9 @@ def register(mcp: FastMCP) -> None:
         The tool follows the cache/restore pattern internally: it preserves
         any existing governance sections before regenerating content.
         """
-        return ops.refresh_claude_md(project_dir)
+        result = ops.refresh_claude_md(project_dir)
+        live.registry.invalidate(project_dir)
+        return result
 
     # ------------------------------------------------------------------
     # Composite tools — reduce MCP round-trips for common workflows
@@ -166,14 +196,19 @@ def register(mcp: FastMCP) -> None:
     def session_start(
         project_dir: str,
         directive: str = "",
+        task_limit: int | None = CONTEXT_TASK_LIMIT,
+        task_offset: int = 0,
     ) -> dict:
         """Composite session start — runs preflight, validate, read_context,
         git_summary, classify_brainstorm, and check_clutter (if root has
         >15 files) in a single MCP call. Replaces 5-6 individual tool
         calls at session startup. Each sub-operation is independently
         guarded: if one fails, the others still run and the error is
-        included in that key's result."""
-        return ops.start_composite(project_dir, directive)
+        included in that key's result. read_context's task lists are
+        paged as in session_read_context."""
+        result = ops.start_composite(project_dir, directive, task_limit, task_offset)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_activate(
@@ -186,7 +221,9 @@ def register(mcp: FastMCP) -> None:
         (extract feature claims) in a single MCP call. Replaces 3
         individual tool calls when activating a soul purpose. Each
         sub-operation is independently guarded for partial failure."""
-        return ops.activate_composite(project_dir, soul_purpose, old_purpose)
+        result = ops.activate_composite(project_dir, soul_purpose, old_purpose)
+        live.registry.invalidate(project_dir)
+        return result
 
     @mcp.tool
     def session_close(project_dir: str) -> dict:
@@ -195,4 +232,68 @@ def register(mcp: FastMCP) -> None:
         hook_deactivate (remove lifecycle state) in a single MCP call.
         Replaces 3 individual tool calls during session settlement. Each
         sub-operation is independently guarded for partial failure."""
-        return ops.close_composite(project_dir)
+        result = ops.close_composite(project_dir)
+        live.registry.invalidate(project_dir)
+        return result
+
+    # ------------------------------------------------------------------
+    # Batch tools — one call for many projects
+    # ------------------------------------------------------------------
+
+    @mcp.tool
+    async def session_start_many(
+        project_dirs: list[str],
+        ctx: Context,
+        directive: str = "",
+        max_workers: int | None = None,
+        task_limit: int | None = CONTEXT_TASK_LIMIT,
+        task_offset: int = 0,
+    ) -> dict:
+        """Run session_start for many projects in one MCP call. Projects
+        are processed on a bounded worker pool (ATLAS_BATCH_WORKERS,
+        default 8) and progress is reported as each one finishes. Returns
+        {count, errors, results} with one {project_dir, result} per input,
+        in input order; a failing project never blocks the others."""
+        relay = _ProgressRelay(ctx)
+        result = await asyncio.to_thread(
+            ops.start_many, project_dirs, directive, max_workers, relay.on_result, task_limit, task_offset
+        )
+        await relay.flush()
+        for project_dir in project_dirs:
+            live.registry.invalidate(project_dir)
+        return result
+
+    @mcp.tool
+    async def session_read_context_many(
+        project_dirs: list[str],
+        ctx: Context,
+        max_workers: int | None = None,
+        task_limit: int | None = CONTEXT_TASK_LIMIT,
+        task_offset: int = 0,
+    ) -> dict:
+        """Run session_read_context for many projects in one MCP call.
+        Same pooling, progress and result shape as session_start_many;
+        task lists are paged as in session_read_context."""
+        relay = _ProgressRelay(ctx)
+        result = await asyncio.to_thread(
+            ops.read_context_many, project_dirs, max_workers, relay.on_result, task_limit, task_offset
+        )
+        await relay.flush()
+        return result
+
+
+class _ProgressRelay:
+    """Forward batch progress from worker threads to the client."""
+
+    def __init__(self, ctx: Context):
+        self._ctx = ctx
+        self._loop = asyncio.get_running_loop()
+        self._pending: list = []
+
+    def on_result(self, done: int, total: int, entry: dict) -> None:
+        report = self._ctx.report_progress(done, total, f"{entry['project_dir']} done")
+        self._pending.append(asyncio.run_coroutine_threadsafe(report, self._loop))
+
+    async def flush(self) -> None:
+        """Wait until every progress notification has been sent."""
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in self._pending), return_exceptions=True)
@@ -1,22 +1,13 @@
 """Stripe MCP tool definitions.
 
 Handles checkout creation, webhook processing, and license validation.
+stripe_client is imported on first use, not at server startup.
 """
 
 from __future__ import annotations
 
 from fastmcp import FastMCP
 
-from ..stripe_client import (
-    StripeNotConfigured,
-    StripeSignatureError,
-    create_checkout_session,
-    handle_checkout_completed,
-    is_stripe_configured,
-    refresh_local_license,
-    verify_webhook_signature,
-)
-
 
 def register(mcp: FastMCP) -> None:
     """Register all Stripe tools on the given server."""
@@ -27,6 +18,8 @@ def register(mcp: FastMCP) -> None:
 
         Returns {healthy, configured} status.
         """
+        from ..stripe_client import is_stripe_configured
+
         return {
             "status": "ok",
             "healthy": True,
@@ -54,6 +47,8 @@ def register(mcp: FastMCP) -> None:
         Raises:
             StripeNotConfigured: If Stripe keys not configured
         """
+        from ..stripe_client import StripeNotConfigured, create_checkout_session
+
         if plan not in ("monthly", "yearly"):
             return {
                 "status": "error",
@@ -101,6 +96,8 @@ def register(mcp: FastMCP) -> None:
         Returns:
             dict with status and event handling result
         """
+        from ..stripe_client import StripeSignatureError, handle_checkout_completed, verify_webhook_signature
+
         try:
             # CRITICAL: Use exact UTF-8 bytes from request - no re-encoding
             # Stripe HMAC is computed over raw HTTP body bytes
@@ -149,6 +146,8 @@ def register(mcp: FastMCP) -> None:
         Returns:
             dict with status and validation result
         """
+        from ..stripe_client import refresh_local_license
+
         try:
             result = refresh_local_license()
 
@@ -182,9 +181,9 @@ def register(mcp: FastMCP) -> None:
         Returns:
             dict with customer status and subscription info
         """
-        try:
-            from ..stripe_client import validate_license_with_stripe
+        from ..stripe_client import StripeNotConfigured, validate_license_with_stripe
 
+        try:
             return validate_license_with_stripe(customer_id)
         except StripeNotConfigured as e:
             return {
@@ -317,10 +317,10 @@ def refresh_local_license() -> dict:
         import hashlib
         import hmac
 
-        from atlas_session.license import _HMAC_SECRET
+        from atlas_session.license import _hmac_secret
 
         message = f"{customer_id}:{expiry}".encode()
-        signature = hmac.new(_HMAC_SECRET, message, hashlib.sha256).hexdigest()
+        signature = hmac.new(_hmac_secret(), message, hashlib.sha256).hexdigest()
         token_data = {
             "customer_id": customer_id,
             "expiry": expiry,
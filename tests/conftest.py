@@ -1,12 +1,31 @@
 """Shared test fixtures for Atlas Session Lifecycle."""
 
 import json
+import os
 import shutil
 from pathlib import Path
 
 import pytest
 
 
+@pytest.fixture
+def backdate():
+    """backdate(*paths) moves mtimes 60s back, out of the racy window.
+
+    Caches only trust stat stamps once they have settled, so tests that
+    expect a cache hit age the files first.
+    """
+
+    def backdate(*paths, seconds=60):
+        for path in paths:
+            st = path.stat()
+            os.utime(
+                path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000)
+            )
+
+    return backdate
+
+
 @pytest.fixture
 def project_dir(tmp_path):
     """Create an isolated project directory with no session-context."""
@@ -8,6 +8,7 @@ Tests the complete capability inventory lifecycle including:
 
 import json
 import subprocess
+from pathlib import Path
 
 from atlas_session.session.operations import (
     capability_inventory,
@@ -205,13 +206,12 @@ class TestCapabilityInventoryEdgeCases:
         assert capability_cache.is_file()
 
         # 3. Both caches should exist independently
-        from atlas_session.common.config import GOVERNANCE_CACHE_PATH
-
-        assert GOVERNANCE_CACHE_PATH.is_file()
+        governance_cache = Path(governance_result["cache_file"])
+        assert governance_cache.is_file()
         assert capability_cache.is_file()
 
         # 4. They should have different content
-        governance_data = json.loads(GOVERNANCE_CACHE_PATH.read_text())
+        governance_data = json.loads(governance_cache.read_text())
         capability_data = json.loads(capability_cache.read_text())
         assert "git_head" in capability_data
         assert "git_head" not in governance_data  # Governance cache has sections
@@ -5,6 +5,7 @@ cycles by calling operations in sequence and verifying cumulative state.
 """
 
 import json
+from pathlib import Path
 
 
 from atlas_session.session.operations import (
@@ -276,9 +277,7 @@ class TestGovernanceCacheRestoreCycle:
         assert "**Mode**: Manual" in restored
 
         # Cache file should be cleaned up
-        from atlas_session.common.config import GOVERNANCE_CACHE_PATH
-
-        assert not GOVERNANCE_CACHE_PATH.is_file()
+        assert not Path(cache_result["cache_file"]).is_file()
 
 
 # ---------------------------------------------------------------------------
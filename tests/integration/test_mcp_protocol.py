@@ -87,6 +87,32 @@ class TestSessionToolsViaMCP:
         assert isinstance(data["open_tasks"], list)
         assert isinstance(data["recent_progress"], list)
 
+    async def test_read_context_paged_via_mcp(
+        self, mcp_client, project_with_soul_purpose
+    ):
+        """task_limit caps the task lists; the counts stay complete."""
+        result = await mcp_client.call_tool(
+            "session_read_context",
+            {"project_dir": str(project_with_soul_purpose), "task_limit": 1},
+        )
+        data = result.data
+
+        assert len(data["open_tasks"]) == 1
+        assert data["open_task_count"] == 2
+
+    async def test_session_start_paged_via_mcp(
+        self, mcp_client, project_with_soul_purpose
+    ):
+        """session_start pages read_context's task lists the same way."""
+        result = await mcp_client.call_tool(
+            "session_start",
+            {"project_dir": str(project_with_soul_purpose), "task_limit": 1},
+        )
+        context = result.data["read_context"]
+
+        assert len(context["open_tasks"]) == 1
+        assert context["open_task_count"] == 2
+
     async def test_classify_brainstorm_via_mcp(self, mcp_client):
         """Call session_classify_brainstorm with directive + signals, verify weight."""
         result = await mcp_client.call_tool(
@@ -168,6 +194,32 @@ class TestSessionToolsViaMCP:
         assert data3["cache_hit"] is False
         assert data3["needs_generation"] is True
 
+    async def test_start_many_via_mcp(self, mcp_client, tmp_path):
+        """session_start_many returns one result per project, in order."""
+        projects = []
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / name).mkdir()
+            projects.append(str(tmp_path / name))
+        progress = []
+
+        async def on_progress(done, total, message):
+            progress.append((done, total))
+
+        result = await mcp_client.call_tool(
+            "session_start_many",
+            {"project_dirs": projects, "max_workers": 2},
+            progress_handler=on_progress,
+        )
+        data = result.data
+
+        assert data["count"] == 3
+        assert data["errors"] == 0
+        assert [entry["project_dir"] for entry in data["results"]] == projects
+        assert all(
+            entry["result"]["preflight"]["mode"] == "init" for entry in data["results"]
+        )
+        assert max(progress) == (3, 3)
+
 
 # ---------------------------------------------------------------------------
 # TestContractToolsViaMCP
@@ -206,6 +258,43 @@ class TestContractToolsViaMCP:
             assert "output" in r
             assert "weight" in r
 
+    async def test_run_tests_reports_progress(self, mcp_client, project_with_contract):
+        """contract_run_tests sends a progress notification per criterion event."""
+        messages = []
+
+        async def on_progress(done, total, message):
+            messages.append((done, total, message))
+
+        await mcp_client.call_tool(
+            "contract_run_tests",
+            {"project_dir": str(project_with_contract), "use_cache": False},
+            progress_handler=on_progress,
+        )
+        assert len(messages) == 4
+        assert messages[-1][:2] == (2, 2)
+        assert sum(m[2].endswith("passed") for m in messages) == 2
+
+    async def test_create_rejects_invalid_pass_when(self, mcp_client, tmp_path):
+        """contract_create refuses a pass_when that does not compile."""
+        result = await mcp_client.call_tool(
+            "contract_create",
+            {
+                "project_dir": str(tmp_path),
+                "soul_purpose": "Bad expression",
+                "escrow": 10,
+                "criteria": [
+                    {
+                        "name": "tests",
+                        "type": "shell",
+                        "command": "true",
+                        "pass_when": "exit_code == 0 and (",
+                    }
+                ],
+            },
+        )
+        assert result.data["status"] == "error"
+        assert "Invalid criterion 'tests'" in result.data["message"]
+
     async def test_draft_criteria_via_mcp(self, mcp_client):
         """Call contract_draft_criteria, verify tests_pass appears for test soul purpose."""
         result = await mcp_client.call_tool(
@@ -6,14 +6,31 @@ Covers:
   TestParseMdSections: parse_md_sections() markdown parsing
   TestFindSection: find_section() partial case-insensitive lookup
   TestReadWriteJson: read_json() / write_json() round-trip and edge cases
+  TestDocumentCache: stat-keyed LRU cache of parsed documents
+  TestMdIndex: offset-based section index and lookups
+  TestRootSnapshot: single-scandir directory listing
+  TestAtomicWrites: temp-file + rename writes and write_batch commits
 """
 
+import os
+
 import pytest
 
+from atlas_session.common import state
 from atlas_session.common.state import (
+    DocumentCache,
+    MdIndex,
+    RootSnapshot,
+    Section,
+    atomic_copy,
+    atomic_write,
     find_section,
+    iter_sections,
+    load_markdown,
+    load_text,
     parse_md_sections,
     read_json,
+    write_batch,
     write_json,
 )
 
@@ -254,3 +271,326 @@ class TestParseMdSectionsHostile:
         path = tmp_path / "nonexistent" / "subdir" / "data.json"
         with pytest.raises(FileNotFoundError):
             write_json(path, {"key": "value"})
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache and the load_text/load_markdown helpers."""
+
+    def test_reuses_parse_while_stamp_unchanged(self, tmp_path, backdate):
+        """The parser runs once for an unchanged file."""
+        path = tmp_path / "doc.md"
+        path.write_text("## A\nbody\n")
+        backdate(path)
+        calls = []
+
+        def parser(text):
+            calls.append(text)
+            return text.upper()
+
+        cache = DocumentCache(maxsize=4)
+        assert cache.get(path, parser) == "## A\nBODY\n"
+        assert cache.get(path, parser) == "## A\nBODY\n"
+        assert len(calls) == 1
+
+    def test_reparses_after_modification(self, tmp_path, backdate):
+        """A changed size/mtime invalidates the entry."""
+        path = tmp_path / "doc.md"
+        path.write_text("one")
+        backdate(path)
+        cache = DocumentCache()
+        assert cache.get(path, str.strip) == "one"
+        path.write_text("three")
+        assert cache.get(path, str.strip) == "three"
+
+    def test_recently_modified_files_not_cached(self, tmp_path):
+        """Files inside the racy window are parsed but not stored."""
+        path = tmp_path / "fresh.md"
+        path.write_text("fresh")
+        cache = DocumentCache()
+        cache.get(path, str.strip)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, tmp_path, backdate):
+        """Least recently used entries are evicted beyond maxsize."""
+        cache = DocumentCache(maxsize=2)
+        paths = []
+        for name in ("a", "b", "c"):
+            p = tmp_path / name
+            p.write_text(name)
+            backdate(p)
+            paths.append(p)
+        cache.get(paths[0], str.strip)
+        cache.get(paths[1], str.strip)
+        cache.get(paths[0], str.strip)  # a is now most recent
+        cache.get(paths[2], str.strip)
+        assert len(cache) == 2
+        calls = []
+        cache.get(paths[1], lambda t: calls.append(t) or t)
+        assert calls == ["b"]
+
+    def test_missing_file_and_directory_return_none(self, tmp_path):
+        """Non-regular paths behave like missing files."""
+        cache = DocumentCache()
+        assert cache.get(tmp_path / "nope.md", str.strip) is None
+        assert cache.get(tmp_path, str.strip) is None
+
+    def test_invalidate(self, tmp_path, backdate):
+        """invalidate() drops cached parses of a path."""
+        path = tmp_path / "doc.md"
+        path.write_text("x")
+        backdate(path)
+        cache = DocumentCache()
+        cache.get(path, str.strip)
+        cache.invalidate(path)
+        assert len(cache) == 0
+
+    def test_load_markdown_sections(self, tmp_path):
+        """load_markdown returns text plus parsed ## sections."""
+        path = tmp_path / "CLAUDE.md"
+        path.write_text("# T\n\n## Ralph Loop\n\n**Mode**: auto\n")
+        doc = load_markdown(path)
+        assert doc.text.startswith("# T")
+        assert "## Ralph Loop" in doc.sections
+        assert load_text(tmp_path / "missing.md") is None
+
+
+class TestMdIndex:
+    """Tests for iter_sections() and the offset-based MdIndex."""
+
+    DOC = (
+        "# Title\n"
+        "\n"
+        "## First\n"
+        "intro\n"
+        "### Child\n"
+        "child body\n"
+        "```\n"
+        "## Not A Heading\n"
+        "```\n"
+        "## Second\n"
+        "tail\n"
+    )
+
+    def test_levels_and_spans(self):
+        """Every heading is indexed with its level and character span."""
+        index = MdIndex(self.DOC)
+        by_heading = {sec.heading: sec for sec in index.index}
+        assert [sec.heading for sec in index.index] == [
+            "# Title",
+            "## First",
+            "### Child",
+            "## Second",
+        ]
+        assert by_heading["### Child"].level == 3
+        first = by_heading["## First"]
+        assert self.DOC[first.start : first.end].endswith("## Not A Heading\n```")
+        assert by_heading["# Title"].end == len(self.DOC)
+
+    def test_sections_match_parse_md_sections(self):
+        """The ## view is exactly what parse_md_sections returns."""
+        index = MdIndex(self.DOC)
+        assert index.sections == parse_md_sections(self.DOC)
+        assert index.sections["## Second"] == "## Second\ntail\n"
+
+    def test_title_between_sections_does_not_extend_them(self):
+        """A # title inside a ## section is part of it, up to the next ##."""
+        doc = "## A\na\n# T\n## B\nb"
+        assert MdIndex(doc).sections == {"## A": "## A\na\n# T", "## B": "## B\nb"}
+        deeper = "## A\n### x\n# T\n### y\n## B\nb"
+        assert MdIndex(deeper).sections["## A"] == "## A\n### x\n# T\n### y"
+
+    def test_sections_returns_copy(self):
+        """Callers may mutate the returned dict without corrupting the index."""
+        index = MdIndex(self.DOC)
+        index.sections.clear()
+        assert "## First" in index.sections
+
+    def test_find_matches_find_section(self):
+        """find() mirrors find_section() semantics, including misses."""
+        index = MdIndex(self.DOC)
+        for key in ("first", "## Second", "sec", "missing", "Child"):
+            assert index.find(key) == find_section(index.sections, key)
+
+    def test_find_duplicate_heading_uses_last_body(self):
+        """Duplicate headings resolve like the sections dict (last body)."""
+        doc = "## Dup\none\n## Dup\ntwo\n"
+        assert MdIndex(doc).find("dup") == ("## Dup", "## Dup\ntwo\n")
+
+    def test_find_headings_differing_only_by_case(self):
+        """Only exact duplicates share a body; case variants stay distinct."""
+        doc = "## Ralph Loop\n**Mode**: Manual\n## RALPH LOOP\n**Mode**: Auto\n"
+        index = MdIndex(doc)
+        assert index.find("ralph loop") == find_section(
+            parse_md_sections(doc), "ralph loop"
+        )
+        assert index.find("ralph loop")[0] == "## Ralph Loop"
+
+    def test_iter_sections_streams_without_bodies(self):
+        """iter_sections yields Section spans, not copied text."""
+        sections = list(iter_sections("## A\n## B\n"))
+        assert all(isinstance(sec, Section) for sec in sections)
+        assert {(sec.heading, sec.start, sec.end) for sec in sections} == {
+            ("## A", 0, 4),
+            ("## B", 5, 10),
+        }
+
+    def test_large_document(self):
+        """Hundreds of sections index in one pass and look up directly."""
+        doc = "".join(f"## Section {i}\nbody {i}\n" for i in range(500))
+        index = MdIndex(doc)
+        assert len(index.index) == 500
+        assert index.find("section 499") == (
+            "## Section 499",
+            "## Section 499\nbody 499\n",
+        )
+
+
+class TestRootSnapshot:
+    def test_files_and_dirs_sorted(self, tmp_path):
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "src").mkdir()
+        snap = RootSnapshot(tmp_path)
+        assert snap.files == [tmp_path / "a.txt", tmp_path / "b.txt"]
+        assert snap.dirs == [tmp_path / "src"]
+
+    def test_type_checks(self, tmp_path):
+        (tmp_path / "f").write_text("x")
+        (tmp_path / "d").mkdir()
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+        snap = RootSnapshot(tmp_path)
+        assert snap.is_file("f") and not snap.is_dir("f")
+        assert snap.is_dir("d") and not snap.is_file("d")
+        assert snap.exists("f") and snap.exists("d")
+        assert not snap.exists("dangling")
+        assert not snap.exists("absent")
+
+    def test_symlinks_followed(self, tmp_path):
+        (tmp_path / "real").write_text("x")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        assert RootSnapshot(tmp_path).is_file("link")
+
+    def test_lists_once(self, tmp_path, monkeypatch):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "f").write_text("x")
+        calls = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            calls.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        snap = RootSnapshot(tmp_path)
+        for _ in range(3):
+            snap.files, snap.dirs, snap.is_file("f")
+            snap.child("src")
+        assert calls == [str(tmp_path), str(tmp_path / "src")]
+
+    def test_child_of_non_directory_is_none(self, tmp_path):
+        (tmp_path / "f").write_text("x")
+        snap = RootSnapshot(tmp_path)
+        assert snap.child("f") is None
+        assert snap.child("missing") is None
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            RootSnapshot(tmp_path / "nope")
+
+
+class TestAtomicWrites:
+    @pytest.fixture
+    def fsyncs(self, monkeypatch):
+        calls = []
+        real_fsync = os.fsync
+
+        def counting_fsync(fd):
+            calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(state.os, "fsync", counting_fsync)
+        return calls
+
+    def test_replaces_content_without_leftovers(self, tmp_path):
+        target = tmp_path / "f.md"
+        target.write_text("old")
+        atomic_write(target, "new")
+        assert target.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["f.md"]
+
+    def test_writes_through_symlink(self, tmp_path):
+        target = tmp_path / "AGENTS.md"
+        target.write_text("old")
+        link = tmp_path / "CLAUDE.md"
+        link.symlink_to(target.name)
+        atomic_write(link, "new")
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+        atomic_copy(_src(tmp_path), link)
+        assert link.is_symlink()
+        assert target.read_text() == "template"
+
+    def test_preserves_mode(self, tmp_path):
+        target = tmp_path / "f.md"
+        target.write_text("old")
+        target.chmod(0o640)
+        atomic_write(target, "new")
+        assert target.stat().st_mode & 0o777 == 0o640
+
+    def test_batch_commits_on_exit(self, tmp_path):
+        with write_batch():
+            atomic_write(tmp_path / "a", "1")
+            atomic_copy(_src(tmp_path), tmp_path / "b")
+            assert not (tmp_path / "a").exists()
+        assert (tmp_path / "a").read_text() == "1"
+        assert (tmp_path / "b").read_text() == "template"
+
+    def test_batch_discarded_on_error(self, tmp_path):
+        (tmp_path / "a").write_text("old")
+        with pytest.raises(RuntimeError), write_batch():
+            atomic_write(tmp_path / "a", "new")
+            raise RuntimeError("boom")
+        assert (tmp_path / "a").read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["a"]
+
+    def test_nested_batches_join_outer(self, tmp_path):
+        with write_batch() as outer:
+            with write_batch() as inner:
+                atomic_write(tmp_path / "a", "1")
+            assert inner is outer
+            assert not (tmp_path / "a").exists()
+        assert (tmp_path / "a").read_text() == "1"
+
+    def test_one_directory_fsync_per_batch(self, tmp_path, fsyncs):
+        with write_batch(durable=False):
+            for name in ("a", "b", "c"):
+                atomic_write(tmp_path / name, name)
+        assert len(fsyncs) == 1
+
+    def test_durable_fsyncs_each_file(self, tmp_path, fsyncs):
+        with write_batch(durable=True):
+            for name in ("a", "b", "c"):
+                atomic_write(tmp_path / name, name)
+        assert len(fsyncs) == 4
+
+    def test_rewrite_in_batch_keeps_last(self, tmp_path):
+        with write_batch():
+            atomic_write(tmp_path / "a", "1")
+            atomic_write(tmp_path / "a", "2")
+        assert (tmp_path / "a").read_text() == "2"
+        assert [p.name for p in tmp_path.iterdir()] == ["a"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            atomic_write(tmp_path / "nope" / "a", "1")
+
+    def test_write_json_is_atomic(self, tmp_path):
+        write_json(tmp_path / "d.json", {"k": 1})
+        assert read_json(tmp_path / "d.json") == {"k": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["d.json"]
+
+
+def _src(tmp_path):
+    src = tmp_path.parent / f"{tmp_path.name}-template"
+    src.write_text("template")
+    return src
@@ -6,16 +6,25 @@ Covers Tasks 5, 6, 7 of the test plan:
   Task 7: Draft criteria helpers (8 tests)
 """
 
+import asyncio
 import json
 import subprocess
-from unittest.mock import patch
+import time
 
 import httpx
 import pytest
 import respx
 
+from atlas_session.contract.expr import PassWhenError, compile_pass_when
 from atlas_session.contract.model import Contract, Criterion, CriterionType
-from atlas_session.contract.verifier import _evaluate_pass_when, run_tests
+from atlas_session.contract.native import resolve_ref
+from atlas_session.contract import verifier
+from atlas_session.contract.verifier import (
+    _evaluate_pass_when,
+    _schedule,
+    run_tests,
+    run_tests_async,
+)
 from atlas_session.contract import atlascoin
 from atlas_session.contract.tools import (
     _guess_build_command,
@@ -24,6 +33,23 @@ from atlas_session.contract.tools import (
 )
 from atlas_session.common.config import ATLASCOIN_URL
 
+# Exits at once, leaving a sleeping child that holds the output pipe open
+BACKGROUND_CHILD = "python3 -c \"__import__('subprocess').Popen(['sleep', '30'])\""
+
+
+def _contract(*criteria):
+    return Contract(soul_purpose="Test", escrow=50, criteria=list(criteria))
+
+
+def _shell(name, command, pass_when="exit_code == 0", **kwargs):
+    return Criterion(
+        name=name,
+        type=CriterionType.SHELL,
+        command=command,
+        pass_when=pass_when,
+        **kwargs,
+    )
+
 
 # =========================================================================
 # Task 5 — Contract Model and Verifier
@@ -905,10 +931,12 @@ class TestVerifierHostile:
         assert result["all_passed"] is True
         assert "hello" in result["results"][0]["output"]
 
-    def test_shell_timeout_fires_on_slow_command(self, project_with_session):
+    def test_shell_timeout_fires_on_slow_command(
+        self, project_with_session, monkeypatch
+    ):
         """Command that sleeps past the 120s timeout should fail gracefully.
 
-        We use a short sleep and mock the timeout to avoid waiting 120s.
+        We lower the timeout to avoid waiting 120s; the process is killed.
         """
         contract = Contract(
             soul_purpose="Test timeout",
@@ -923,16 +951,36 @@ class TestVerifierHostile:
                 ),
             ],
         )
-        # Mock subprocess.run to raise TimeoutExpired immediately
-        with patch(
-            "atlas_session.contract.verifier.subprocess.run",
-            side_effect=subprocess.TimeoutExpired(cmd="sleep 200", timeout=120),
-        ):
-            result = run_tests(str(project_with_session), contract)
+        monkeypatch.setattr(verifier, "_SHELL_TIMEOUT", 0.2)
+        start = time.monotonic()
+        result = run_tests(str(project_with_session), contract)
+        assert time.monotonic() - start < 5
         assert result["all_passed"] is False
         assert result["results"][0]["passed"] is False
         assert "timed out" in result["results"][0]["output"].lower()
 
+    def test_shell_timeout_kills_background_children(
+        self, project_with_session, monkeypatch
+    ):
+        """A child that inherited the output pipe cannot outlive the timeout."""
+        contract = Contract(
+            soul_purpose="Test timeout",
+            escrow=50,
+            criteria=[
+                Criterion(
+                    name="spawner",
+                    type=CriterionType.SHELL,
+                    command=BACKGROUND_CHILD,
+                    pass_when="exit_code == 0",
+                ),
+            ],
+        )
+        monkeypatch.setattr(verifier, "_SHELL_TIMEOUT", 0.5)
+        start = time.monotonic()
+        result = run_tests(str(project_with_session), contract)
+        assert time.monotonic() - start < 5
+        assert "timed out" in result["results"][0]["output"]
+
     def test_shell_massive_output_truncated(self, project_with_session):
         """Command producing massive output gets truncated to 500 chars.
 
@@ -1227,3 +1275,881 @@ class TestVerifierEdgeCases:
             is False
         )
         assert _evaluate_pass_when("contains:NEEDLE", output="", value="") is False
+
+
+# =========================================================================
+# Parallel execution — worker pool, exclusive and depends_on scheduling
+# =========================================================================
+
+
+class TestParallelRunTests:
+    """Concurrent criterion execution in run_tests()."""
+
+    def test_default_keeps_declaration_order(self, project_with_session):
+        """Without opting in, a check of build output sees the build."""
+        build = (
+            "python3 -c \"__import__('time').sleep(0.3) or "
+            "open('dist.js', 'w').write('ok')\""
+        )
+        contract = Contract(
+            soul_purpose="Ordered",
+            escrow=50,
+            criteria=[
+                _shell("build", build),
+                _shell("built", "test -f dist.js"),
+            ],
+        )
+        result = run_tests(str(project_with_session), contract)
+        assert result["all_passed"] is True, result["results"]
+
+    def test_independent_criteria_run_concurrently(self, project_with_session):
+        """Three 0.5s sleeps finish in well under their 1.5s sum."""
+        contract = Contract(
+            soul_purpose="Parallel",
+            escrow=50,
+            criteria=[_shell(f"sleep_{i}", "sleep 0.5") for i in range(3)],
+        )
+        start = time.monotonic()
+        result = run_tests(str(project_with_session), contract, max_workers=3)
+        elapsed = time.monotonic() - start
+        assert result["all_passed"] is True
+        assert elapsed < 1.2
+
+    def test_results_keep_declaration_order(self, project_with_session):
+        """Results are reported in criteria order regardless of finish order."""
+        contract = Contract(
+            soul_purpose="Order",
+            escrow=50,
+            criteria=[
+                _shell("slow", "sleep 0.3"),
+                _shell("fast", "true"),
+            ],
+        )
+        result = run_tests(str(project_with_session), contract, max_workers=2)
+        assert [r["name"] for r in result["results"]] == ["slow", "fast"]
+
+    def test_single_worker_runs_sequentially(self, project_with_session):
+        """max_workers=1 still produces the full result set."""
+        contract = Contract(
+            soul_purpose="Sequential",
+            escrow=50,
+            criteria=[_shell("a", "true"), _shell("b", "false")],
+        )
+        result = run_tests(str(project_with_session), contract, max_workers=1)
+        assert result["summary"] == "1/2 criteria passed (50%)"
+
+    def test_dependency_runs_after_success(self, project_with_session):
+        """A criterion whose dependency passes is executed normally."""
+        contract = Contract(
+            soul_purpose="Deps",
+            escrow=50,
+            criteria=[
+                _shell("test", "echo ran", depends_on=["build"]),
+                _shell("build", "true"),
+            ],
+        )
+        result = run_tests(str(project_with_session), contract)
+        assert result["all_passed"] is True
+        assert "ran" in result["results"][0]["output"]
+
+    def test_dependency_failure_skips_dependent(self, project_with_session):
+        """A criterion is skipped (and fails) when its dependency fails."""
+        contract = Contract(
+            soul_purpose="Deps fail",
+            escrow=50,
+            criteria=[
+                _shell("build", "false"),
+                _shell("test", "echo ran", depends_on=["build"]),
+            ],
+        )
+        result = run_tests(str(project_with_session), contract)
+        dependent = result["results"][1]
+        assert dependent["passed"] is False
+        assert dependent["skipped"] is True
+        assert "build" in dependent["output"]
+
+    def test_unknown_dependency_skipped(self, project_with_session):
+        """depends_on naming a missing criterion is reported, not run."""
+        contract = Contract(
+            soul_purpose="Unknown dep",
+            escrow=50,
+            criteria=[_shell("test", "true", depends_on=["nope"])],
+        )
+        result = run_tests(str(project_with_session), contract)
+        assert result["results"][0]["skipped"] is True
+        assert "unknown dependency" in result["results"][0]["output"]
+
+    def test_dependency_cycle_skipped(self, project_with_session):
+        """Mutually dependent criteria are skipped instead of deadlocking."""
+        contract = Contract(
+            soul_purpose="Cycle",
+            escrow=50,
+            criteria=[
+                _shell("a", "true", depends_on=["b"]),
+                _shell("b", "true", depends_on=["a"]),
+            ],
+        )
+        result = run_tests(str(project_with_session), contract)
+        assert all("cycle" in r["output"] for r in result["results"])
+        assert result["all_passed"] is False
+
+    def test_exclusive_criteria_get_own_batch(self):
+        """Exclusive criteria are scheduled alone; others share a batch."""
+        criteria = [
+            _shell("a", "true"),
+            _shell("b", "true", exclusive=True),
+            _shell("c", "true"),
+        ]
+        batches, blocked = _schedule(criteria)
+        assert blocked == {}
+        assert batches == [[0, 2], [1]]
+
+    def test_dependency_fields_round_trip(self):
+        """exclusive/depends_on survive to_dict -> from_dict."""
+        original = _shell("t", "true", exclusive=True, depends_on=["b"])
+        restored = Criterion.from_dict(original.to_dict())
+        assert restored.exclusive is True
+        assert restored.depends_on == ["b"]
+
+
+# =========================================================================
+# Async runner — asyncio subprocesses for the async MCP tools
+# =========================================================================
+
+
+class TestRunTestsAsync:
+    """Tests for run_tests_async()."""
+
+    async def test_matches_sync_results(self, project_with_session):
+        """Async and sync runners agree on results and score."""
+        contract = _contract(
+            _shell("ok", "echo hello", pass_when="contains:hello"),
+            _shell("bad", "false"),
+            Criterion(
+                name="ctx",
+                type=CriterionType.FILE_EXISTS,
+                path="session-context/CLAUDE-activeContext.md",
+                pass_when="not_empty",
+            ),
+        )
+        expected = run_tests(str(project_with_session), contract)
+        result = await run_tests_async(str(project_with_session), contract)
+        assert result == expected
+
+    async def test_rejected_command_not_spawned(self, project_with_session):
+        """Allowlist validation applies to the async path too."""
+        contract = _contract(_shell("evil", "rm -rf /"))
+        result = await run_tests_async(str(project_with_session), contract)
+        assert "Command rejected" in result["results"][0]["output"]
+
+    async def test_timeout_kills_process(self, project_with_session, monkeypatch):
+        """A command exceeding the timeout fails with a timed-out message."""
+        monkeypatch.setattr(verifier, "_SHELL_TIMEOUT", 0.2)
+        contract = _contract(_shell("slow", "sleep 5"))
+        start = time.monotonic()
+        result = await run_tests_async(str(project_with_session), contract)
+        assert time.monotonic() - start < 2
+        assert result["results"][0]["passed"] is False
+        assert "timed out" in result["results"][0]["output"]
+
+    async def test_timeout_kills_background_children(
+        self, project_with_session, monkeypatch
+    ):
+        """The pipe held by a backgrounded child does not stall the runner."""
+        monkeypatch.setattr(verifier, "_SHELL_TIMEOUT", 0.5)
+        contract = _contract(_shell("spawner", BACKGROUND_CHILD))
+        start = time.monotonic()
+        result = await run_tests_async(str(project_with_session), contract)
+        assert time.monotonic() - start < 5
+        assert "timed out" in result["results"][0]["output"]
+
+    async def test_event_loop_not_blocked(self, project_with_session):
+        """Other coroutines keep running while a criterion executes."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.05)
+
+        task = asyncio.create_task(ticker())
+        try:
+            await run_tests_async(
+                str(project_with_session), _contract(_shell("s", "sleep 0.5"))
+            )
+        finally:
+            task.cancel()
+        assert ticks >= 5
+
+    async def test_cancellation_propagates(self, project_with_session):
+        """Cancelling the run cancels the in-flight subprocess wait."""
+        task = asyncio.create_task(
+            run_tests_async(
+                str(project_with_session), _contract(_shell("s", "sleep 5"))
+            )
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestAtlasCoinClientPool:
+    """Shared, lifecycle-managed httpx client for AtlasCoin calls."""
+
+    async def test_client_reused_across_calls(self):
+        """get_client returns the same pooled client within a loop."""
+        try:
+            assert atlascoin.get_client() is atlascoin.get_client()
+        finally:
+            await atlascoin.aclose()
+
+    async def test_aclose_closes_and_resets(self):
+        """aclose closes the pool; the next call builds a fresh client."""
+        first = atlascoin.get_client()
+        await atlascoin.aclose()
+        assert first.is_closed
+        second = atlascoin.get_client()
+        try:
+            assert second is not first
+        finally:
+            await atlascoin.aclose()
+
+    async def test_aclose_without_client_is_noop(self):
+        """Closing when nothing was created does not raise."""
+        await atlascoin.aclose()
+        await atlascoin.aclose()
+
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        """ATLASCOIN_HTTP2 without the h2 package still yields a client."""
+        monkeypatch.setattr(atlascoin, "ATLASCOIN_HTTP2", True)
+        monkeypatch.setattr(atlascoin, "_http2_available", lambda: False)
+        await atlascoin.aclose()
+        try:
+            assert not atlascoin.get_client().is_closed
+        finally:
+            await atlascoin.aclose()
+
+    @respx.mock
+    async def test_sequential_calls_share_pool(self):
+        """Several bounty calls go through one client instance."""
+        respx.get(f"{ATLASCOIN_URL}/health").mock(return_value=httpx.Response(200))
+        respx.get(f"{ATLASCOIN_URL}/api/bounties/b1").mock(
+            return_value=httpx.Response(200, json={"id": "b1"})
+        )
+        try:
+            await atlascoin.health()
+            client = atlascoin.get_client()
+            result = await atlascoin.get_bounty("b1")
+            assert result["status"] == "ok"
+            assert atlascoin.get_client() is client
+        finally:
+            await atlascoin.aclose()
+
+
+# =========================================================================
+# Result cache — unchanged criteria reuse their previous result
+# =========================================================================
+
+
+class TestCriteriaResultCache:
+    """run_tests(use_cache=True) with git and declared-input fingerprints."""
+
+    # Prints a fresh value on every execution, so re-runs are detectable
+    NONCE = "python3 -c \"print(__import__('time').time_ns())\""
+
+    def _nonce_contract(self, **kwargs):
+        return _contract(_shell("nonce", self.NONCE, **kwargs))
+
+    def test_unchanged_git_tree_hits_cache(self, project_with_git):
+        """Second run on an unchanged tree returns the stored result."""
+        contract = self._nonce_contract()
+        first = run_tests(str(project_with_git), contract, use_cache=True)
+        second = run_tests(str(project_with_git), contract, use_cache=True)
+        assert "cached" not in first["results"][0]
+        assert second["results"][0]["cached"] is True
+        assert second["results"][0]["output"] == first["results"][0]["output"]
+        assert (project_with_git / "session-context" / ".criteria-cache.json").is_file()
+
+    def test_worktree_change_invalidates(self, project_with_git):
+        """Editing a tracked file forces the criterion to run again."""
+        contract = self._nonce_contract()
+        first = run_tests(str(project_with_git), contract, use_cache=True)
+        (project_with_git / "README.md").write_text("# Changed\n")
+        second = run_tests(str(project_with_git), contract, use_cache=True)
+        assert "cached" not in second["results"][0]
+        assert second["results"][0]["output"] != first["results"][0]["output"]
+
+    def test_session_context_change_invalidates(self, project_with_git):
+        """Files under session-context/ are inputs too; only the cache is not."""
+        contract = self._nonce_contract()
+        run_tests(str(project_with_git), contract, use_cache=True)
+        (project_with_git / "session-context" / "notes.md").write_text("DONE\n")
+        second = run_tests(str(project_with_git), contract, use_cache=True)
+        assert "cached" not in second["results"][0]
+
+    def test_changed_definition_misses(self, project_with_git):
+        """A different pass_when is a different cache key."""
+        run_tests(str(project_with_git), self._nonce_contract(), use_cache=True)
+        changed = self._nonce_contract()
+        changed.criteria[0].pass_when = "exit_code != 1"
+        result = run_tests(str(project_with_git), changed, use_cache=True)
+        assert "cached" not in result["results"][0]
+
+    def test_non_git_without_inputs_not_cached(self, project_with_session):
+        """Outside git, criteria with no declared inputs always run."""
+        contract = self._nonce_contract()
+        run_tests(str(project_with_session), contract, use_cache=True)
+        second = run_tests(str(project_with_session), contract, use_cache=True)
+        assert "cached" not in second["results"][0]
+
+    def test_declared_inputs_fingerprint(self, project_with_session):
+        """Declared inputs key the cache by mtime/size outside git."""
+        src = project_with_session / "app.py"
+        src.write_text("x = 1\n")
+        contract = self._nonce_contract(inputs=["*.py"])
+        run_tests(str(project_with_session), contract, use_cache=True)
+        hit = run_tests(str(project_with_session), contract, use_cache=True)
+        assert hit["results"][0]["cached"] is True
+
+        src.write_text("x = 22\n")
+        miss = run_tests(str(project_with_session), contract, use_cache=True)
+        assert "cached" not in miss["results"][0]
+
+    def test_declared_directory_covers_its_files(self, project_with_session):
+        """Editing a file inside a listed directory misses the cache."""
+        src = project_with_session / "src" / "pkg" / "a.py"
+        src.parent.mkdir(parents=True)
+        src.write_text("x = 1\n")
+        contract = self._nonce_contract(inputs=["src"])
+        run_tests(str(project_with_session), contract, use_cache=True)
+        hit = run_tests(str(project_with_session), contract, use_cache=True)
+        assert hit["results"][0]["cached"] is True
+
+        src.write_text("x = 22\n")
+        miss = run_tests(str(project_with_session), contract, use_cache=True)
+        assert "cached" not in miss["results"][0]
+
+    def test_cache_disabled_by_default(self, project_with_git):
+        """run_tests without use_cache neither reads nor writes the cache."""
+        run_tests(str(project_with_git), self._nonce_contract())
+        assert not (
+            project_with_git / "session-context" / ".criteria-cache.json"
+        ).exists()
+
+    async def test_async_runner_uses_cache(self, project_with_git):
+        """run_tests_async shares the same on-disk cache."""
+        contract = self._nonce_contract()
+        run_tests(str(project_with_git), contract, use_cache=True)
+        result = await run_tests_async(str(project_with_git), contract, use_cache=True)
+        assert result["results"][0]["cached"] is True
+
+
+# =========================================================================
+# Streaming output capture and progress events
+# =========================================================================
+
+
+class TestStreamingOutput:
+    """Bounded head/tail output capture and criterion progress events."""
+
+    def test_capture_short_output_is_stripped(self):
+        """Output under the limit matches a plain strip()."""
+        capture = verifier._OutputCapture()
+        for chunk in (b"  \n", b"hello\r\n", b"world  \n\n"):
+            capture.feed(chunk)
+        assert capture.text() == "hello\nworld"
+
+    def test_capture_keeps_head_and_tail(self):
+        """Long output keeps its start and end around a marker."""
+        capture = verifier._OutputCapture(limit=50)
+        capture.feed(b"START" + b"x" * 10000)
+        capture.feed(b"y" * 10000 + b"END\n")
+        text = capture.text()
+        assert len(text) == 50
+        assert text.startswith("START")
+        assert text.endswith("END")
+        assert verifier._OUTPUT_MARKER in text
+
+    def test_capture_long_trailing_whitespace(self):
+        """Whitespace longer than the tail window does not cut real output."""
+        capture = verifier._OutputCapture()
+        capture.feed(b"x" * 300 + b"\n" * 1000)
+        assert capture.text() == "x" * 300
+
+        capture = verifier._OutputCapture(limit=50)
+        capture.feed(b"a" * 100 + b" \n" * 100)
+        capture.feed(b"b" * 10 + b"\n" * 100)
+        text = capture.text()
+        assert len(text) == 50
+        assert text.endswith(" \n" * 5 + "b" * 10)
+
+    def test_capture_split_utf8_sequence(self):
+        """A multi-byte character split across reads decodes intact."""
+        capture = verifier._OutputCapture()
+        data = "caf\u00e9".encode()
+        capture.feed(data[:4])
+        capture.feed(data[4:])
+        assert capture.text() == "caf\u00e9"
+
+    def test_failure_at_end_of_long_output_visible(self, project_with_session):
+        """The last lines of a noisy command survive truncation."""
+        command = "python3 -c \"print('X' * 50000 + '\\nFAILED: boom')\""
+        contract = _contract(_shell("noisy", command, pass_when="contains:FAILED"))
+        result = run_tests(str(project_with_session), contract)
+        output = result["results"][0]["output"]
+        assert len(output) == 500
+        assert output.endswith("FAILED: boom")
+        assert result["all_passed"] is True
+
+    async def test_async_capture_matches_sync(self, project_with_session):
+        """Both runners produce the same bounded output."""
+        command = "python3 -c \"print('A' * 5000 + '\\ntail')\""
+        contract = _contract(_shell("noisy", command))
+        expected = run_tests(str(project_with_session), contract)
+        result = await run_tests_async(str(project_with_session), contract)
+        assert result == expected
+
+    def test_events_cover_every_criterion(self, project_with_session):
+        """Each criterion gets a finish event; run ones get a start too."""
+        contract = _contract(
+            _shell("a", "true"),
+            _shell("b", "false"),
+            _shell("c", "true", depends_on=["b"]),
+        )
+        events = []
+        run_tests(str(project_with_session), contract, on_event=events.append)
+        finished = {e["name"]: e for e in events if e["event"] == "finish"}
+        started = {e["name"] for e in events if e["event"] == "start"}
+        assert started == {"a", "b"}
+        assert finished["a"]["passed"] is True
+        assert finished["b"]["passed"] is False
+        assert finished["c"]["skipped"] is True
+        assert sorted(e["done"] for e in finished.values()) == [1, 2, 3]
+        assert all(e["total"] == 3 for e in events)
+
+    async def test_async_events_accept_coroutines(self, project_with_session):
+        """run_tests_async awaits coroutine callbacks."""
+        contract = _contract(_shell("a", "true"), _shell("b", "true"))
+        events = []
+
+        async def on_event(event):
+            await asyncio.sleep(0)
+            events.append((event["event"], event["name"]))
+
+        await run_tests_async(str(project_with_session), contract, on_event=on_event)
+        assert sorted(events) == [
+            ("finish", "a"),
+            ("finish", "b"),
+            ("start", "a"),
+            ("start", "b"),
+        ]
+
+
+# =========================================================================
+# Fail-fast and cost-ordered verification
+# =========================================================================
+
+
+class TestFailFast:
+    """run_tests(fail_fast=True) ordering and short-circuiting."""
+
+    @staticmethod
+    def _file(name, path):
+        return Criterion(
+            name=name, type=CriterionType.FILE_EXISTS, path=path, pass_when="exists"
+        )
+
+    def _started(self, project_dir, contract, **kwargs):
+        events = []
+        result = run_tests(
+            project_dir, contract, max_workers=1, on_event=events.append, **kwargs
+        )
+        return result, [e["name"] for e in events if e["event"] == "start"]
+
+    def test_cheap_criteria_run_first(self, project_with_session):
+        """File checks run before shell commands, heavier shells first."""
+        contract = _contract(
+            _shell("light", "true", weight=0.5),
+            _shell("heavy", "true", weight=2.0),
+            self._file("ctx", "session-context/CLAUDE-activeContext.md"),
+        )
+        result, started = self._started(
+            str(project_with_session), contract, fail_fast=True
+        )
+        assert started == ["ctx", "heavy", "light"]
+        assert result["all_passed"] is True
+        assert result["short_circuited"] is False
+        assert [r["name"] for r in result["results"]] == ["light", "heavy", "ctx"]
+
+    def test_cheap_failure_skips_shell(self, project_with_session):
+        """A failing file check means no shell command runs at all."""
+        contract = _contract(
+            _shell("tests", "true", weight=2.0),
+            self._file("missing", "nope.txt"),
+        )
+        result, started = self._started(
+            str(project_with_session), contract, fail_fast=True
+        )
+        assert started == ["missing"]
+        assert result["all_passed"] is False
+        assert result["short_circuited"] is True
+        assert result["results"][0]["skipped"] is True
+        assert result["score"] == 0
+
+    def test_full_score_runs_everything(self, project_with_session):
+        """full_score keeps the order but still runs every criterion."""
+        contract = _contract(
+            _shell("tests", "true", weight=2.0),
+            self._file("missing", "nope.txt"),
+        )
+        result, started = self._started(
+            str(project_with_session), contract, fail_fast=True, full_score=True
+        )
+        assert started == ["missing", "tests"]
+        assert result["score"] == round(2 / 3 * 100, 1)
+        assert result["short_circuited"] is False
+
+    def test_default_runs_everything(self, project_with_session):
+        """Without fail_fast, a failure does not stop the run."""
+        contract = _contract(_shell("bad", "false"), _shell("ok", "true"))
+        result = run_tests(str(project_with_session), contract, max_workers=1)
+        assert result["results"][1]["passed"] is True
+        assert "short_circuited" not in result
+
+    async def test_async_matches_sync(self, project_with_session):
+        """run_tests_async short-circuits identically."""
+        contract = _contract(
+            _shell("bad", "false"),
+            _shell("later", "true"),
+        )
+        expected = run_tests(
+            str(project_with_session), contract, max_workers=1, fail_fast=True
+        )
+        result = await run_tests_async(
+            str(project_with_session), contract, max_workers=1, fail_fast=True
+        )
+        assert result == expected
+        assert result["results"][1]["skipped"] is True
+
+
+# =========================================================================
+# Shared evaluation context for context_check criteria
+# =========================================================================
+
+
+class TestEvalContext:
+    """Per-run memoized facts behind context_check criteria."""
+
+    @staticmethod
+    def _check(name, field_name, pass_when):
+        return Criterion(
+            name=name,
+            type=CriterionType.CONTEXT_CHECK,
+            field=field_name,
+            pass_when=pass_when,
+        )
+
+    def _facts_contract(self, *checks):
+        return _contract(*(self._check(*check) for check in checks))
+
+    def test_read_context_called_once_per_run(self, project_with_session, monkeypatch):
+        """Every context_check in a run shares one read_context call."""
+        calls = []
+        original = verifier.read_context
+
+        def counting(project_dir):
+            calls.append(project_dir)
+            return original(project_dir)
+
+        monkeypatch.setattr(verifier, "read_context", counting)
+        contract = self._facts_contract(
+            ("a", "open_tasks", "not_empty"),
+            ("b", "soul_purpose", "not_empty"),
+            ("c", "open_task_count", "> 0"),
+        )
+        run_tests(str(project_with_session), contract)
+        assert len(calls) == 1
+
+    async def test_async_runner_shares_context(self, project_with_session, monkeypatch):
+        """run_tests_async shares the context the same way."""
+        calls = []
+        original = verifier.read_context
+
+        def counting(project_dir):
+            calls.append(project_dir)
+            return original(project_dir)
+
+        monkeypatch.setattr(verifier, "read_context", counting)
+        contract = self._facts_contract(
+            ("a", "open_tasks", "not_empty"), ("b", "soul_purpose", "not_empty")
+        )
+        await run_tests_async(str(project_with_session), contract)
+        assert len(calls) == 1
+
+    def test_derived_fields(self, project_with_soul_purpose):
+        """Counts and flags derived from read_context are checkable."""
+        contract = self._facts_contract(
+            ("tasks", "open_task_count", "> 0"),
+            ("purpose", "has_soul_purpose", "== 1"),
+            ("git", "is_git", "== 0"),
+        )
+        result = run_tests(str(project_with_soul_purpose), contract)
+        assert [r["passed"] for r in result["results"]] == [True, True, True]
+
+    def test_git_fields(self, project_with_git):
+        """Git facts come from one probe of the working tree."""
+        (project_with_git / "new.txt").write_text("x\n")
+        contract = self._facts_contract(
+            ("head", "git_head", "not_empty"),
+            ("dirty", "git_dirty", "== 1"),
+            ("changed", "git_changed_count", "== 1"),
+        )
+        result = run_tests(str(project_with_git), contract)
+        assert result["all_passed"] is True, result["results"]
+
+
+# =========================================================================
+# Compiled pass_when expressions
+# =========================================================================
+
+
+class TestPassWhenExpressions:
+    """The pass_when expression language in contract/expr.py."""
+
+    def test_boolean_combinators(self):
+        """and/or/not combine comparisons, with parentheses for grouping."""
+        assert _evaluate_pass_when(
+            "exit_code == 0 and not_empty", exit_code=0, output="x"
+        )
+        assert not _evaluate_pass_when("exit_code == 0 and not_empty", exit_code=0)
+        assert _evaluate_pass_when("exit_code == 1 or exit_code == 2", exit_code=2)
+        assert _evaluate_pass_when("not (exit_code > 0)", exit_code=0)
+
+    def test_output_contains_and_matches(self):
+        """contains is literal; matches is a regex search over lines."""
+        output = "collected 12 items\n12 passed in 0.5s"
+        assert _evaluate_pass_when("output contains 'passed'", output=output)
+        assert not _evaluate_pass_when("output contains 'failed'", output=output)
+        assert _evaluate_pass_when(r"output matches '^\d+ passed'", output=output)
+        assert _evaluate_pass_when(
+            "not output contains 'FAILED' and exit_code == 0",
+            exit_code=0,
+            output=output,
+        )
+
+    def test_number_and_count_extraction(self):
+        """number() reads a regex group as a number; count() counts matches."""
+        output = "ok 1\nok 2\nnot ok 3\n42 passed, 1 failed"
+        assert _evaluate_pass_when(r"number('(\d+) passed') >= 40", output=output)
+        assert _evaluate_pass_when(r"number('(\d+) failed') == 1", output=output)
+        assert _evaluate_pass_when("count('^ok') == 2", output=output)
+        # No match: the comparison is false either way
+        assert not _evaluate_pass_when(r"number('(\d+) skipped') == 0", output=output)
+        assert not _evaluate_pass_when(r"number('(\d+) skipped') != 0", output=output)
+
+    def test_value_comparisons(self):
+        """Values compare as strings or numbers; lists compare by length."""
+        assert _evaluate_pass_when("value == 'main'", value="main")
+        assert _evaluate_pass_when("len(value) >= 2", value=["a", "b"])
+        assert _evaluate_pass_when("value > 1", value=["a", "b"])
+        assert _evaluate_pass_when("value contains 'b'", value=["a", "b"])
+        assert not _evaluate_pass_when("value == 1", value=None)
+
+    def test_invalid_expressions_fail_closed(self):
+        """Expressions that do not compile evaluate to False."""
+        for bad in (
+            "exit_code ==",
+            "(exit_code == 0",
+            "output matches '['",
+            "foo",
+            "> 0 and < 10",
+            "== abc",
+        ):
+            assert _evaluate_pass_when(bad, exit_code=0, output="x") is False
+            with pytest.raises(PassWhenError):
+                compile_pass_when(bad)
+
+    def test_compiled_once(self):
+        """The same expression text reuses one compiled check."""
+        text = "exit_code == 0 and output contains 'once'"
+        assert compile_pass_when(text) is compile_pass_when(text)
+
+    def test_in_shell_criterion(self, project_with_session):
+        """Expressions replace extra shell commands in a real criterion."""
+        contract = Contract(
+            soul_purpose="Expr",
+            escrow=50,
+            criteria=[
+                Criterion(
+                    name="count",
+                    type=CriterionType.SHELL,
+                    command="python3 -c \"print('3 passed, 0 failed')\"",
+                    pass_when=r"exit_code == 0 and number('(\d+) passed') >= 3",
+                )
+            ],
+        )
+        assert run_tests(str(project_with_session), contract)["all_passed"] is True
+
+
+# =========================================================================
+# Native in-process criterion types
+# =========================================================================
+
+
+class TestNativeCriteria:
+    """glob_count, file_contains/file_regex, line_count, git_ref, json_path."""
+
+    @staticmethod
+    def _run(project_dir, **kwargs):
+        criterion = Criterion(name="native", **kwargs)
+        contract = Contract(soul_purpose="Native", escrow=50, criteria=[criterion])
+        return run_tests(str(project_dir), contract)["results"][0]
+
+    @pytest.fixture
+    def src_tree(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x = 1\n# TODO: tidy\ny = 2\n")
+        (tmp_path / "src" / "b.py").write_text("z = 3")
+        (tmp_path / "notes.txt").write_text("TODO outside src\n")
+        return tmp_path
+
+    def test_glob_count(self, src_tree):
+        """Counts files matching a glob."""
+        result = self._run(
+            src_tree, type=CriterionType.GLOB_COUNT, path="src/*.py", pass_when="== 2"
+        )
+        assert result["passed"] is True
+        assert "2 file(s)" in result["output"]
+
+    def test_file_contains_no_todos(self, src_tree):
+        """Matching lines are counted and quoted with their location."""
+        result = self._run(
+            src_tree,
+            type=CriterionType.FILE_CONTAINS,
+            path="src/**/*.py",
+            pattern="TODO",
+            pass_when="== 0",
+        )
+        assert result["passed"] is False
+        assert "src/a.py:2: # TODO: tidy" in result["output"]
+
+    def test_file_regex(self, src_tree):
+        """Regex patterns count matching lines."""
+        result = self._run(
+            src_tree,
+            type=CriterionType.FILE_REGEX,
+            path="src/*.py",
+            pattern=r"^[a-z] = \d",
+            pass_when="== 3",
+        )
+        assert result["passed"] is True
+
+    def test_line_count(self, src_tree):
+        """Lines are summed across files, counting an unterminated last line."""
+        result = self._run(
+            src_tree, type=CriterionType.LINE_COUNT, path="src/*.py", pass_when="== 4"
+        )
+        assert result["passed"] is True
+
+    def test_paths_confined_to_project(self, src_tree, tmp_path_factory):
+        """Paths resolving outside the project directory are ignored."""
+        outside = tmp_path_factory.mktemp("outside") / "secret.txt"
+        outside.write_text("TODO\n")
+        (src_tree / "link.txt").symlink_to(outside)
+        result = self._run(
+            src_tree,
+            type=CriterionType.FILE_CONTAINS,
+            path="link.txt",
+            pattern="TODO",
+            pass_when="== 0",
+        )
+        assert result["passed"] is True
+        result = self._run(
+            src_tree,
+            type=CriterionType.GLOB_COUNT,
+            path=f"../{outside.parent.name}/*",
+            pass_when="== 0",
+        )
+        assert result["passed"] is True
+
+    def test_json_path(self, tmp_path):
+        """Dotted paths index objects and lists."""
+        (tmp_path / "package.json").write_text(
+            json.dumps(
+                {"version": "1.2.0", "scripts": {"test": "jest"}, "files": ["a"]}
+            )
+        )
+        ok = self._run(
+            tmp_path,
+            type=CriterionType.JSON_PATH,
+            path="package.json",
+            field="scripts.test",
+            pass_when="value == 'jest'",
+        )
+        assert ok["passed"] is True
+        first = self._run(
+            tmp_path,
+            type=CriterionType.JSON_PATH,
+            path="package.json",
+            field="files.0",
+            pass_when="not_empty",
+        )
+        assert first["passed"] is True
+        missing = self._run(
+            tmp_path,
+            type=CriterionType.JSON_PATH,
+            path="package.json",
+            field="scripts.lint",
+            pass_when="not_empty",
+        )
+        assert missing["passed"] is False
+        assert "not found" in missing["output"]
+
+    def test_git_ref_matches_git(self, project_with_git):
+        """HEAD resolves to the same commit git reports, without running git."""
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=project_with_git,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert resolve_ref(project_with_git) == head
+        result = self._run(
+            project_with_git, type=CriterionType.GIT_REF, pass_when="not_empty"
+        )
+        assert result["passed"] is True
+        assert head in result["output"]
+
+    def test_git_ref_packed_and_unborn(self, project_with_git, tmp_path_factory):
+        """Packed refs resolve; a repo without commits has no HEAD."""
+        subprocess.run(
+            ["git", "tag", "v1"], cwd=project_with_git, check=True, capture_output=True
+        )
+        subprocess.run(
+            ["git", "pack-refs", "--all"],
+            cwd=project_with_git,
+            check=True,
+            capture_output=True,
+        )
+        assert resolve_ref(project_with_git, "v1") == resolve_ref(project_with_git)
+
+        empty = tmp_path_factory.mktemp("empty")
+        subprocess.run(["git", "init", "-q"], cwd=empty, check=True)
+        assert resolve_ref(empty) is None
+        result = self._run(empty, type=CriterionType.GIT_REF, pass_when="not_empty")
+        assert result["passed"] is False
+
+    def test_no_subprocess_spawned(self, src_tree, monkeypatch):
+        """Native criteria never fork a command."""
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError("subprocess spawned")
+
+        monkeypatch.setattr(subprocess, "Popen", forbidden)
+        result = self._run(
+            src_tree, type=CriterionType.LINE_COUNT, path="src/*.py", pass_when="> 0"
+        )
+        assert result["passed"] is True
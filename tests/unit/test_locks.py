@@ -0,0 +1,212 @@
+"""Unit tests for atlas_session.common.locks — per-project advisory locks.
+
+Covers:
+  TestProjectLock: re-entrancy, exclusion across threads and processes,
+    lock files private to the user and removed on release
+  TestProjectLockAsync: asyncio waiters, timeouts, capped waits on the loop
+  TestLockedOperations: concurrent mutating operations serialize
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from atlas_session.common import locks
+from atlas_session.common.locks import (
+    LOCK_DIR,
+    LockTimeout,
+    locked,
+    project_lock,
+    project_lock_async,
+)
+from atlas_session.session.operations import archive
+
+SRC_DIR = str(Path(__file__).resolve().parents[2] / "src")
+
+
+def _hold_in_thread(project_dir, release: threading.Event) -> threading.Event:
+    acquired = threading.Event()
+
+    def holder():
+        with project_lock(project_dir):
+            acquired.set()
+            release.wait(5)
+
+    threading.Thread(target=holder, daemon=True).start()
+    assert acquired.wait(5)
+    return acquired
+
+
+class TestProjectLock:
+    def test_reentrant_for_same_thread(self, tmp_path):
+        with project_lock(str(tmp_path)), project_lock(str(tmp_path)):
+            pass
+        with project_lock(str(tmp_path), timeout=0):
+            pass
+
+    def test_excludes_other_threads(self, tmp_path):
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        try:
+            with pytest.raises(LockTimeout), project_lock(str(tmp_path), timeout=0.1):
+                pass
+        finally:
+            release.set()
+
+    def test_waits_for_release(self, tmp_path):
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        threading.Timer(0.1, release.set).start()
+        with project_lock(str(tmp_path), timeout=5):
+            pass
+
+    def test_path_spellings_share_a_lock(self, tmp_path):
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        try:
+            with (
+                pytest.raises(LockTimeout),
+                project_lock(f"{tmp_path}/./", timeout=0.1),
+            ):
+                pass
+        finally:
+            release.set()
+
+    def test_projects_are_independent(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path / "a"), release)
+        try:
+            with project_lock(str(tmp_path / "b"), timeout=0.1):
+                pass
+        finally:
+            release.set()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fcntl locks only")
+    def test_excludes_other_processes(self, tmp_path):
+        script = (
+            "import sys, time\n"
+            "from atlas_session.common.locks import project_lock\n"
+            "with project_lock(sys.argv[1]):\n"
+            "    print('locked', flush=True)\n"
+            "    time.sleep(2)\n"
+        )
+        env = {**os.environ, "PYTHONPATH": SRC_DIR}
+        proc = subprocess.Popen(
+            [sys.executable, "-c", script, str(tmp_path)],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        try:
+            assert proc.stdout.readline().strip() == "locked"
+            with pytest.raises(LockTimeout), project_lock(str(tmp_path), timeout=0.2):
+                pass
+        finally:
+            proc.wait(10)
+        with project_lock(str(tmp_path), timeout=1):
+            pass
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fcntl locks only")
+    def test_lock_dir_is_private_to_the_user(self, tmp_path):
+        with project_lock(str(tmp_path)):
+            assert LOCK_DIR.is_relative_to(Path.home())
+            assert LOCK_DIR.stat().st_uid == os.getuid()
+            assert LOCK_DIR.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fcntl locks only")
+    def test_lock_file_removed_on_release(self, tmp_path):
+        with project_lock(str(tmp_path)):
+            held = set(LOCK_DIR.iterdir())
+        assert not held & set(LOCK_DIR.iterdir())
+
+
+class TestProjectLockAsync:
+    async def test_tasks_take_turns(self, tmp_path):
+        order = []
+
+        async def worker(name):
+            async with project_lock_async(str(tmp_path)):
+                order.append(f"{name}-in")
+                # No await inside: holders must not yield while locked
+                order.append(f"{name}-out")
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(worker(n) for n in "abc"))
+        assert len(order) == 6
+        for i in range(0, 6, 2):
+            assert order[i].split("-")[0] == order[i + 1].split("-")[0]
+
+    async def test_waits_for_thread_holder(self, tmp_path):
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        asyncio.get_running_loop().call_later(0.1, release.set)
+        async with project_lock_async(str(tmp_path), timeout=5):
+            pass
+
+    async def test_timeout(self, tmp_path):
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        try:
+            with pytest.raises(LockTimeout):
+                async with project_lock_async(str(tmp_path), timeout=0.1):
+                    pass
+        finally:
+            release.set()
+
+    async def test_sync_wait_on_loop_is_capped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(locks, "LOCK_LOOP_TIMEOUT", 0.1)
+        release = threading.Event()
+        _hold_in_thread(str(tmp_path), release)
+        try:
+            with pytest.raises(LockTimeout), project_lock(str(tmp_path), timeout=30):
+                pass
+        finally:
+            release.set()
+
+
+class TestLockedOperations:
+    def test_decorator_holds_lock(self, tmp_path):
+        @locked
+        def probe(project_dir):
+            release = threading.Event()
+            result = {}
+
+            def other():
+                try:
+                    with project_lock(project_dir, timeout=0.05):
+                        result["acquired"] = True
+                except LockTimeout:
+                    result["acquired"] = False
+                release.set()
+
+            threading.Thread(target=other).start()
+            release.wait(5)
+            return result["acquired"]
+
+        assert probe(str(tmp_path)) is False
+
+    def test_concurrent_archives_keep_every_entry(self, project_with_soul_purpose):
+        """Read-modify-write of the soul purpose file never loses an update."""
+        project = str(project_with_soul_purpose)
+        threads = [
+            threading.Thread(
+                target=archive, args=(project, f"purpose-{i}", f"next-{i}")
+            )
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        sp = project_with_soul_purpose / "session-context" / "CLAUDE-soul-purpose.md"
+        content = sp.read_text()
+        assert content.count("[CLOSED]") == 8
+        for i in range(8):
+            assert f"purpose-{i}" in content
@@ -0,0 +1,84 @@
+"""Import-time profile of the MCP server entry point.
+
+The stdio server is spawned once per session, so importing
+atlas_session.server must stay cheap: heavy per-domain dependencies load
+on first tool use, not at startup.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import atlas_session
+
+# Modules deferred until a tool that needs them runs
+DEFERRED = (
+    "atlas_session.contract.verifier",
+    "atlas_session.contract.atlascoin",
+    "atlas_session.contract.expr",
+    "atlas_session.contract.native",
+    "atlas_session.stripe_client",
+    "atlas_session.license",
+)
+
+# Generous ceiling on atlas_session's own import time (self time, all modules);
+# a regression that pulls a heavy dependency back in blows well past it.
+BUDGET_US = 400_000
+
+
+def _importtime(statement: str) -> tuple[dict[str, int], str]:
+    """Run statement under -X importtime; return {module: self_us}, stderr."""
+    env = dict(os.environ)
+    src = str(Path(atlas_session.__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = int(self_us)
+    return modules, proc.stderr
+
+
+class TestServerImportTime:
+    def test_heavy_modules_deferred(self):
+        """Importing the server does not load verifier, HTTP client or Stripe code."""
+        modules, _ = _importtime("import atlas_session.server")
+        assert "atlas_session.server" in modules
+        loaded = [name for name in DEFERRED if name in modules]
+        assert loaded == []
+
+    def test_own_import_time_within_budget(self):
+        """atlas_session's own modules import within the time budget."""
+        modules, _ = _importtime("import atlas_session.server")
+        own = sum(
+            us for name, us in modules.items() if name.startswith("atlas_session")
+        )
+        assert own < BUDGET_US, f"atlas_session import took {own / 1000:.0f}ms"
+
+    async def test_tools_registered(self):
+        """Deferring imports does not drop any tool."""
+        from fastmcp import Client
+
+        from atlas_session.server import mcp
+
+        async with Client(mcp) as client:
+            names = {tool.name for tool in await client.list_tools()}
+        assert {"session_start", "contract_run_tests", "stripe_health"} <= names
+
+    def test_license_import_is_silent(self):
+        """The HMAC secret is derived (and its warning logged) on first use."""
+        env_free = "import os; os.environ.pop('ATLAS_HMAC_SECRET', None); "
+        _, stderr = _importtime(env_free + "import atlas_session.license")
+        assert "ATLAS_HMAC_SECRET" not in stderr
@@ -0,0 +1,128 @@
+"""Unit tests for atlas_session.session.live — polled in-memory read model.
+
+Covers:
+  TestLiveStateRegistry: enablement, watching, eviction, invalidation
+  TestLiveState: answers from memory, reloads on change
+  TestPoller: background thread picks up external edits
+"""
+
+import time
+
+import pytest
+
+from atlas_session.session import operations
+from atlas_session.session.live import LiveStateRegistry
+
+
+def _age_tree(project, backdate):
+    """Backdate CLAUDE.md and session-context/ so stamps are settled."""
+    paths = [project / "session-context", *(project / "session-context").iterdir()]
+    if (project / "CLAUDE.md").exists():
+        paths.append(project / "CLAUDE.md")
+    backdate(*paths)
+
+
+@pytest.fixture
+def registry():
+    reg = LiveStateRegistry(enabled=True, interval=0.05, max_projects=2)
+    yield reg
+    reg.stop()
+
+
+class TestLiveStateRegistry:
+    def test_disabled_returns_none(self, project_with_session):
+        reg = LiveStateRegistry(enabled=False)
+        assert reg.lookup(str(project_with_session)) is None
+        assert len(reg) == 0
+
+    def test_missing_dir_returns_none(self, registry, tmp_path):
+        assert registry.lookup(str(tmp_path / "nope")) is None
+
+    def test_same_state_for_same_project(self, registry, project_with_session):
+        first = registry.lookup(str(project_with_session))
+        second = registry.lookup(str(project_with_session / "." / ""))
+        assert first is second
+
+    def test_lru_eviction(self, registry, tmp_path):
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            registry.lookup(str(tmp_path / name))
+        assert len(registry) == 2
+
+
+class TestLiveState:
+    def test_matches_operations(self, registry, project_with_soul_purpose):
+        state = registry.lookup(str(project_with_soul_purpose))
+        assert state.read_context() == operations.read_context(
+            str(project_with_soul_purpose)
+        )
+        assert state.features_read() == operations.features_read(
+            str(project_with_soul_purpose)
+        )
+
+    def test_results_are_copies(self, registry, project_with_soul_purpose):
+        state = registry.lookup(str(project_with_soul_purpose))
+        state.read_context()["open_tasks"].clear()
+        assert len(state.read_context()["open_tasks"]) == 2
+
+    def test_answers_from_memory(
+        self, registry, project_with_soul_purpose, monkeypatch, backdate
+    ):
+        _age_tree(project_with_soul_purpose, backdate)
+        state = registry.lookup(str(project_with_soul_purpose))
+        state.read_context()
+
+        def no_disk(project_dir):
+            raise AssertionError("read from disk")
+
+        monkeypatch.setattr(operations, "read_context", no_disk)
+        state.poll()
+        assert state.read_context()["soul_purpose"] == "Build a widget factory"
+
+    def test_invalidate_reloads(self, registry, project_with_soul_purpose):
+        state = registry.lookup(str(project_with_soul_purpose))
+        state.read_context()
+        operations.archive(
+            str(project_with_soul_purpose), "Build a widget factory", "Ship"
+        )
+        registry.invalidate(str(project_with_soul_purpose))
+        assert state.read_context()["soul_purpose"] == "Ship"
+
+    def test_poll_picks_up_external_edit(
+        self, registry, project_with_soul_purpose, backdate
+    ):
+        _age_tree(project_with_soul_purpose, backdate)
+        state = registry.lookup(str(project_with_soul_purpose))
+        state.read_context()
+        sp = project_with_soul_purpose / "session-context" / "CLAUDE-soul-purpose.md"
+        sp.write_text("# Soul Purpose\n\nEdited elsewhere\n")
+        state.poll()
+        assert state.read_context()["soul_purpose"] == "Edited elsewhere"
+
+    def test_governance_sections(self, registry, project_with_session):
+        (project_with_session / "CLAUDE.md").write_text(
+            "# CLAUDE.md\n\n## Ralph Loop\n\n**Mode**: Manual\n"
+        )
+        state = registry.lookup(str(project_with_session))
+        governance = state.governance()
+        assert governance["Ralph Loop"] is True
+        assert governance["Structure Maintenance Rules"] is False
+
+
+class TestPoller:
+    def test_background_refresh(self, registry, project_with_soul_purpose):
+        state = registry.lookup(str(project_with_soul_purpose))
+        state.read_context()
+        ac = project_with_soul_purpose / "session-context" / "CLAUDE-activeContext.md"
+        ac.write_text(ac.read_text() + "- [ ] Added by hand\n")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if "[ ] Added by hand" in state.read_context()["open_tasks"]:
+                break
+            time.sleep(0.05)
+        assert "[ ] Added by hand" in state.read_context()["open_tasks"]
+
+    def test_stop_clears(self, registry, project_with_session):
+        registry.lookup(str(project_with_session))
+        registry.stop()
+        assert len(registry) == 0
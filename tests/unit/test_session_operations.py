@@ -7,12 +7,16 @@ Covers Tasks 2, 3, 4 of the test plan:
 """
 
 import json
+import os
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 
 from atlas_session.session.operations import (
+    _git_probe,
     archive,
     cache_governance,
     capability_inventory,
@@ -21,17 +25,21 @@ from atlas_session.session.operations import (
     ensure_governance,
     features_read,
     git_summary,
+    governance_cache_path,
     harvest,
     hook_activate,
     hook_deactivate,
     init,
     preflight,
     read_context,
+    read_context_many,
+    refresh_claude_md,
     restore_governance,
+    start_composite,
+    start_many,
     validate,
 )
 from atlas_session.common.config import (
-    GOVERNANCE_CACHE_PATH,
     LIFECYCLE_STATE_FILENAME,
     SESSION_FILES,
 )
@@ -461,8 +469,9 @@ class TestCacheGovernance:
         result = cache_governance(str(project_with_claude_md))
         assert result["status"] == "ok"
         assert len(result["cached_sections"]) > 0
-        assert GOVERNANCE_CACHE_PATH.is_file()
-        cached = json.loads(GOVERNANCE_CACHE_PATH.read_text())
+        cache_path = governance_cache_path(str(project_with_claude_md))
+        assert result["cache_file"] == str(cache_path)
+        cached = json.loads(cache_path.read_text())
         # project_with_claude_md has all 4 governance sections
         assert "Structure Maintenance Rules" in cached or len(cached) > 0
 
@@ -511,7 +520,7 @@ class TestRestoreGovernance:
     def test_handles_no_cache(self, project_with_claude_md):
         """Returns error when no governance cache exists."""
         # Ensure no cache file
-        GOVERNANCE_CACHE_PATH.unlink(missing_ok=True)
+        governance_cache_path(str(project_with_claude_md)).unlink(missing_ok=True)
         result = restore_governance(str(project_with_claude_md))
         assert result["status"] == "error"
         assert "No governance cache" in result["message"]
@@ -524,6 +533,85 @@ class TestRestoreGovernance:
         assert result["status"] == "ok"
         assert len(result["already_present"]) > 0
 
+    def test_caches_are_per_project(self, tmp_path):
+        """Caching one project does not overwrite another's sections."""
+        projects = []
+        for name in ("alpha", "beta"):
+            project = tmp_path / name
+            project.mkdir()
+            (project / "CLAUDE.md").write_text(
+                f"# CLAUDE.md\n\n## Ralph Loop\n\n**Mode**: {name}\n"
+            )
+            cache_governance(str(project))
+            projects.append(project)
+
+        for project in projects:
+            (project / "CLAUDE.md").write_text("# CLAUDE.md\n")
+            assert restore_governance(str(project))["restored"] == ["Ralph Loop"]
+            assert f"**Mode**: {project.name}" in (project / "CLAUDE.md").read_text()
+
+    def test_expired_cache_is_ignored(self, project_with_claude_md, monkeypatch):
+        """A cache older than the TTL counts as missing and is removed."""
+        from atlas_session.session import operations
+
+        pd = str(project_with_claude_md)
+        cache_governance(pd)
+        monkeypatch.setattr(operations, "GOVERNANCE_CACHE_TTL", -1)
+
+        result = restore_governance(pd)
+        assert result["status"] == "error"
+        assert not governance_cache_path(pd).exists()
+
+    def test_restores_from_memory_without_spill_file(self, project_with_claude_md):
+        """The in-memory entry is used even if the spill file is gone."""
+        pd = str(project_with_claude_md)
+        cached = cache_governance(pd)
+        assert len(cached["content_hash"]) == 64
+        governance_cache_path(pd).unlink()
+        (project_with_claude_md / "CLAUDE.md").write_text("# CLAUDE.md\n")
+
+        result = restore_governance(pd)
+        assert result["status"] == "ok"
+        assert set(result["restored"]) == set(cached["cached_sections"])
+
+    def test_restores_from_spill_in_another_process(self, project_with_claude_md):
+        """A fresh server process falls back to session-context/."""
+        from atlas_session.session import operations
+
+        pd = str(project_with_claude_md)
+        cache_governance(pd)
+        operations._governance_cache.discard(str(project_with_claude_md.resolve()))
+        (project_with_claude_md / "CLAUDE.md").write_text("# CLAUDE.md\n")
+
+        result = restore_governance(pd)
+        assert "Ralph Loop" in result["restored"]
+        assert not governance_cache_path(pd).exists()
+
+    def test_tampered_spill_file_is_rejected(self, project_with_claude_md):
+        """A spill file whose sections do not match its hash is ignored."""
+        from atlas_session.session import operations
+
+        pd = str(project_with_claude_md)
+        cache_governance(pd)
+        operations._governance_cache.discard(str(project_with_claude_md.resolve()))
+        cache_path = governance_cache_path(pd)
+        data = json.loads(cache_path.read_text())
+        data["sections"]["Ralph Loop"] = "## Ralph Loop\n\n**Mode**: Other\n"
+        cache_path.write_text(json.dumps(data))
+
+        assert restore_governance(pd)["status"] == "error"
+
+    def test_spill_disabled(self, project_with_claude_md, monkeypatch):
+        """With spill off, nothing is written to session-context/."""
+        from atlas_session.session import operations
+
+        monkeypatch.setattr(operations, "GOVERNANCE_SPILL", False)
+        pd = str(project_with_claude_md)
+        result = cache_governance(pd)
+        assert result["cache_file"] is None
+        assert not governance_cache_path(pd).exists()
+        assert restore_governance(pd)["status"] == "ok"
+
 
 class TestEnsureGovernance:
     """Tests for the ensure_governance() function."""
@@ -562,6 +650,72 @@ class TestEnsureGovernance:
         assert (project_dir / "CLAUDE.md").is_file()
 
 
+class TestGovernanceNoOp:
+    """ensure/restore skip parsing an unchanged governance-complete CLAUDE.md."""
+
+    @staticmethod
+    def _no_parse(monkeypatch, *names):
+        from atlas_session.session import operations
+
+        def boom(*args, **kwargs):
+            raise AssertionError("CLAUDE.md was read")
+
+        for name in ("load_markdown", *names):
+            monkeypatch.setattr(operations, name, boom)
+
+    def test_hash_match_skips_parse(self, project_with_claude_md, monkeypatch):
+        """A freshly written file is recognised by its content hash."""
+        pd = str(project_with_claude_md)
+        ensure_governance(pd)
+        self._no_parse(monkeypatch)
+
+        result = ensure_governance(pd)
+        assert result["added"] == []
+        assert len(result["already_present"]) == 4
+
+    def test_stamp_match_skips_read(
+        self, project_with_claude_md, monkeypatch, backdate
+    ):
+        """A settled file whose stat stamp matches is not even read."""
+        pd = str(project_with_claude_md)
+        backdate(project_with_claude_md / "CLAUDE.md")
+        ensure_governance(pd)
+        self._no_parse(monkeypatch, "load_text")
+
+        assert ensure_governance(pd)["added"] == []
+
+    def test_edit_is_detected(self, project_with_claude_md):
+        """Removing a section after the record was made re-adds it."""
+        pd = str(project_with_claude_md)
+        ensure_governance(pd)
+        cmd = project_with_claude_md / "CLAUDE.md"
+        cmd.write_text(cmd.read_text().replace("## Ralph Loop", "## Other"))
+
+        assert ensure_governance(pd)["added"] == ["Ralph Loop"]
+
+    def test_restore_skips_parse(self, project_with_claude_md, monkeypatch):
+        """Restoring onto an unchanged complete CLAUDE.md is a no-op."""
+        pd = str(project_with_claude_md)
+        ensure_governance(pd)
+        cache_governance(pd)
+        self._no_parse(monkeypatch)
+
+        result = restore_governance(pd)
+        assert result["restored"] == []
+        assert len(result["already_present"]) == 4
+        assert not governance_cache_path(pd).exists()
+
+    def test_restore_records_complete_file(self, project_with_claude_md, monkeypatch):
+        """After a restore, the next ensure needs no parse."""
+        pd = str(project_with_claude_md)
+        cache_governance(pd)
+        (project_with_claude_md / "CLAUDE.md").write_text("# CLAUDE.md\n")
+        assert len(restore_governance(pd)["restored"]) == 4
+        self._no_parse(monkeypatch)
+
+        assert ensure_governance(pd)["added"] == []
+
+
 class TestCheckClutter:
     """Tests for the check_clutter() function."""
 
@@ -797,6 +951,80 @@ class TestGitSummary:
         files = [f["file"] for f in result["files_changed"]]
         assert "new_file.txt" in files
 
+    def test_detects_renames(self, project_with_git):
+        """Staged renames are reported as "old -> new"."""
+        (project_with_git / "a.txt").write_text("same content\n" * 20)
+        for cmd in (["add", "."], ["commit", "-m", "add a"], ["mv", "a.txt", "b.txt"]):
+            subprocess.run(
+                ["git", *cmd], cwd=project_with_git, capture_output=True, check=True
+            )
+        result = git_summary(str(project_with_git))
+        assert {"status": "R", "file": "a.txt -> b.txt"} in result["files_changed"]
+
+    def test_unborn_branch(self, project_dir):
+        """A repo with no commits reports its branch but no commits."""
+        subprocess.run(
+            ["git", "init"], cwd=project_dir, capture_output=True, check=True
+        )
+        result = git_summary(str(project_dir))
+        assert result["is_git"] is True
+        assert result["branch"] != ""
+        assert result["commits"] == []
+
+    def test_detached_head(self, project_with_git):
+        """Detached HEAD reports branch 'HEAD'."""
+        subprocess.run(
+            ["git", "checkout", "--detach"],
+            cwd=project_with_git,
+            capture_output=True,
+            check=True,
+        )
+        result = git_summary(str(project_with_git))
+        assert result["branch"] == "HEAD"
+        assert result["commits"][0]["message"] == "initial"
+
+    def test_uses_at_most_two_subprocesses(self, project_with_git, monkeypatch):
+        """Status and log come from one git call each."""
+        calls = []
+        real_run = subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", counting_run)
+        git_summary(str(project_with_git))
+        assert len(calls) <= 2
+
+    def test_shared_probe_skips_status(self, project_with_git, monkeypatch):
+        """A pre-computed probe is reused instead of re-running git status."""
+        probe = _git_probe(str(project_with_git))
+        calls = []
+        real_run = subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", counting_run)
+        result = git_summary(str(project_with_git), probe=probe)
+        assert preflight(str(project_with_git), probe=probe)["is_git"] is True
+        assert result["branch"] == probe.branch
+        assert all(cmd[:2] != ["git", "status"] for cmd in calls)
+
+    def test_preflight_without_probe_skips_status(self, project_with_git, monkeypatch):
+        """Repo membership alone is a rev-parse, not a full status scan."""
+        calls = []
+        real_run = subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(subprocess, "run", counting_run)
+        assert preflight(str(project_with_git))["is_git"] is True
+        assert all(cmd[:2] != ["git", "status"] for cmd in calls)
+
 
 # =========================================================================
 # Edge Cases — coverage gap tests
@@ -1242,3 +1470,348 @@ class TestCapabilityInventory:
         assert result3["cache_hit"] is False
         assert result3["needs_generation"] is True
         assert result3["git_changed"] is False  # git didn't change, just forced refresh
+
+
+class TestReadContextCaching:
+    """read_context served from the shared document cache."""
+
+    def test_returned_lists_are_independent(self, project_with_soul_purpose, backdate):
+        """Mutating a result never leaks into the cached parse."""
+        backdate(*(project_with_soul_purpose / "session-context").iterdir())
+        first = read_context(str(project_with_soul_purpose))
+        first["open_tasks"].clear()
+        second = read_context(str(project_with_soul_purpose))
+        assert len(second["open_tasks"]) == 2
+
+    def test_edit_after_cache_is_visible(self, project_with_soul_purpose, backdate):
+        """Editing activeContext after a cached read is picked up."""
+        backdate(*(project_with_soul_purpose / "session-context").iterdir())
+        read_context(str(project_with_soul_purpose))
+        ac = project_with_soul_purpose / "session-context" / "CLAUDE-activeContext.md"
+        ac.write_text(ac.read_text() + "- [ ] Ship it\n")
+        result = read_context(str(project_with_soul_purpose))
+        assert "[ ] Ship it" in result["open_tasks"]
+
+
+class TestTaskIndex:
+    """Paged task lists and the in-memory activeContext task index."""
+
+    @staticmethod
+    def _write_tasks(project, count):
+        ac = project / "session-context" / "CLAUDE-activeContext.md"
+        lines = ["# Active Context\n"]
+        lines += [f"- [{'x' if i % 2 else ' '}] Task {i}\n" for i in range(count)]
+        ac.write_text("".join(lines))
+        return ac
+
+    @staticmethod
+    def _count_scans(monkeypatch):
+        from atlas_session.session import operations
+
+        scanned: list[tuple[int, int]] = []
+        real = operations._scan_tasks
+
+        def counting(data, start, end):
+            scanned.append((start, end))
+            return real(data, start, end)
+
+        monkeypatch.setattr(operations, "_scan_tasks", counting)
+        return scanned
+
+    def test_pagination(self, project_with_session):
+        """task_limit/task_offset page both lists; counts are totals."""
+        self._write_tasks(project_with_session, 20)
+        result = read_context(str(project_with_session), task_limit=3, task_offset=2)
+        assert result["open_tasks"] == ["[ ] Task 4", "[ ] Task 6", "[ ] Task 8"]
+        assert result["recent_progress"] == ["[x] Task 5", "[x] Task 7", "[x] Task 9"]
+        assert result["open_task_count"] == 10
+        assert result["recent_progress_count"] == 10
+
+    def test_index_is_not_written_to_disk(self, project_with_session):
+        """Indexing leaves session-context/ untouched."""
+        self._write_tasks(project_with_session, 5)
+        before = sorted(os.listdir(project_with_session / "session-context"))
+        assert read_context(str(project_with_session))["open_task_count"] == 3
+        assert sorted(os.listdir(project_with_session / "session-context")) == before
+
+    def test_appended_lines_only_are_scanned(self, project_with_session, monkeypatch):
+        """After an append, only the new bytes are parsed."""
+        ac = self._write_tasks(project_with_session, 10)
+        read_context(str(project_with_session))
+        indexed = ac.stat().st_size
+
+        with open(ac, "a") as f:
+            f.write("- [ ] Appended\n")
+        scanned = self._count_scans(monkeypatch)
+        result = read_context(str(project_with_session))
+        assert result["open_tasks"][-1] == "[ ] Appended"
+        assert result["open_task_count"] == 6
+        assert min(start for start, _ in scanned) == indexed
+
+    def test_rewrite_rebuilds_index(self, project_with_session):
+        """Changing earlier lines invalidates the indexed prefix."""
+        ac = self._write_tasks(project_with_session, 10)
+        read_context(str(project_with_session))
+        ac.write_text(ac.read_text().replace("- [ ] Task 0", "- [x] Task 0"))
+        result = read_context(str(project_with_session))
+        assert result["open_task_count"] == 4
+        assert result["recent_progress"][0] == "[x] Task 0"
+
+    def test_unchanged_file_is_not_read(
+        self, project_with_session, monkeypatch, backdate
+    ):
+        """A settled file with a matching stat stamp is served from the index."""
+        ac = self._write_tasks(project_with_session, 10)
+        backdate(ac)
+        first = read_context(str(project_with_session))
+        scanned = self._count_scans(monkeypatch)
+        assert read_context(str(project_with_session)) == first
+        assert scanned == []
+
+    def test_partial_last_line_is_rescanned(self, project_with_session):
+        """A line still being written is reported but kept out of the index."""
+        ac = self._write_tasks(project_with_session, 2)
+        with open(ac, "a") as f:
+            f.write("- [ ] Half")
+        assert read_context(str(project_with_session))["open_tasks"][-1] == "[ ] Half"
+        with open(ac, "a") as f:
+            f.write(" done\n")
+        result = read_context(str(project_with_session))
+        assert result["open_tasks"][-1] == "[ ] Half done"
+        assert result["open_task_count"] == 2
+
+
+class TestProjectSignalsCache:
+    """Project signals persisted in session-context/ with marker stamps."""
+
+    @staticmethod
+    def _settled_project(project, backdate):
+        (project / "README.md").write_text("# Widget\n\nMakes widgets.\n")
+        (project / "pyproject.toml").write_text("[project]\n")
+        backdate(project / "README.md", project / "pyproject.toml", project)
+        return project
+
+    def test_signals_persisted_and_reused(
+        self, project_with_session, monkeypatch, backdate
+    ):
+        """A second preflight reuses the stored signals without rescanning."""
+        from atlas_session.session import operations
+
+        project = self._settled_project(project_with_session, backdate)
+        first = preflight(str(project))["project_signals"]
+        cache = project / "session-context" / ".project-signals.json"
+        assert json.loads(cache.read_text())["signals"]["has_pyproject"] is True
+
+        def no_scan(snapshot):
+            raise AssertionError("signals were rescanned")
+
+        monkeypatch.setattr(operations, "_scan_project_signals", no_scan)
+        assert preflight(str(project))["project_signals"] == first
+
+    def test_marker_change_invalidates(self, project_with_session, backdate):
+        """Adding a marker file changes the root stamp and forces a rescan."""
+        project = self._settled_project(project_with_session, backdate)
+        preflight(str(project))
+        (project / "package.json").write_text('{"name": "widgets"}')
+        signals = preflight(str(project))["project_signals"]
+        assert signals["package_name"] == "widgets"
+        assert "node" in signals["detected_stack"]
+
+    def test_recent_markers_not_persisted(self, project_with_session):
+        """Markers inside the racy window are never written to the cache."""
+        (project_with_session / "README.md").write_text("# Fresh\n")
+        preflight(str(project_with_session))
+        cache = project_with_session / "session-context" / ".project-signals.json"
+        assert not cache.exists()
+
+    def test_no_session_dir_no_cache(self, project_dir, backdate):
+        """Without session-context/ nothing is created."""
+        self._settled_project(project_dir, backdate)
+        preflight(str(project_dir))
+        assert not (project_dir / "session-context").exists()
+
+
+class TestStartComposite:
+    """Tests for start_composite() stage scheduling."""
+
+    def test_returns_all_stages(self, project_with_git):
+        """Every stage key is populated for a git project with session files."""
+        result = start_composite(str(project_with_git), "build a widget")
+        assert result["preflight"]["mode"] == "reconcile"
+        assert result["preflight"]["is_git"] is True
+        assert result["validate"]["status"] == "ok"
+        assert "soul_purpose" in result["read_context"]
+        assert result["git_summary"]["commits"][0]["message"] == "initial"
+        assert result["classify_brainstorm"]["weight"]
+        assert result["clutter"] is None
+
+    def test_preflight_sees_files_before_repair(self, project_with_session):
+        """preflight reports the pre-repair state even though validate repairs."""
+        sp_file = project_with_session / "session-context" / "CLAUDE-soul-purpose.md"
+        sp_file.unlink()
+        result = start_composite(str(project_with_session))
+        assert result["preflight"]["session_files"]["CLAUDE-soul-purpose.md"] == {
+            "exists": False,
+            "has_content": False,
+        }
+        assert "CLAUDE-soul-purpose.md" in result["validate"]["repaired"]
+        assert sp_file.is_file()
+
+    def test_clutter_uses_shared_listing(self, project_dir):
+        """Clutter runs when the root holds more than 15 files."""
+        for i in range(20):
+            (project_dir / f"notes-{i}.txt").write_text("x")
+        result = start_composite(str(project_dir))
+        assert result["preflight"]["root_file_count"] == 20
+        assert result["clutter"]["root_file_count"] == 20
+
+    def test_stage_failure_is_isolated(self, project_with_session, monkeypatch):
+        """A failing stage reports an error without blocking the others."""
+        from atlas_session.session import operations
+
+        def boom(project_dir, *args):
+            raise RuntimeError("read failed")
+
+        monkeypatch.setattr(operations, "read_context", boom)
+        result = start_composite(str(project_with_session))
+        assert result["read_context"] == {"status": "error", "error": "read failed"}
+        assert result["validate"]["status"] == "ok"
+        assert result["git_summary"]["is_git"] is False
+
+    def test_root_listed_once(self, project_with_git, monkeypatch):
+        """preflight, signals and clutter share one scandir of the root."""
+        for i in range(20):
+            (project_with_git / f"notes-{i}.txt").write_text("x")
+        calls = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            calls.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        result = start_composite(str(project_with_git))
+        assert result["clutter"]["root_file_count"] == 21
+        assert calls.count(str(project_with_git)) == 1
+
+
+class TestRefreshClaudeMd:
+    """Tests for refresh_claude_md()."""
+
+    def test_preserves_governance_sections(self, project_dir):
+        """Existing governance section bodies are carried into the new file."""
+        (project_dir / "CLAUDE.md").write_text(
+            "# CLAUDE.md\n\n## Old Overview\n\nstale\n\n"
+            "## Session Context Files\n\nKeep me.\n"
+        )
+        (project_dir / "pyproject.toml").write_text("[project]\n")
+        (project_dir / "src").mkdir()
+        result = refresh_claude_md(str(project_dir))
+        assert result["status"] == "ok"
+        assert result["governance_sections_preserved"] == ["Session Context Files"]
+        content = (project_dir / "CLAUDE.md").read_text()
+        assert "Keep me." in content
+        assert "stale" not in content
+        assert "- `src/` - [Description]" in content
+        assert result["project_detected"]["stack"] == ["python"]
+
+
+class TestBatchOperations:
+    """Tests for start_many() and read_context_many()."""
+
+    def test_results_in_input_order(self, tmp_path):
+        """Each project gets one entry, in the order given."""
+        dirs = []
+        for i in range(5):
+            (tmp_path / f"p{i}").mkdir()
+            dirs.append(str(tmp_path / f"p{i}"))
+        result = start_many(dirs, max_workers=3)
+        assert result["count"] == 5
+        assert result["errors"] == 0
+        assert [e["project_dir"] for e in result["results"]] == dirs
+        assert result["results"][0]["result"]["preflight"]["mode"] == "init"
+
+    def test_read_context_many(self, project_with_soul_purpose):
+        """read_context results are returned per project."""
+        result = read_context_many([str(project_with_soul_purpose)])
+        context = result["results"][0]["result"]
+        assert context["soul_purpose"] == "Build a widget factory"
+
+    def test_task_lists_paged(self, project_with_soul_purpose):
+        """task_limit pages every project's task lists; counts stay totals."""
+        project = str(project_with_soul_purpose)
+        for result in (
+            read_context_many([project], task_limit=1)["results"][0]["result"],
+            start_many([project], task_limit=1)["results"][0]["result"]["read_context"],
+        ):
+            assert len(result["open_tasks"]) == 1
+            assert result["open_task_count"] == 2
+
+    def test_failures_isolated(self, project_with_session, monkeypatch):
+        """A project whose operation raises is reported without aborting."""
+        from atlas_session.session import operations
+
+        real = operations.read_context
+        bad = str(project_with_session / "bad")
+
+        def flaky(project_dir, *args):
+            if project_dir == bad:
+                raise RuntimeError("boom")
+            return real(project_dir, *args)
+
+        monkeypatch.setattr(operations, "read_context", flaky)
+        result = read_context_many([bad, str(project_with_session)])
+        assert result["errors"] == 1
+        assert result["results"][0]["result"] == {"status": "error", "error": "boom"}
+        assert "soul_purpose" in result["results"][1]["result"]
+
+    def test_progress_callback(self, tmp_path):
+        """on_result fires once per project with a running count."""
+        seen = []
+        dirs = [str(tmp_path)] * 3
+        read_context_many(
+            dirs, on_result=lambda done, total, entry: seen.append((done, total))
+        )
+        assert sorted(seen) == [(1, 3), (2, 3), (3, 3)]
+
+    def test_empty_batch(self):
+        """An empty list returns an empty result set."""
+        assert start_many([]) == {
+            "status": "ok",
+            "count": 0,
+            "errors": 0,
+            "results": [],
+        }
+
+
+class TestAtomicSessionWrites:
+    """Multi-file operations commit their writes together."""
+
+    def test_archive_failure_leaves_files_untouched(
+        self, project_with_soul_purpose, monkeypatch
+    ):
+        """If resetting active context fails, the soul purpose is not replaced."""
+        from atlas_session.session import operations
+
+        sp = project_with_soul_purpose / "session-context" / "CLAUDE-soul-purpose.md"
+        before = sp.read_text()
+
+        def failing_copy(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(operations, "atomic_copy", failing_copy)
+        with pytest.raises(OSError):
+            archive(str(project_with_soul_purpose), "Build a widget factory", "Next")
+        assert sp.read_text() == before
+        leftovers = [
+            p.name
+            for p in (project_with_soul_purpose / "session-context").iterdir()
+            if p.name.endswith(".tmp")
+        ]
+        assert leftovers == []
+
+    def test_init_leaves_no_temp_files(self, project_dir):
+        """init's batched writes leave only the session files behind."""
+        init(str(project_dir), "Purpose")
+        names = {p.name for p in (project_dir / "session-context").iterdir()}
+        assert names == set(SESSION_FILES)